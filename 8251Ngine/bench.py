@@ -0,0 +1,342 @@
+"""
+성능 벤치마크 모음 (화면 없이 실행, 고정 시드, game/data/map.json 사용)
+FOV / 길찾기(JPS) / Renderer.flush / 조명 / 네트워크 메시지 인코딩의 핫패스를 측정해 JSON으로 저장하고,
+저장된 기준값(bench_baseline.json)과 비교하여 허용치 이상 느려진 항목이 있으면 종료 코드 1을 반환합니다.
+측정 전에 동작 확인(CHECKS)을 먼저 실행하며, 하나라도 실패하면 측정 없이 종료 코드 1을 반환합니다.
+기준값은 측정한 머신에 종속되므로, 머신을 바꾸면 --save-baseline으로 다시 만드세요.
+
+사용법: python bench.py [--filter 이름] [--out 결과.json] [--baseline 파일] [--tolerance 0.25] [--save-baseline]
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import pygame
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_baseline.json")
+SEED = 8251
+SAMPLES = 7
+SAMPLE_TIME = 0.05 # 샘플 하나의 목표 시간(초) - 호출 횟수는 자동 보정
+
+BENCHES = [] # [(이름, 준비 함수)] - 준비 함수는 측정할 무인자 함수를 반환
+CHECKS = [] # [(이름, 확인 함수)] - 최적화가 동작을 바꾸지 않았는지 확인 (실패 시 AssertionError)
+
+def bench(name):
+    def register(setup):
+        BENCHES.append((name, setup))
+        return setup
+    return register
+
+def check(name):
+    def register(fn):
+        CHECKS.append((name, fn))
+        return fn
+    return register
+
+def measure(fn):
+    """호출 1회당 시간(us)의 중앙값/최솟값"""
+    fn() # 워밍업 (캐시/지연 초기화)
+    number = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(number): fn()
+        elapsed = time.perf_counter() - t0
+        if elapsed >= SAMPLE_TIME or number >= 1 << 20: break
+        number *= 2 if elapsed <= 0 else max(2, min(10, int(SAMPLE_TIME / elapsed) + 1))
+
+    samples = []
+    for _ in range(SAMPLES):
+        t0 = time.perf_counter()
+        for _ in range(number): fn()
+        samples.append((time.perf_counter() - t0) / number * 1e6)
+    samples.sort()
+    return {'median_us': round(samples[len(samples) // 2], 3), 'min_us': round(samples[0], 3), 'iterations': number}
+
+# --- 공용 월드 (맵 하나를 모든 벤치가 공유) ---
+_WORLD = None
+
+def world():
+    """{'app', 'root', 'collision', 'loader', 'center'} - App 서비스 + 맵을 올린 루트 노드"""
+    global _WORLD
+    if _WORLD is None:
+        from engine.core import clock
+        from engine.core.app import App
+        from engine.core.node import Node
+        from engine.core.static_world import StaticWorld
+        from engine.core.math_utils import IsoMath
+        from engine.assets.tile_engine import TileEngine
+        from engine.physics.collision import CollisionWorld
+        from engine.graphics.lighting import LightSource
+        from game.utils.map_loader import MapLoader
+        clock.install(clock.FixedClock(1 / 60))
+        random.seed(SEED)
+
+        data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "game", "data")
+        tiles_path = os.path.join(data_dir, "tiles.json")
+        # 디스플레이가 있어야 캐시에서 읽은 아틀라스가 convert_alpha 되므로 App을 먼저 생성 (PlayScene과 같은 순서)
+        app = App(title="8251Ngine (bench)", use_network=False)
+        with open(tiles_path, 'r', encoding='utf-8') as f: TileEngine.init(json.load(f))
+        root = Node("BenchWorld")
+        static_world = StaticWorld("StaticWorld") # PlayScene과 같은 구성
+        root.add_child(static_world)
+        collision = CollisionWorld()
+        loader = MapLoader(os.path.join(data_dir, "map.json"), tiles_path)
+        loader.build_world(static_world, collision)
+
+        center = (loader.width / 2, loader.height / 2)
+        rng = random.Random(SEED)
+        for i in range(8):
+            light = LightSource(f"BenchLight_{i}", radius=200, color=(255, 200, 120), intensity=0.8)
+            light.position.x = center[0] + rng.uniform(-10, 10)
+            light.position.y = center[1] + rng.uniform(-10, 10)
+            root.add_child(light)
+            app.services["lighting"].add_light(light)
+
+        camera = app.services["renderer"].camera
+        camera.follow(*IsoMath.cart_to_iso(center[0], center[1], 0), immediate=True)
+        _WORLD = {'app': app, 'root': root, 'collision': collision, 'loader': loader, 'center': center}
+    return _WORLD
+
+def walkable_pairs(count):
+    """시드 고정 (출발, 도착) 빈 칸 쌍"""
+    w = world()
+    loader, collision = w['loader'], w['collision']
+    rng = random.Random(SEED)
+    cells = [(x, y) for y in range(loader.height) for x in range(loader.width) if not collision.is_cell_blocked(x, y)]
+    return [(rng.choice(cells), rng.choice(cells)) for _ in range(count)]
+
+# --- FOV ---
+@bench("fov.calculate_fov")
+def _():
+    from pygame.math import Vector3
+    from engine.physics.fov import FOVSystem
+    w = world()
+    fov = FOVSystem(w['collision'])
+    origin = Vector3(w['center'][0], w['center'][1], 0)
+    return lambda: fov.calculate_fov(origin)
+
+@bench("fov.calculate_fov_cone")
+def _():
+    from pygame.math import Vector3
+    from engine.physics.fov import FOVSystem
+    w = world()
+    fov = FOVSystem(w['collision'])
+    origin = Vector3(w['center'][0], w['center'][1], 0)
+    return lambda: fov.calculate_fov(origin, (1, 0))
+
+# --- 길찾기 ---
+@bench("nav.get_path_x16")
+def _():
+    from pygame.math import Vector2
+    from engine.physics.navigation import NavigationManager
+    nav = NavigationManager(world()['collision'], requests_per_frame=16)
+    pairs = [(Vector2(*s), Vector2(*g)) for s, g in walkable_pairs(16)]
+    def run():
+        nav._cache.clear() # 캐시 적중이 아닌 탐색 자체를 측정
+        nav.begin_frame()
+        for start, goal in pairs: nav.get_path(start, goal)
+    return run
+
+# --- 렌더링 ---
+def _submit_all(renderer, root):
+    from engine.core.static_world import StaticWorld
+    renderer.clear_queue()
+    def collect(node):
+        if not node.visible: return
+        if isinstance(node, StaticWorld):
+            renderer.submit_static_world(node)
+            return
+        renderer.submit(node)
+        for child in node.children: collect(child)
+    collect(root)
+
+@bench("render.flush")
+def _():
+    w = world()
+    services = w['app'].services
+    renderer = services["renderer"]
+    def run():
+        _submit_all(renderer, w['root'])
+        renderer.flush(services)
+    return run
+
+@bench("lighting.render_night")
+def _():
+    from pygame.math import Vector3
+    from engine.physics.fov import FOVSystem
+    w = world()
+    app = w['app']
+    lighting = app.services["lighting"]
+    lighting.ambient_color = (10, 10, 25)
+    fov_polygon = FOVSystem(w['collision']).calculate_fov(Vector3(w['center'][0], w['center'][1], 0))
+    camera = app.services["renderer"].camera
+    return lambda: lighting.render(app.screen, camera, fov_polygon)
+
+@bench("lighting.render_night_moving")
+def _():
+    from pygame.math import Vector3
+    from engine.physics.fov import FOVSystem
+    w = world()
+    app = w['app']
+    lighting = app.services["lighting"]
+    lighting.ambient_color = (10, 10, 25)
+    fov_polygon = FOVSystem(w['collision']).calculate_fov(Vector3(w['center'][0], w['center'][1], 0))
+    camera = app.services["renderer"].camera
+    step = [1]
+    def run():
+        # 매 호출 카메라를 1px씩 흔들어 합성 생략 없이 측정
+        step[0] = -step[0]
+        camera.position.x += step[0]
+        lighting.render(app.screen, camera, fov_polygon)
+    return run
+
+# --- 네트워크 메시지 ---
+def _player_list_message(count=16):
+    roles = ('CITIZEN', 'MAFIA', 'POLICE', 'DOCTOR')
+    return {"type": "PLAYER_LIST", "participants": [
+        {'id': i, 'name': f"Player {i}", 'role': roles[i % 4], 'type': 'BOT' if i else 'PLAYER', 'group': 'PLAYER'} for i in range(count)]}
+
+def _snapshot_states(count=32):
+    rng = random.Random(SEED)
+    base = {i: (rng.uniform(0, 100), rng.uniform(0, 100), 0, 1, False) for i in range(count)}
+    current = {i: (x + (1.5 if i % 2 else 0), y, 1, 0, bool(i % 2)) for i, (x, y, _, _, _) in base.items()}
+    return base, current
+
+@bench("net.move_encode")
+def _():
+    from engine.net.snapshot import encode_move
+    return lambda: encode_move(3, 12.5, 40.25, True, 1, 0)
+
+@bench("net.move_decode")
+def _():
+    from engine.net.snapshot import encode_move, decode_move
+    data = encode_move(3, 12.5, 40.25, True, 1, 0)
+    return lambda: decode_move(data)
+
+@bench("net.snapshot_encode_x32")
+def _():
+    from engine.net.snapshot import encode_snapshot
+    base, current = _snapshot_states()
+    return lambda: encode_snapshot(2, 1, base, current)
+
+@bench("net.snapshot_decode_x32")
+def _():
+    from engine.net.snapshot import encode_snapshot, decode_snapshot
+    base, current = _snapshot_states()
+    data = encode_snapshot(2, 1, base, current)
+    return lambda: decode_snapshot(data, base)
+
+@bench("net.player_list_encode")
+def _():
+    msg = _player_list_message()
+    return lambda: json.dumps(msg)
+
+@bench("net.player_list_decode")
+def _():
+    data = json.dumps(_player_list_message())
+    return lambda: json.loads(data)
+
+# --- 동작 확인 ---
+@check("net.aoi_host_sees_bot_area")
+def _():
+    # 호스트(봇 AI 실행) 아바타와는 멀고 봇과는 가까운 사람은 호스트의 근거리 view에 실시간으로 들어가야 함
+    from server import GameServer
+    from settings import AOI_RADIUS
+    server = GameServer()
+    for pid in range(4): server.players[pid] = {'id': pid, 'group': 'PLAYER'}
+    far = AOI_RADIUS * 4
+    server._apply_move(0, 0, (0.0, 0.0, 0, 1, False))
+    server._apply_move(0, 3, (far, far, 0, 1, False)) # 호스트가 보낸 봇 상태
+    server._apply_move(1, 1, (far + 1, far, 0, 1, False))
+    server._apply_move(2, 2, (0.0, far * 2, 0, 1, False))
+    view = server._client_view(0, {}, False, set())
+    assert 1 in view, "host view misses a player next to its bot"
+    assert 2 not in view, "host view includes a player far from the host and its bots"
+    assert 3 not in view, "host view includes its own bot"
+
+def run_checks(name_filter=None):
+    failed = []
+    for name, fn in CHECKS:
+        if name_filter and name_filter not in name: continue
+        try:
+            fn()
+            print(f"  {name:<28}ok")
+        except AssertionError as e:
+            print(f"  {name:<28}FAILED: {e}")
+            failed.append(name)
+    return failed
+
+# --- 실행 / 비교 ---
+def run_benches(name_filter=None):
+    results = {}
+    for name, setup in BENCHES:
+        if name_filter and name_filter not in name: continue
+        random.seed(SEED)
+        results[name] = measure(setup())
+        r = results[name]
+        print(f"  {name:<28}{r['median_us']:12.2f} us  (min {r['min_us']:.2f}, x{r['iterations']})")
+    return results
+
+def compare(results, baseline, tolerance):
+    """기준값보다 (1 + tolerance)배 넘게 느려진 항목 목록 (잡음이 적은 최솟값끼리 비교)"""
+    regressions = []
+    for name, r in results.items():
+        base = baseline.get(name)
+        if not base: continue
+        ratio = r['min_us'] / base['min_us'] if base['min_us'] else 1.0
+        mark = "REGRESSION" if ratio > 1 + tolerance else "faster" if ratio < 1 - tolerance else "ok"
+        print(f"  {name:<28}{ratio:8.2f}x  {mark}")
+        if ratio > 1 + tolerance: regressions.append(name)
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="8251Ngine benchmarks")
+    parser.add_argument("--filter", default=None)
+    parser.add_argument("--out", default=None, help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args()
+
+    print("checks:")
+    failed = run_checks(args.filter)
+    if failed:
+        print(f"{len(failed)} check(s) failed: {', '.join(failed)}")
+        return 1
+
+    print(f"8251Ngine benchmarks (seed {SEED})")
+    report = {
+        'engine': '8251Ngine',
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'machine': platform.machine(),
+        'results': run_benches(args.filter),
+    }
+
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f: json.dump(report, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f: json.dump(report, f, indent=2)
+        print(f"Baseline saved: {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print("No baseline to compare (use --save-baseline)")
+        return 0
+
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f).get('results', {})
+    print(f"vs baseline (tolerance {args.tolerance:.0%}):")
+    regressions = compare(report['results'], baseline, args.tolerance)
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
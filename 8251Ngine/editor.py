@@ -5,8 +5,11 @@ import traceback
 # 프로젝트 루트 경로를 시스템 경로에 추가 (모듈 import 오류 방지)
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from engine.core import startup_profiler
+# --profile-startup: 무거운 import보다 먼저 켜야 import 시간이 잡힘
+if startup_profiler.requested(): startup_profiler.enable()
+
 from engine.core.app import App
-from game.scenes.editor_scene import EditorScene
 
 def print_controls():
     """에디터 조작법을 콘솔에 출력합니다."""
@@ -49,8 +52,9 @@ def main():
         use_network=False
     )
     
-    # 3. 에디터 씬 로드
+    # 3. 에디터 씬 로드 (창을 먼저 띄운 뒤 에디터 모듈을 import)
     try:
+        from game.scenes.editor_scene import EditorScene
         editor_scene = EditorScene()
         app.set_scene(editor_scene)
         print("[System] 에디터 씬이 성공적으로 로드되었습니다.")
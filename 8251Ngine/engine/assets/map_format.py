@@ -0,0 +1,239 @@
+"""
+바이너리 맵 포맷 (.pxmap)
+
+    [헤더] magic 'PXMB', version, flags, width, height, chunk_size, layer_count
+    [레이어 x N] 이름(16바이트), 종류, 청크 테이블 (offset, length, codec) x 청크 수
+    [청크 데이터] 레이어/청크 순서대로, 원본 또는 zlib 압축
+
+청크 하나는 chunk_size x chunk_size 칸(맵 가장자리는 잘림)을 행 우선으로 담습니다.
+- KIND_TILES: int32 타일 ID 배열 + uint8 회전(90도 단위) 배열
+- KIND_GRID: int32 값 배열 (구역 등)
+모든 정수는 little-endian 입니다.
+"""
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+
+MAGIC = b'PXMB'
+VERSION = 1
+
+HEADER = struct.Struct('<4sHHIIHB')  # magic, version, flags, width, height, chunk_size, layer_count
+LAYER_HEADER = struct.Struct('<16sB') # name, kind
+CHUNK_ENTRY = struct.Struct('<IIB')   # offset, length, codec
+
+KIND_TILES = 0
+KIND_GRID = 1
+
+CODEC_RAW = 0
+CODEC_ZLIB = 1
+
+DEFAULT_CHUNK_SIZE = 16
+TILE_LAYERS = ('floor', 'wall', 'object')
+
+def binary_path(json_path):
+    """map.json -> map.pxmap"""
+    return os.path.splitext(json_path)[0] + '.pxmap'
+
+def find_binary(json_path):
+    """JSON보다 오래되지 않은 .pxmap이 있으면 그 경로, 없으면 None (에디터로 JSON을 고친 뒤에는 JSON 사용)"""
+    path = binary_path(json_path)
+    if not os.path.exists(path): return None
+    if os.path.exists(json_path) and os.path.getmtime(path) < os.path.getmtime(json_path): return None
+    return path
+
+def _to_le_bytes(values):
+    if sys.byteorder == 'big':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+def layers_from_json(data):
+    """
+    JSON 맵 딕셔너리를 write_map용 레이어 목록으로 변환합니다.
+    반환: (width, height, [(name, kind, ids, rots), ...])
+    """
+    width, height = data.get('width', 50), data.get('height', 50)
+    layers = []
+    for name in TILE_LAYERS:
+        grid = data.get('layers', {}).get(name)
+        if grid is None: continue
+        ids = array('i', [0]) * (width * height)
+        rots = bytearray(width * height)
+        for y in range(min(len(grid), height)):
+            row = grid[y]
+            for x in range(min(len(row), width)):
+                val = row[x]
+                idx = y * width + x
+                if isinstance(val, int):
+                    ids[idx] = val
+                else:
+                    ids[idx] = val[0]
+                    rots[idx] = (int(val[1]) // 90) & 3
+        layers.append((name, KIND_TILES, ids, rots))
+
+    for name in ('zones', 'zone_map'):
+        grid = data.get(name)
+        if grid is None: continue
+        ids = array('i', [0]) * (width * height)
+        for y in range(min(len(grid), height)):
+            for x in range(min(len(grid[y]), width)):
+                ids[y * width + x] = grid[y][x]
+        layers.append((name, KIND_GRID, ids, None))
+    return width, height, layers
+
+def write_map(path, width, height, layers, chunk_size=DEFAULT_CHUNK_SIZE, compress=True):
+    """
+    layers: [(name, kind, ids, rots)] - ids는 width*height 길이의 array('i'), rots는 KIND_TILES일 때 bytearray
+    임시 파일에 쓴 뒤 교체하므로 쓰는 도중 실패해도 기존 파일은 남습니다.
+    """
+    cols = -(-width // chunk_size)
+    rows = -(-height // chunk_size)
+    num_chunks = cols * rows
+    offset = HEADER.size + len(layers) * (LAYER_HEADER.size + num_chunks * CHUNK_ENTRY.size)
+
+    tables, payloads = [], []
+    for name, kind, ids, rots in layers:
+        table = []
+        for cy in range(rows):
+            for cx in range(cols):
+                x0, y0 = cx * chunk_size, cy * chunk_size
+                cw, ch = min(chunk_size, width - x0), min(chunk_size, height - y0)
+                chunk_ids = array('i')
+                chunk_rots = bytearray()
+                for y in range(y0, y0 + ch):
+                    start = y * width + x0
+                    chunk_ids.extend(ids[start:start + cw])
+                    if kind == KIND_TILES: chunk_rots += rots[start:start + cw]
+
+                raw = _to_le_bytes(chunk_ids) + bytes(chunk_rots)
+                codec = CODEC_RAW
+                if compress:
+                    packed = zlib.compress(raw, 6)
+                    if len(packed) < len(raw): raw, codec = packed, CODEC_ZLIB
+                table.append((offset, len(raw), codec))
+                payloads.append(raw)
+                offset += len(raw)
+        tables.append(table)
+
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, width, height, chunk_size, len(layers)))
+        for (name, kind, _, _), table in zip(layers, tables):
+            f.write(LAYER_HEADER.pack(name.encode('ascii'), kind))
+            for entry in table: f.write(CHUNK_ENTRY.pack(*entry))
+        for raw in payloads: f.write(raw)
+    os.replace(tmp_path, path)
+
+class MapFile:
+    """
+    mmap으로 연 바이너리 맵.
+    청크는 처음 요청될 때만 디코딩하고 보관하므로, 일부 영역만 조회하면 나머지는 읽지 않습니다.
+    """
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            self._file.close(); raise
+
+        magic, version, _, self.width, self.height, self.chunk_size, layer_count = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self.close(); raise ValueError(f"Not a PXMB map: {path}")
+        if version > VERSION:
+            self.close(); raise ValueError(f"Unsupported map version {version}: {path}")
+
+        self.cols = -(-self.width // self.chunk_size)
+        self.rows = -(-self.height // self.chunk_size)
+        num_chunks = self.cols * self.rows
+
+        self.layers = {} # {name: (kind, [(offset, length, codec), ...])}
+        pos = HEADER.size
+        for _ in range(layer_count):
+            raw_name, kind = LAYER_HEADER.unpack_from(self._mm, pos)
+            pos += LAYER_HEADER.size
+            table = [CHUNK_ENTRY.unpack_from(self._mm, pos + i * CHUNK_ENTRY.size) for i in range(num_chunks)]
+            pos += num_chunks * CHUNK_ENTRY.size
+            self.layers[raw_name.rstrip(b'\0').decode('ascii')] = (kind, table)
+
+        self._chunks = {} # {(layer, cx, cy): (ids, rots)}
+
+    def chunk_bounds(self, cx, cy):
+        """(x0, y0, cw, ch)"""
+        x0, y0 = cx * self.chunk_size, cy * self.chunk_size
+        return x0, y0, min(self.chunk_size, self.width - x0), min(self.chunk_size, self.height - y0)
+
+    def read_chunk(self, layer, cx, cy):
+        """(ids: array('i'), rots: bytes 또는 None) - 청크 안에서 행 우선"""
+        key = (layer, cx, cy)
+        chunk = self._chunks.get(key)
+        if chunk is not None: return chunk
+
+        kind, table = self.layers[layer]
+        offset, length, codec = table[cy * self.cols + cx]
+        raw = self._mm[offset:offset + length]
+        if codec == CODEC_ZLIB: raw = zlib.decompress(raw)
+
+        _, _, cw, ch = self.chunk_bounds(cx, cy)
+        count = cw * ch
+        ids = array('i')
+        ids.frombytes(raw[:4 * count])
+        if sys.byteorder == 'big': ids.byteswap()
+        rots = raw[4 * count:5 * count] if kind == KIND_TILES else None
+
+        chunk = (ids, rots)
+        self._chunks[key] = chunk
+        return chunk
+
+    def get(self, layer, x, y):
+        """(값, 회전 각도) - 해당 칸의 청크만 디코딩"""
+        if not (0 <= x < self.width and 0 <= y < self.height): return (0, 0)
+        cx, cy = x // self.chunk_size, y // self.chunk_size
+        ids, rots = self.read_chunk(layer, cx, cy)
+        x0, y0, cw, _ = self.chunk_bounds(cx, cy)
+        i = (y - y0) * cw + (x - x0)
+        return (ids[i], rots[i] * 90 if rots is not None else 0)
+
+    def iter_cells(self, layer):
+        """0이 아닌 칸을 행 우선 순서로 (x, y, 값, 회전 각도) 순회. 청크는 한 줄씩 필요할 때 디코딩"""
+        for cy in range(self.rows):
+            chunks = [(self.chunk_bounds(cx, cy), self.read_chunk(layer, cx, cy)) for cx in range(self.cols)]
+            y0, ch = chunks[0][0][1], chunks[0][0][3]
+            for row in range(ch):
+                for (x0, _, cw, _), (ids, rots) in chunks:
+                    base = row * cw
+                    for i in range(cw):
+                        value = ids[base + i]
+                        if value == 0: continue
+                        yield x0 + i, y0 + row, value, (rots[base + i] * 90 if rots is not None else 0)
+
+    def read_layer(self, layer, ids_out, rots_out=None):
+        """레이어 전체를 width*height 평면 배열에 복사 (청크 행 단위 슬라이스 복사)"""
+        w = self.width
+        for cy in range(self.rows):
+            for cx in range(self.cols):
+                ids, rots = self.read_chunk(layer, cx, cy)
+                x0, y0, cw, ch = self.chunk_bounds(cx, cy)
+                for row in range(ch):
+                    dst = (y0 + row) * w + x0
+                    src = row * cw
+                    ids_out[dst:dst + cw] = ids[src:src + cw]
+                    if rots_out is not None and rots is not None:
+                        rots_out[dst:dst + cw] = rots[src:src + cw]
+                # 전체 복사 후에는 청크 보관본이 필요 없음
+                self._chunks.pop((layer, cx, cy), None)
+
+    def close(self):
+        self._chunks.clear()
+        if getattr(self, '_mm', None) is not None:
+            self._mm.close(); self._mm = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
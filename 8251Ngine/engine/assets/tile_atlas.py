@@ -0,0 +1,142 @@
+"""
+타일 텍스처 아틀라스
+모든 타일 ID를 한 번씩 그려 한 장의 시트에 채워 넣고, 변형별 위치(UV 인덱스)를 함께 디스크에 저장합니다.
+- tex: 원본 32x32 텍스처
+- top: 아이소 마름모로 늘려 마스킹한 윗면 (TILE_WIDTH x TILE_HEIGHT)
+- block: 카테고리 기본 높이(CATEGORY_HEIGHTS)로 그린 Block3D 완성 이미지
+캐시 키는 tiles.json 내용 + 생성기 소스 + 타일 크기의 해시라서, 어느 쪽이든 바뀌면 다시 빌드합니다.
+"""
+import glob
+import hashlib
+import json
+import os
+import sys
+import time
+import pygame
+from engine.core.math_utils import TILE_WIDTH, TILE_HEIGHT, HEIGHT_SCALE
+from engine.assets.tile_engine import TileEngine, render_iso_top
+
+SHEET_WIDTH = 1024
+PADDING = 1
+VARIANTS = ('tex', 'top', 'block')
+# 이 모듈들의 소스가 바뀌면 그려지는 결과도 바뀔 수 있으므로 캐시 키에 포함
+GENERATOR_MODULES = ('engine.assets.tile_engine', 'engine.assets.tile_atlas', 'engine.graphics.block', 'engine.graphics.geometry')
+
+def cache_key(tile_data):
+    h = hashlib.sha1()
+    h.update(json.dumps(tile_data, sort_keys=True).encode('utf-8'))
+    for name in GENERATOR_MODULES:
+        with open(sys.modules[name].__file__, 'rb') as f: h.update(f.read())
+    h.update(f"{TILE_WIDTH},{TILE_HEIGHT},{HEIGHT_SCALE}".encode('ascii'))
+    return h.hexdigest()[:16]
+
+def pack_shelves(sizes, width=SHEET_WIDTH):
+    """[(key, w, h)] -> ({key: (x, y)}, sheet_height). 높이순 선반(shelf) 배치"""
+    positions = {}
+    x = y = shelf_h = 0
+    for key, w, h in sorted(sizes, key=lambda s: -s[2]):
+        if x + w > width:
+            x, y = 0, y + shelf_h + PADDING
+            shelf_h = 0
+        positions[key] = (x, y)
+        x += w + PADDING
+        shelf_h = max(shelf_h, h)
+    return positions, y + shelf_h
+
+class TileAtlas:
+    def __init__(self, sheet, index):
+        self.sheet = sheet
+        self.index = index # {tid: {'tex': [x, y, w, h], 'top': [...], 'block': [...], 'block_z': float}}
+        self._subsurfaces = {}
+
+    def get(self, tid, variant):
+        """아틀라스 안의 서브서피스 (없으면 None). 시트와 픽셀을 공유하므로 그 위에 그리지 마세요."""
+        key = (str(tid), variant)
+        surf = self._subsurfaces.get(key)
+        if surf is None:
+            entry = self.index.get(key[0])
+            if not entry or variant not in entry: return None
+            surf = self.sheet.subsurface(pygame.Rect(entry[variant]))
+            self._subsurfaces[key] = surf
+        return surf
+
+    def get_block(self, tid, size_z):
+        entry = self.index.get(str(tid))
+        if not entry or entry.get('block_z') != size_z: return None
+        return self.get(tid, 'block')
+
+    @staticmethod
+    def build(tile_data):
+        """모든 타일을 그려 시트 한 장과 UV 인덱스를 만듭니다."""
+        from engine.graphics.block import render_block_surface
+
+        rendered = {}
+        for tid in sorted(tile_data, key=int):
+            tex = TileEngine.draw_texture(tid)
+            top = render_iso_top(tex)
+            size_z = TileEngine.get_default_height(tid)
+            block = render_block_surface(tid, size_z, tuple(tile_data[tid].get('color', (150, 150, 150))), top)
+            rendered[tid] = ({'tex': tex, 'top': top, 'block': block}, size_z)
+
+        sizes = [((tid, v), surf.get_width(), surf.get_height()) for tid, (surfs, _) in rendered.items() for v, surf in surfs.items()]
+        positions, height = pack_shelves(sizes)
+
+        sheet = pygame.Surface((SHEET_WIDTH, max(1, height)), pygame.SRCALPHA)
+        index = {}
+        for tid, (surfs, size_z) in rendered.items():
+            entry = {'block_z': size_z}
+            for variant, surf in surfs.items():
+                x, y = positions[(tid, variant)]
+                sheet.blit(surf, (x, y))
+                entry[variant] = [x, y, surf.get_width(), surf.get_height()]
+            index[tid] = entry
+        return TileAtlas(sheet, index)
+
+    def save(self, cache_dir, key):
+        """시트(PNG)와 인덱스(JSON)를 임시 파일에 쓴 뒤 교체. 인덱스를 마지막에 써서 시트만 있는 상태는 무시됨"""
+        os.makedirs(cache_dir, exist_ok=True)
+        png_path = os.path.join(cache_dir, f"tile_atlas_{key}.png")
+        json_path = os.path.join(cache_dir, f"tile_atlas_{key}.json")
+        pygame.image.save(self.sheet, png_path + '.tmp.png')
+        os.replace(png_path + '.tmp.png', png_path)
+        with open(json_path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump({'key': key, 'tiles': self.index}, f)
+        os.replace(json_path + '.tmp', json_path)
+
+        # 이전 키의 아틀라스 정리
+        for path in glob.glob(os.path.join(cache_dir, "tile_atlas_*")):
+            if key not in os.path.basename(path):
+                try: os.remove(path)
+                except OSError: pass
+
+    @staticmethod
+    def load(cache_dir, key):
+        png_path = os.path.join(cache_dir, f"tile_atlas_{key}.png")
+        json_path = os.path.join(cache_dir, f"tile_atlas_{key}.json")
+        if not (os.path.exists(png_path) and os.path.exists(json_path)): return None
+        with open(json_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('key') != key: return None
+        sheet = pygame.image.load(png_path)
+        if pygame.display.get_surface(): sheet = sheet.convert_alpha()
+        return TileAtlas(sheet, data['tiles'])
+
+    @staticmethod
+    def load_or_build(tile_data, cache_dir):
+        key = cache_key(tile_data)
+        t0 = time.perf_counter()
+        try:
+            atlas = TileAtlas.load(cache_dir, key)
+            if atlas:
+                print(f"[TileAtlas] Loaded {len(atlas.index)} tiles from cache ({(time.perf_counter() - t0) * 1000:.1f} ms)")
+                return atlas
+        except (OSError, ValueError, KeyError, pygame.error) as e:
+            print(f"[TileAtlas] Cache load failed, rebuilding: {e}")
+
+        atlas = TileAtlas.build(tile_data)
+        try:
+            atlas.save(cache_dir, key)
+        except (OSError, pygame.error) as e:
+            print(f"[TileAtlas] Cache save failed: {e}")
+        print(f"[TileAtlas] Built {len(atlas.index)} tiles into {atlas.sheet.get_width()}x{atlas.sheet.get_height()} sheet ({(time.perf_counter() - t0) * 1000:.1f} ms)")
+        return atlas
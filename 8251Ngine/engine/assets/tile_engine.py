@@ -4,6 +4,7 @@ import math
 import os
 import glob
 import time # Not strictly needed for texture creation, but was in original
+from engine.core.math_utils import TILE_WIDTH, TILE_HEIGHT
 
 # PxANIC! Color Palette
 P = {
@@ -23,6 +24,9 @@ P = {
     'METAL_BASE': (90, 90, 95), 'METAL_LIGHT': (140, 140, 150), 'METAL_RUST': (110, 60, 50),
 }
 
+# [수정] 텍스처 생성은 전용 난수를 사용 (아틀라스 캐시 적중 여부가 게임 로직의 전역 random 순서를 바꾸지 않도록)
+_rng = random.Random()
+
 # Drawing Helpers (from PxANIC! tiles.py)
 def fill(s, c): s.fill(c)
 def rect(s, c, r, w=0, **kwargs): pygame.draw.rect(s, c, r, w, **kwargs)
@@ -37,13 +41,13 @@ def blend(c1, c2, r):
     return (int(c1[0]*(1-r)+c2[0]*r), int(c1[1]*(1-r)+c2[1]*r), int(c1[2]*(1-r)+c2[2]*r))
 
 def noise_color(color, intensity=15):
-    var = random.randint(-intensity, intensity)
+    var = _rng.randint(-intensity, intensity)
     return (max(0, min(255, color[0]+var)), max(0, min(255, color[1]+var)), max(0, min(255, color[2]+var)))
 
 def draw_pro_noise(surf, color, intensity=20):
     surf.fill(color)
     for _ in range(150):
-        x, y = random.randint(0, 31), random.randint(0, 31)
+        x, y = _rng.randint(0, 31), _rng.randint(0, 31)
         pixel(surf, noise_color(color, intensity), (x, y))
 
 def draw_pixel_bevel(surf, rect_obj, base_col, light_col, dark_col, thickness=1):
@@ -75,7 +79,7 @@ def draw_grass_detailed(surf, base_col):
     fill(surf, base_col)
     light, shadow = P['GRASS_LIGHT'], P['GRASS_SHADOW']
     for _ in range(15):
-        cx, cy = random.randint(2, 28), random.randint(2, 28)
+        cx, cy = _rng.randint(2, 28), _rng.randint(2, 28)
         line(surf, shadow, (cx, cy), (cx, cy+3), 1)
         pixel(surf, light, (cx-1, cy-1))
         pixel(surf, light, (cx+1, cy-1))
@@ -87,12 +91,12 @@ def draw_1110000(s): draw_pro_noise(s, P['DIRT_BASE'], 25)
 def draw_1110001(s):
     fill(s, P['GRASS_BASE'])
     for _ in range(15):
-        cx, cy = random.randint(2, 28), random.randint(2, 28)
+        cx, cy = _rng.randint(2, 28), _rng.randint(2, 28)
         line(s, P['GRASS_SHADOW'], (cx, cy), (cx, cy+3))
         pixel(s, P['GRASS_LIGHT'], (cx-1, cy-1))
 def draw_1110002(s):
     draw_pro_noise(s, P['GREY_M'], 10)
-    for _ in range(15): circle(s, P['GREY_D'], (random.randint(4,27), random.randint(4,27)), 2)
+    for _ in range(15): circle(s, P['GREY_D'], (_rng.randint(4,27), _rng.randint(4,27)), 2)
 def draw_1110003(s):
     draw_pro_noise(s, P['SAND_BASE'], 10)
     for y in [10, 22]:
@@ -103,10 +107,10 @@ def draw_1110004(s):
     for y in range(4, 32, 8): line(s, P['WHITE'], (4, y), (12, y), 1)
 def draw_1110005(s):
     draw_pro_noise(s, P['STONE_SHADOW'], 40)
-    for _ in range(3): circle(s, P['BLACK'], (random.randint(5,25), random.randint(5,25)), 4)
+    for _ in range(3): circle(s, P['BLACK'], (_rng.randint(5,25), _rng.randint(5,25)), 4)
 def draw_1110006(s):
     draw_pro_noise(s, P['STONE_BASE'], 20)
-    for _ in range(6): circle(s, P['GREEN'], (random.randint(4,27), random.randint(4,27)), random.randint(3,6))
+    for _ in range(6): circle(s, P['GREEN'], (_rng.randint(4,27), _rng.randint(4,27)), _rng.randint(3,6))
 def draw_1110007(s):
     draw_pro_noise(s, P['WOOD_LIGHT'], 15)
     for y in range(0, 32, 8): line(s, P['BROWN_D'], (0, y), (31, y))
@@ -115,14 +119,14 @@ def draw_1110008(s):
     for x in range(0, 32, 8): line(s, P['BROWN_D'], (x, 0), (x, 31))
 def draw_1110009(s):
     draw_pro_noise(s, P['WHITE'], 5)
-    for _ in range(3): line(s, P['GREY_L'], (random.randint(0,31), 0), (random.randint(0,31), 31))
+    for _ in range(3): line(s, P['GREY_L'], (_rng.randint(0,31), 0), (_rng.randint(0,31), 31))
 def draw_1110010(s):
     draw_pro_noise(s, P['CONCRETE'], 10)
     rect(s, P['GREY_D'], (4, 4, 2, 2))
     rect(s, P['GREY_D'], (24, 24, 2, 2))
 def draw_1110011(s):
     draw_pro_noise(s, P['ASPHALT'], 30)
-    for _ in range(20): pixel(s, P['GREY_L'], (random.randint(0,31), random.randint(0,31)))
+    for _ in range(20): pixel(s, P['GREY_L'], (_rng.randint(0,31), _rng.randint(0,31)))
 def draw_1110012(s):
     draw_pro_noise(s, P['ASPHALT'], 20)
     rect(s, P['WHITE'], (12, 2, 8, 28))
@@ -143,8 +147,8 @@ def draw_1120016(s):
     for y in range(0, 32, 4): line(s, (10, 20, 40), (0, y), (31, y))
 def draw_1120017(s):
     fill(s, P['RED'])
-    for _ in range(5): circle(s, P['ORANGE'], (random.randint(4, 27), random.randint(4, 27)), 5)
-    for _ in range(3): pixel(s, P['BLACK'], (random.randint(0, 31), random.randint(0, 31)))
+    for _ in range(5): circle(s, P['ORANGE'], (_rng.randint(4, 27), _rng.randint(4, 27)), 5)
+    for _ in range(3): pixel(s, P['BLACK'], (_rng.randint(0, 31), _rng.randint(0, 31)))
 def draw_1120018(s):
     fill(s, P['BROWN_D'])
     poly(s, P['BLACK'], [(0, 0), (15, 0), (0, 31)])
@@ -182,7 +186,7 @@ def draw_3220002(s):
         for x in range(off - 16, 32, 16):
             r_obj = pygame.Rect(x + 1, y + 1, 14, 6)
             draw_pixel_bevel(s, r_obj, P['STONE_BASE'], P['STONE_LIGHT'], P['STONE_SHADOW'])
-    for _ in range(4): circle(s, blend(P['GREEN'], P['BLACK'], 0.2), (random.randint(5, 25), random.randint(5, 25)), random.randint(4, 7))
+    for _ in range(4): circle(s, blend(P['GREEN'], P['BLACK'], 0.2), (_rng.randint(5, 25), _rng.randint(5, 25)), _rng.randint(4, 7))
 def draw_3220003(s):
     dark = blend(P['WOOD_BASE'], P['BLACK'], 0.3)
     draw_pro_noise(s, P['WOOD_BASE'], 15)
@@ -209,7 +213,7 @@ def draw_3220008(s):
     circle(s, P['GREY_D'], (28, 28), 1)
 def draw_3220009(s):
     draw_pro_noise(s, P['METAL_BASE'], 10)
-    for _ in range(12): circle(s, P['METAL_RUST'], (random.randint(0, 31), random.randint(0, 31)), random.randint(2, 4))
+    for _ in range(12): circle(s, P['METAL_RUST'], (_rng.randint(0, 31), _rng.randint(0, 31)), _rng.randint(2, 4))
 def draw_3220010(s):
     fill(s, (150, 200, 255, 100))
     line(s, P['WHITE'], (5, 31), (31, 5), 2)
@@ -224,7 +228,7 @@ def draw_3220012(s):
     for y in [6, 16, 26]:
         rect(s, P['BLACK'], (2, y, 28, 2))
         for x in range(4, 28, 4):
-            if random.random() > 0.3: rect(s, random.choice([P['RED'], P['BLUE'], P['WHITE']]), (x, y-4, 3, 4))
+            if _rng.random() > 0.3: rect(s, _rng.choice([P['RED'], P['BLUE'], P['WHITE']]), (x, y-4, 3, 4))
 def draw_3220013(s):
     draw_pro_noise(s, P['STONE_SHADOW'], 40)
     line(s, P['BLACK'], (0, 10), (12, 15), 2)
@@ -276,7 +280,7 @@ def draw_6310000(s): draw_flower(s, P['RED']) # Red Flower
 def draw_6310001(s): draw_flower(s, P['YELLOW']) # Yellow Flower
 def draw_6310002(s):
     fill(s, (0, 0, 0, 0)) # Transparent background
-    for _ in range(3): line(s, P['GREEN'], (16, 31), (random.randint(10, 22), 10), 2) # Weeds
+    for _ in range(3): line(s, P['GREEN'], (16, 31), (_rng.randint(10, 22), 10), 2) # Weeds
 def draw_6310003(s):
     fill(s, (0, 0, 0, 0))
     circle(s, P['GREEN'], (16, 16), 12)
@@ -306,7 +310,7 @@ def draw_7310000(s): # Pebble
     circle(s, P['GREY_L'], (20, 24), 3)
 def draw_7310007(s): # Portal
     fill(s, (0, 0, 0, 0))
-    for _ in range(5): circle(s, (100, 50, 200, 100), (16, 16), random.randint(5, 15))
+    for _ in range(5): circle(s, (100, 50, 200, 100), (16, 16), _rng.randint(5, 15))
 def draw_7310008(s): # Exit Mark
     fill(s, (0, 0, 0, 0))
     poly(s, P['YELLOW'], [(4, 16), (16, 4), (16, 12), (28, 12), (28, 20), (16, 20), (16, 28)])
@@ -323,7 +327,7 @@ def draw_7310011(s): # CCTV Camera
     circle(s, P['RED'], (16, 10), 2)
 def draw_7310101(s): # Dense Fog
     fill(s, (200, 200, 200, 80))
-    for _ in range(3): circle(s, (255, 255, 255, 40), (random.randint(8, 24), random.randint(8, 24)), 8)
+    for _ in range(3): circle(s, (255, 255, 255, 40), (_rng.randint(8, 24), _rng.randint(8, 24)), 8)
 def draw_7310102(s): # Shadow
     fill(s, (0, 0, 0, 0))
     circle(s, (0, 0, 0, 120), (16, 16), 12)
@@ -418,11 +422,11 @@ def draw_9312002(s): draw_farm_base(s, 'Grown Field') # Grown Field
 def draw_9312003(s): draw_1110004(s) # Fishing Spot is Shallow Water
 def draw_9322004(s): # Iron Ore
     draw_pro_noise(s, P['STONE_SHADOW'], 20)
-    for _ in range(4): circle(s, P['METAL_LIGHT'], (random.randint(8, 24), random.randint(8, 24)), 4)
+    for _ in range(4): circle(s, P['METAL_LIGHT'], (_rng.randint(8, 24), _rng.randint(8, 24)), 4)
 def draw_9322005(s): # Rubble
     fill(s, (0, 0, 0, 0))
     for _ in range(6):
-        pts_list = [(random.randint(0, 31), random.randint(0, 31)) for _ in range(3)]
+        pts_list = [(_rng.randint(0, 31), _rng.randint(0, 31)) for _ in range(3)]
         poly(s, P['GREY_M'], pts_list)
 def draw_9322006(s): # Furnace
     fill(s, P['GREY_D'])
@@ -463,27 +467,79 @@ def draw_flower(s, col):
     circle(s, col, (16, 12), 6)
     circle(s, P['YELLOW'], (16, 12), 2)
 
+def draw_door_or_chest(s, tid, name, col):
+    if tid in (5321025, 5310025): draw_chest(s, tid, name)
+    else: draw_door(s, tid, name, col)
+
+# Tile ID -> drawing function. Every draw_<ID> function above is registered automatically.
+TILE_DRAWERS = {int(fn_name[5:]): fn for fn_name, fn in list(globals().items()) if fn_name.startswith('draw_') and fn_name[5:].isdigit()}
+# Whole categories drawn by one function (used when there is no draw_<ID>)
+CATEGORY_DRAWERS = {5: draw_door_or_chest} # Doors and Chests
+
+# Block3D height per category (MapLoader placement; the atlas pre-renders blocks at these heights)
+CATEGORY_HEIGHTS = {
+    1: 0.05, 2: 0.05, # Floors
+    3: 2.0, # Walls
+    4: 1.0, # Fences
+    5: 1.8, # Doors/Chests
+    8: 0.8, # Furniture
+    9: 0.3, # Fields/Objects
+}
+
+ISO_DIAMOND = [(TILE_WIDTH // 2, 0), (TILE_WIDTH, TILE_HEIGHT // 2), (TILE_WIDTH // 2, TILE_HEIGHT), (0, TILE_HEIGHT // 2)]
+_diamond_mask = None
+
+def render_iso_top(tex):
+    """32x32 texture -> TILE_WIDTH x TILE_HEIGHT diamond (scale, then mask)"""
+    global _diamond_mask
+    if _diamond_mask is None:
+        _diamond_mask = pygame.Surface((TILE_WIDTH, TILE_HEIGHT), pygame.SRCALPHA)
+        pygame.draw.polygon(_diamond_mask, (255, 255, 255, 255), ISO_DIAMOND)
+    top = pygame.transform.scale(tex, (TILE_WIDTH, TILE_HEIGHT))
+    top.blit(_diamond_mask, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+    return top
+
 
 class TileEngine:
     TILE_DATA = {}
     TEXTURE_CACHE = {} # Memory cache
+    TOP_CACHE = {} # Iso diamond tops
+    ATLAS = None # TileAtlas (every tile pre-rendered into one sheet)
     
-    # Disk cache settings (simplified, original had cleanup logic)
-    # CACHE_DIR = "cache_tiles" # Removed for simplicity, rely on memory cache for now
+    # Disk cache: atlas sheet + UV index, keyed by tiles.json and generator source hash
+    CACHE_DIR = "cache_tiles"
 
     @staticmethod
-    def init(data):
+    def init(data, use_atlas=True):
         TileEngine.TILE_DATA = data
+        TileEngine.TEXTURE_CACHE.clear()
+        TileEngine.TOP_CACHE.clear()
+        TileEngine.ATLAS = None
         print(f"[TileEngine] Initialized with {len(data)} tiles")
 
+        if use_atlas:
+            # [최적화] 시작할 때 수백 개 텍스처를 다시 그리지 않고 디스크의 아틀라스 시트를 불러옴
+            from engine.assets.tile_atlas import TileAtlas
+            TileEngine.ATLAS = TileAtlas.load_or_build(data, TileEngine.CACHE_DIR)
+
     @staticmethod
     def create_texture(tid, size=32):
         """
-        Creates a procedural texture for a given tile ID using PxANIC! logic.
+        Returns the procedural texture for a given tile ID.
+        Uses the prebuilt atlas sheet when available, otherwise draws it once with PxANIC! logic.
         """
         if tid in TileEngine.TEXTURE_CACHE:
             return TileEngine.TEXTURE_CACHE[tid]
 
+        s = TileEngine.ATLAS.get(tid, 'tex') if TileEngine.ATLAS and size == 32 else None
+        if s is None: s = TileEngine.draw_texture(tid, size)
+
+        TileEngine.TEXTURE_CACHE[tid] = s
+        return s
+
+    @staticmethod
+    def draw_texture(tid, size=32):
+        """Draws a fresh texture (no caching). Used by create_texture and the atlas builder."""
         s = pygame.Surface((size, size), pygame.SRCALPHA)
         tid_int = int(tid)
         
@@ -491,108 +547,36 @@ class TileEngine:
         name = d.get('name', 'Unknown')
         col = tuple(d.get('color', P['GREY_M']))
 
-        # Dispatch to specific drawing functions based on Tile ID
-        if tid_int == 1110000: draw_1110000(s)
-        elif tid_int == 1110001: draw_1110001(s)
-        elif tid_int == 1110002: draw_1110002(s)
-        elif tid_int == 1110003: draw_1110003(s)
-        elif tid_int == 1110004: draw_1110004(s)
-        elif tid_int == 1110005: draw_1110005(s)
-        elif tid_int == 1110006: draw_1110006(s)
-        elif tid_int == 1110007: draw_1110007(s)
-        elif tid_int == 1110008: draw_1110008(s)
-        elif tid_int == 1110009: draw_1110009(s)
-        elif tid_int == 1110010: draw_1110010(s)
-        elif tid_int == 1110011: draw_1110011(s)
-        elif tid_int == 1110012: draw_1110012(s)
-        elif tid_int == 1110013: draw_1110013(s)
-        elif tid_int == 1110014: draw_1110014(s)
-        elif tid_int == 1110015: draw_1110015(s)
-        elif tid_int == 1120016: draw_1120016(s)
-        elif tid_int == 1120017: draw_1120017(s)
-        elif tid_int == 1120018: draw_1120018(s)
-        elif tid_int == 2110000: draw_2110000(s)
-        elif tid_int == 2110001: draw_2110001(s)
-        elif tid_int == 2110002: draw_2110002(s)
-        elif tid_int == 2110003: draw_2110003(s)
-        elif tid_int == 3220000: draw_3220000(s)
-        elif tid_int == 3220001: draw_3220001(s)
-        elif tid_int == 3220002: draw_3220002(s)
-        elif tid_int == 3220003: draw_3220003(s)
-        elif tid_int == 3220004: draw_3220004(s)
-        elif tid_int == 3220005: draw_3220005(s)
-        elif tid_int == 3220006: draw_3220006(s)
-        elif tid_int == 3220007: draw_3220007(s)
-        elif tid_int == 3220008: draw_3220008(s)
-        elif tid_int == 3220009: draw_3220009(s)
-        elif tid_int == 3220010: draw_3220010(s)
-        elif tid_int == 3220011: draw_3220011(s)
-        elif tid_int == 3220012: draw_3220012(s)
-        elif tid_int == 3220013: draw_3220013(s)
-        elif tid_int == 4220000: draw_4220000(s)
-        elif tid_int == 4220001: draw_4220001(s)
-        elif tid_int == 4220002: draw_4220002(s)
-        elif tid_int // 1000000 == 5: # Doors and Chests
-            if tid_int in [5321025, 5310025]: draw_chest(s, tid_int, name)
-            else: draw_door(s, tid_int, name, col)
-        elif tid_int == 6310000: draw_6310000(s)
-        elif tid_int == 6310001: draw_6310001(s)
-        elif tid_int == 6310002: draw_6310002(s)
-        elif tid_int == 6310003: draw_6310003(s)
-        elif tid_int == 6310008: draw_6310008(s)
-        elif tid_int == 6310104: draw_6310104(s)
-        elif tid_int == 6310105: draw_6310105(s)
-        elif tid_int == 6310106: draw_6310106(s)
-        elif tid_int == 6310107: draw_6310107(s)
-        elif tid_int == 7310000: draw_7310000(s)
-        elif tid_int == 7310007: draw_7310007(s)
-        elif tid_int == 7310008: draw_7310008(s)
-        elif tid_int == 7310009: draw_7310009(s)
-        elif tid_int == 7310010: draw_7310010(s)
-        elif tid_int == 7310011: draw_7310011(s)
-        elif tid_int == 7310101: draw_7310101(s)
-        elif tid_int == 7310102: draw_7310102(s)
-        elif tid_int == 7310103: draw_7310103(s)
-        elif tid_int == 7320005: draw_7320005(s)
-        elif tid_int == 7320006: draw_7320006(s)
-        elif tid_int == 7320204: draw_7320204(s)
-        elif tid_int == 8310016: draw_8310016(s)
-        elif tid_int == 8310208: draw_8310208(s)
-        elif tid_int == 8320001: draw_8320001(s)
-        elif tid_int == 8320004: draw_8320004(s)
-        elif tid_int == 8320007: draw_8320007(s)
-        elif tid_int == 8320017: draw_8320017(s)
-        elif tid_int == 8320018: draw_8320018(s)
-        elif tid_int == 8320200: draw_8320200(s)
-        elif tid_int == 8320202: draw_8320202(s)
-        elif tid_int == 8320203: draw_8320203(s)
-        elif tid_int == 8320205: draw_8320205(s)
-        elif tid_int == 8320209: draw_8320209(s)
-        elif tid_int == 8320210: draw_8320210(s)
-        elif tid_int == 8320212: draw_8320212(s)
-        elif tid_int == 8320213: draw_8320213(s)
-        elif tid_int == 8320214: draw_8320214(s)
-        elif tid_int == 8320215: draw_8320215(s)
-        elif tid_int == 8321006: draw_8321006(s)
-        elif tid_int == 8321211: draw_8321211(s)
-        elif tid_int == 9312000: draw_farm_base(s, 'Empty Field')
-        elif tid_int == 9312001: draw_farm_base(s, 'Sprout Field')
-        elif tid_int == 9312002: draw_farm_base(s, 'Grown Field')
-        elif tid_int == 9312003: draw_1110004(s) # Fishing Spot is Shallow Water
-        elif tid_int == 9322004: draw_9322004(s)
-        elif tid_int == 9322005: draw_9322005(s)
-        elif tid_int == 9322006: draw_9322006(s)
-        elif tid_int == 9322007: draw_9322007(s)
-        elif tid_int == 9322008: draw_9322008(s)
-        elif tid_int == 9322009: draw_9322009(s)
-        elif tid_int == 9322010: draw_9322010(s)
-        elif tid_int == 9322011: draw_9322011(s)
+        # [최적화] if/elif 체인 대신 테이블로 분기
+        drawer = TILE_DRAWERS.get(tid_int)
+        if drawer: drawer(s)
+        elif tid_int // 1000000 in CATEGORY_DRAWERS: CATEGORY_DRAWERS[tid_int // 1000000](s, tid_int, name, col)
         else:
             # Fallback procedural noise if no specific drawing function
             draw_pro_noise(s, col, 20)
-
-        TileEngine.TEXTURE_CACHE[tid] = s
         return s
 
     @staticmethod
-    def get_tile_category(tid): return int(tid) // 1000000 # Helper for other modules
\ No newline at end of file
+    def get_top(tid):
+        """Isometric diamond top face (TILE_WIDTH x TILE_HEIGHT) for a tile ID"""
+        if tid in TileEngine.TOP_CACHE:
+            return TileEngine.TOP_CACHE[tid]
+
+        top = TileEngine.ATLAS.get(tid, 'top') if TileEngine.ATLAS else None
+        if top is None: top = render_iso_top(TileEngine.create_texture(tid))
+
+        TileEngine.TOP_CACHE[tid] = top
+        return top
+
+    @staticmethod
+    def get_block(tid, size_z):
+        """Prebuilt Block3D image from the atlas, or None if the atlas has no block at this height"""
+        # 아틀라스 블록은 TILE_DATA 색으로 그려졌으므로, 같은 색을 쓰는 키(JSON 문자열 ID)일 때만 사용
+        if not TileEngine.ATLAS or tid not in TileEngine.TILE_DATA: return None
+        return TileEngine.ATLAS.get_block(tid, size_z)
+
+    @staticmethod
+    def get_tile_category(tid): return int(tid) // 1000000 # Helper for other modules
+
+    @staticmethod
+    def get_default_height(tid): return CATEGORY_HEIGHTS.get(TileEngine.get_tile_category(tid), 0.05)
\ No newline at end of file
@@ -27,20 +27,18 @@ class AdvancedAIComponent(Component):
 
     def _sense_environment(self, services):
         interaction = services.get("interaction")
-        # 최근 발생한 소음 감지
+        # 최근 발생한 소음 감지 ([최적화] 모든 소음 대신 소음 색인에서 이 위치에 닿는 소음만)
         if interaction and interaction.noises:
-            for noise in interaction.noises:
-                dist = self.node.position.distance_to(pygame.math.Vector3(noise.x, noise.y, 0))
-                if dist < noise.radius:
-                    # 위험한 소음(총성 등)이면 FLEE, 아니면 INVESTIGATE
-                    if noise.color == (255, 100, 50): # Combat noise
-                        self.state = "FLEE"
-                        self.target_pos = self.node.position + (self.node.position - pygame.math.Vector3(noise.x, noise.y, 0)).normalize() * 5
-                    else:
-                        if self.state != "FLEE":
-                            self.state = "INVESTIGATE"
-                            self.target_pos = pygame.math.Vector3(noise.x, noise.y, 0)
-                    self.path = [] # 새 경로 필요
+            for noise in interaction.noises_near(self.node.position.x, self.node.position.y):
+                # 위험한 소음(총성 등)이면 FLEE, 아니면 INVESTIGATE
+                if noise.color == (255, 100, 50): # Combat noise
+                    self.state = "FLEE"
+                    self.target_pos = self.node.position + (self.node.position - pygame.math.Vector3(noise.x, noise.y, 0)).normalize() * 5
+                else:
+                    if self.state != "FLEE":
+                        self.state = "INVESTIGATE"
+                        self.target_pos = pygame.math.Vector3(noise.x, noise.y, 0)
+                self.path = [] # 새 경로 필요
 
     def _update_state_logic(self, dt, services):
         time_manager = services.get("time")
@@ -57,13 +55,17 @@ class AdvancedAIComponent(Component):
                 rand_x = self.node.position.x + random.uniform(-5, 5)
                 rand_y = self.node.position.y + random.uniform(-5, 5)
                 if nav_manager:
-                    self.path = nav_manager.get_path(self.node.position, pygame.math.Vector2(rand_x, rand_y))
+                    path = nav_manager.get_path(self.node.position, pygame.math.Vector2(rand_x, rand_y))
+                    if path is None: return # 이번 프레임 길찾기 예산 소진 -> 다음 프레임에 재요청
+                    self.path = path
                 if not self.path: self.state = "IDLE"; self.timer = 2.0
 
         elif self.state == "INVESTIGATE":
             if self.target_pos and not self.path:
                 if nav_manager:
-                    self.path = nav_manager.get_path(self.node.position, pygame.math.Vector2(self.target_pos.x, self.target_pos.y))
+                    path = nav_manager.get_path(self.node.position, pygame.math.Vector2(self.target_pos.x, self.target_pos.y))
+                    if path is None: return # 예산 소진 -> 다음 프레임에 재요청
+                    self.path = path
             if not self.path: self.state = "IDLE"; self.timer = 3.0
 
     def _execute_movement(self, dt):
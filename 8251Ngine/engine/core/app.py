@@ -9,14 +9,38 @@ from engine.graphics.renderer import Renderer
 from engine.graphics.lighting import LightingManager
 from engine.core.time import TimeManager
 from engine.core.input import InputManager
-from engine.net.network import NetworkManager
-from engine.assets.loader import ResourceManager
-from engine.audio.audio_manager import AudioManager
 from engine.core.interaction import InteractionManager
-from game.systems.minigame_manager import MinigameManager
-from engine.systems.combat import CombatManager
-from engine.ui.world_ui import WorldPopupManager
-from engine.physics.navigation import NavigationManager
+from engine.core.services import ServiceRegistry
+from engine.core.static_world import StaticWorld
+from engine.physics.spatial_hash import SpatialHash
+from engine.core import startup_profiler, frame_profiler
+
+# [최적화] 네트워크/오디오/미니게임/전투 등은 처음 services[...]로 접근할 때 import + 생성 (첫 프레임까지의 시간 단축)
+def _create_network():
+    from engine.net.network import NetworkManager
+    return NetworkManager("ws://localhost:8765")
+
+def _create_assets():
+    from engine.assets.loader import ResourceManager
+    return ResourceManager()
+
+def _create_audio():
+    from engine.audio.audio_manager import AudioManager
+    return AudioManager()
+
+def _create_minigame():
+    from game.systems.minigame_manager import MinigameManager
+    return MinigameManager()
+
+def _create_combat():
+    from engine.systems.combat import CombatManager
+    return CombatManager()
+
+def _create_popups():
+    from engine.ui.world_ui import WorldPopupManager
+    return WorldPopupManager()
+
+ENTITY_CELL_SIZE = 8 # 엔티티 색인 셀 크기 (타일)
 
 class App:
     instance = None
@@ -30,47 +54,67 @@ class App:
         self.running = True
         self.use_network = use_network
         
-        # Core Engine Services
-        self.services = {
+        # Core Engine Services (매 프레임 쓰는 것만 즉시 생성, 나머지는 첫 접근 때 생성)
+        self.services = ServiceRegistry({
             "input": InputManager(),
             "renderer": Renderer(self.screen),
             "lighting": LightingManager(width, height),
             "time": TimeManager(),
-            "network": NetworkManager("ws://localhost:8765") if use_network else None,
-            "assets": ResourceManager(),
-            "audio": AudioManager(),
             "interaction": InteractionManager(),
-            "minigame": MinigameManager(),
-            "combat": CombatManager(),
-            "popups": WorldPopupManager(),
+            "entities": SpatialHash(ENTITY_CELL_SIZE), # 움직이는 엔티티 위치 색인 (GameEntity가 매 프레임 갱신)
+            "network": None,
             "nav": None,
             "app": self
-        }
+        })
+        if use_network: self.services.register("network", _create_network)
+        self.services.register("assets", _create_assets)
+        self.services.register("audio", _create_audio)
+        self.services.register("minigame", _create_minigame)
+        self.services.register("combat", _create_combat)
+        self.services.register("popups", _create_popups)
         
         self.ui_root = None
         self.root = None
         self.fov_polygon = None
+        
+        # 프레임 프로파일러 (F3: 오버레이, F4: 트레이스 저장, --profile-frames: 시작부터 기록 후 종료 시 저장)
+        self.profiler = frame_profiler.PROFILER
+        self.export_trace_on_exit = frame_profiler.requested()
+        if self.export_trace_on_exit: self.profiler.set_enabled(True)
+        startup_profiler.mark("app init")
 
     def set_ui(self, ui_root):
         self.ui_root = ui_root
 
     def set_scene(self, scene_root):
         self.root = scene_root
+        self.services["renderer"].clear_static()
+        self.services["entities"].clear()
         if self.root:
             self.root._ready(self.services)
+        startup_profiler.mark("scene ready")
 
     def run(self):
         if self.use_network and self.services["network"]:
             self.services["network"].start()
             
+        first_frame = True
         while self.running:
             dt = self.clock.tick(60) / 1000.0
-            self._handle_events()
-            self._update(dt)
-            self._draw()
+            prof = self.profiler
+            prof.begin_frame()
+            with prof.scope("events"): self._handle_events()
+            with prof.scope("update"): self._update(dt)
+            with prof.scope("draw"): self._draw()
+            prof.end_frame()
+            if first_frame:
+                startup_profiler.finish()
+                first_frame = False
             
         if self.use_network and self.services["network"]:
             self.services["network"].stop()
+        if self.export_trace_on_exit and self.profiler.frames:
+            print(f"[Profile] Frame trace saved: {self.profiler.export_chrome_trace()}")
         pygame.quit()
         sys.exit()
 
@@ -82,27 +126,38 @@ class App:
                 self.screen = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
                 self.services["renderer"]._update_screen(self.screen)
                 self.services["lighting"].update_resolution(event.w, event.h)
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.profiler.toggle_overlay()
+                continue
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                if self.profiler.frames: print(f"[Profile] Frame trace saved: {self.profiler.export_chrome_trace()}")
+                continue
             
+            minigame = self.services.peek("minigame")
             if self.ui_root:
                 if self.ui_root.handle_event(event):
-                    if self.services["minigame"].is_minigame_active():
-                        self.services["minigame"].handle_event(event, self.services)
+                    if minigame and minigame.is_minigame_active():
+                        minigame.handle_event(event, self.services)
                         return True
                     continue
             
-            if self.services["minigame"].is_minigame_active():
-                if self.services["minigame"].handle_event(event, self.services):
+            if minigame and minigame.is_minigame_active():
+                if minigame.handle_event(event, self.services):
                     return
 
             if self.root and hasattr(self.root, 'handle_event'):
                 self.root.handle_event(event)
 
     def _update(self, dt):
+        prof = self.profiler
         self.services["input"].update()
         self.services["time"].update(dt)
-        self.services["lighting"].ambient_color = self.services["time"].current_ambient
-        self.services["lighting"].update_weather(dt)
-        self.services["interaction"].update()
+        with prof.scope("lighting"):
+            self.services["lighting"].ambient_color = self.services["time"].current_ambient
+            self.services["lighting"].update_weather(dt)
+        with prof.scope("interaction"): self.services["interaction"].update()
+        if self.services["nav"]:
+            self.services["nav"].begin_frame()
         
         # 전역 게임 상태 생성 (딕셔너리)
         game_state = {
@@ -110,42 +165,56 @@ class App:
             "is_blackout": (self.services["time"].current_phase == "NIGHT" and random.random() < 0.05),
             "player": self.root.player if hasattr(self.root, 'player') else None,
             "all_entities": self.root.children if hasattr(self.root, 'children') else [],
+            "entities": self.services["entities"], # 반경/부채꼴 질의는 all_entities 전체 순회 대신 이 색인으로
         }
 
-        self.services["minigame"].update(dt, self.services, game_state)
-        self.services["combat"].update(dt, self.services, game_state)
-        self.services["popups"].update(dt)
+        # 아직 한 번도 쓰이지 않은(생성되지 않은) 서비스는 갱신할 것이 없음
+        with prof.scope("systems"):
+            for name in ("minigame", "combat"):
+                service = self.services.peek(name)
+                if service: service.update(dt, self.services, game_state)
+            popups = self.services.peek("popups")
+            if popups: popups.update(dt)
         
         if self.root:
-            self.root._update(dt, self.services, game_state)
+            with prof.scope("scene"): self.root._update(dt, self.services, game_state)
 
     def _draw(self):
         self.screen.fill((20, 20, 25))
         renderer = self.services["renderer"]
         lighting = self.services["lighting"]
         interaction = self.services["interaction"]
-        minigame = self.services["minigame"]
-        combat = self.services["combat"]
-        popups = self.services["popups"]
+        minigame = self.services.peek("minigame")
+        combat = self.services.peek("combat")
+        popups = self.services.peek("popups")
+        prof = self.profiler
         
         if self.root:
-            renderer.clear_queue()
-            def _collect_nodes(node):
-                if not node.visible: return
-                renderer.submit(node)
-                if hasattr(node, 'get_light_surface'):
-                    if node not in lighting.lights: lighting.add_light(node)
-                for child in node.children: _collect_nodes(child)
-            _collect_nodes(self.root)
+            with prof.scope("collect"):
+                renderer.clear_queue()
+                def _collect_nodes(node):
+                    if not node.visible: return
+                    if isinstance(node, StaticWorld):
+                        # [최적화] 정적 월드는 미리 만든 목록으로 제출 (구성이 그대로면 순회 없음)
+                        renderer.submit_static_world(node)
+                        for light in node.lights(): lighting.add_light(light)
+                        return
+                    renderer.submit(node)
+                    if hasattr(node, 'get_light_surface'): lighting.add_light(node)
+                    for child in node.children: _collect_nodes(child)
+                _collect_nodes(self.root)
             
             self.root.draw_gizmos(self.screen, renderer.camera)
             renderer.flush(self.services)
-            interaction.draw(self.screen, renderer.camera)
-            combat.draw(self.screen, renderer.camera)
-            popups.draw(self.screen, renderer.camera)
-            lighting.render(self.screen, renderer.camera, self.fov_polygon)
-            minigame.draw(self.screen, self.services)
+            with prof.scope("effects"):
+                interaction.draw(self.screen, renderer.camera)
+                if combat: combat.draw(self.screen, renderer.camera)
+                if popups: popups.draw(self.screen, renderer.camera)
+            with prof.scope("lighting"): lighting.render(self.screen, renderer.camera, self.fov_polygon)
+            if minigame: minigame.draw(self.screen, self.services)
             
         if self.ui_root:
-            self.ui_root.draw(self.screen, self.services)
-        pygame.display.flip()
+            with prof.scope("ui"): self.ui_root.draw(self.screen, self.services)
+        if prof.overlay:
+            with prof.scope("profiler"): prof.draw_overlay(self.screen)
+        with prof.scope("flip"): pygame.display.flip()
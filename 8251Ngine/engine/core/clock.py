@@ -0,0 +1,37 @@
+"""
+게임 로직용 시계
+팝업/소음/미니게임 수명이나 동결 타이머 같은 시뮬레이션 코드는 time.time() / pygame.time.get_ticks() 대신
+clock.now() (초) / clock.get_ticks() (ms)를 호출합니다.
+평소에는 실제 시계 그대로이고, 헤드리스 시뮬레이션은 FixedClock을 install()하여 틱마다 고정 간격으로 시간을 진행시킵니다.
+"""
+import time
+import pygame
+
+now = time.time
+get_ticks = pygame.time.get_ticks
+
+class FixedClock:
+    """advance()를 호출할 때만 흐르는 시계"""
+    def __init__(self, step, start=1.0):
+        self.step = step # 초
+        self.time = start
+
+    def now(self):
+        return self.time
+
+    def get_ticks(self):
+        return int(self.time * 1000)
+
+    def advance(self, seconds=None):
+        self.time += self.step if seconds is None else seconds
+        return self.time
+
+def install(fixed_clock):
+    global now, get_ticks
+    now = fixed_clock.now
+    get_ticks = fixed_clock.get_ticks
+
+def uninstall():
+    global now, get_ticks
+    now = time.time
+    get_ticks = pygame.time.get_ticks
@@ -0,0 +1,185 @@
+"""
+프레임 프로파일러
+with PROFILER.scope("이름"): 으로 감싼 구간의 시간을 프레임 단위로 모아 최근 HISTORY_FRAMES 프레임을 링 버퍼에 보관합니다.
+scope 안에서 다시 scope를 열면 "update/fov" 처럼 경로가 이어져 계층으로 기록됩니다.
+- draw_overlay(): 프레임 시간 그래프 + 최근 SUMMARY_FRAMES 프레임의 구간별 평균/최대
+- export_chrome_trace(): chrome://tracing / Perfetto에서 열 수 있는 trace-event JSON
+기록이 꺼져 있으면 scope()는 아무 일도 하지 않는 공용 객체를 돌려주므로 호출 비용만 남습니다.
+"""
+import json
+import os
+import sys
+from collections import deque
+from datetime import datetime
+from time import perf_counter
+import pygame
+
+ENV_FLAG = "ENGINE_PROFILE_FRAMES"
+ARG_FLAG = "--profile-frames"
+
+HISTORY_FRAMES = 300
+SUMMARY_FRAMES = 60
+TARGET_MS = 1000.0 / 60
+TRACE_DIR = "logs"
+
+class _NullScope:
+    __slots__ = ()
+    def __enter__(self): return self
+    def __exit__(self, *exc): return False
+
+NULL_SCOPE = _NullScope()
+
+class _Scope:
+    __slots__ = ('profiler', 'name')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        stack = self.profiler._stack
+        path = f"{stack[-1][0]}/{self.name}" if stack else self.name
+        stack.append((path, perf_counter()))
+        return self
+
+    def __exit__(self, *exc):
+        stack = self.profiler._stack
+        if stack:
+            path, t0 = stack.pop()
+            self.profiler._events.append((path, t0, perf_counter() - t0))
+        return False
+
+class FrameProfiler:
+    def __init__(self, history=HISTORY_FRAMES):
+        self.enabled = False
+        self.overlay = False
+        self.frames = deque(maxlen=history) # [(프레임 시작, 프레임 ms, [(경로, 시작, 초)])]
+        self._events = []
+        self._stack = []
+        self._scopes = {} # {이름: _Scope} - 매 프레임 새 객체를 만들지 않음
+        self._frame_start = None
+        self._font = None
+        self._panel = None
+
+    # --- 기록 ---
+    def scope(self, name):
+        if not self.enabled: return NULL_SCOPE
+        scope = self._scopes.get(name)
+        if scope is None:
+            scope = self._scopes[name] = _Scope(self, name)
+        return scope
+
+    def begin_frame(self):
+        self._events = []
+        self._stack.clear()
+        self._frame_start = perf_counter() if self.enabled else None
+
+    def end_frame(self):
+        # 프레임 도중에 켠 경우(시작 시각 없음)는 버림
+        if self._frame_start is None: return
+        end = perf_counter()
+        self.frames.append((self._frame_start, (end - self._frame_start) * 1000, self._events))
+        self._events = []
+        self._frame_start = None
+
+    def set_enabled(self, enabled):
+        self.enabled = enabled
+        if not enabled:
+            self.overlay = False
+            self._frame_start = None
+
+    def toggle_overlay(self):
+        self.overlay = not self.overlay
+        if self.overlay: self.enabled = True
+        return self.overlay
+
+    def clear(self):
+        self.frames.clear()
+
+    # --- 분석 ---
+    def summary(self, count=SUMMARY_FRAMES):
+        """최근 count 프레임 -> (프레임 평균 ms, 최대 ms, [(경로, 평균 ms, 최대 ms)]) - 경로는 마지막 프레임의 시작 순서"""
+        frames = list(self.frames)[-count:]
+        if not frames: return 0.0, 0.0, []
+        totals, peaks = {}, {}
+        for _, _, events in frames:
+            per_frame = {}
+            for path, _, dur in events:
+                per_frame[path] = per_frame.get(path, 0.0) + dur * 1000
+            for path, ms in per_frame.items():
+                totals[path] = totals.get(path, 0.0) + ms
+                if ms > peaks.get(path, 0.0): peaks[path] = ms
+
+        order = []
+        for path, _, _ in sorted(frames[-1][2], key=lambda e: e[1]):
+            if path not in order: order.append(path)
+        for path in totals:
+            if path not in order: order.append(path)
+
+        n = len(frames)
+        frame_ms = [f[1] for f in frames]
+        return sum(frame_ms) / n, max(frame_ms), [(path, totals[path] / n, peaks[path]) for path in order]
+
+    def spikes(self, threshold_ms=TARGET_MS * 2):
+        """링 버퍼에서 threshold_ms를 넘은 프레임 번호 목록 (0 = 가장 오래된 프레임)"""
+        return [i for i, (_, ms, _) in enumerate(self.frames) if ms > threshold_ms]
+
+    # --- 출력 ---
+    def export_chrome_trace(self, path=None):
+        """링 버퍼의 프레임을 trace-event JSON으로 저장하고 경로를 반환"""
+        if path is None:
+            os.makedirs(TRACE_DIR, exist_ok=True)
+            path = os.path.join(TRACE_DIR, f"frame_trace_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        frames = list(self.frames)
+        base = frames[0][0] if frames else 0.0
+        events = []
+        for index, (start, frame_ms, scopes) in enumerate(frames):
+            events.append({"name": "frame", "cat": "frame", "ph": "X", "pid": 1, "tid": 1,
+                           "ts": round((start - base) * 1e6, 1), "dur": round(frame_ms * 1000, 1),
+                           "args": {"index": index, "ms": round(frame_ms, 3)}})
+            for scope_path, t0, dur in scopes:
+                events.append({"name": scope_path.rsplit('/', 1)[-1], "cat": scope_path, "ph": "X", "pid": 1, "tid": 1,
+                               "ts": round((t0 - base) * 1e6, 1), "dur": round(dur * 1e6, 1)})
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        return path
+
+    def draw_overlay(self, screen):
+        if not self.overlay or not self.frames: return
+        if self._font is None: self._font = pygame.font.SysFont("consolas", 12)
+        avg, peak, rows = self.summary()
+
+        graph_w, graph_h, line_h = HISTORY_FRAMES, 60, 14
+        width = graph_w + 20
+        height = graph_h + 30 + line_h * (len(rows) + 1)
+        if self._panel is None or self._panel.get_size() != (width, height):
+            self._panel = pygame.Surface((width, height))
+            self._panel.fill((0, 0, 0))
+            self._panel.set_alpha(190)
+        x0 = screen.get_width() - width - 10
+        y0 = 10
+        screen.blit(self._panel, (x0, y0))
+
+        # 프레임 시간 그래프 (목표 프레임 시간의 3배까지, 초과분은 잘림)
+        scale = graph_h / (TARGET_MS * 3)
+        gx, gy = x0 + 10, y0 + 10 + graph_h
+        for i, (_, ms, _) in enumerate(self.frames):
+            color = (80, 200, 80) if ms <= TARGET_MS else (230, 200, 60) if ms <= TARGET_MS * 2 else (230, 60, 60)
+            pygame.draw.line(screen, color, (gx + i, gy), (gx + i, gy - min(graph_h, int(ms * scale))))
+        target_y = gy - int(TARGET_MS * scale)
+        pygame.draw.line(screen, (120, 120, 255), (gx, target_y), (gx + graph_w, target_y))
+
+        y = gy + 8
+        header = f"frame avg {avg:5.2f} ms  max {peak:5.2f} ms  ({len(self.spikes())} spikes)"
+        screen.blit(self._font.render(header, True, (255, 255, 255)), (gx, y))
+        for path, row_avg, row_max in rows:
+            y += line_h
+            depth = path.count('/')
+            label = "  " * depth + path.rsplit('/', 1)[-1]
+            color = (230, 60, 60) if row_max > TARGET_MS else (200, 200, 200)
+            screen.blit(self._font.render(f"{label:<22}{row_avg:6.2f} /{row_max:6.2f} ms", True, color), (gx, y))
+
+PROFILER = FrameProfiler()
+
+def requested():
+    return ARG_FLAG in sys.argv or os.environ.get(ENV_FLAG) == "1"
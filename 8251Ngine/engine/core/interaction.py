@@ -1,5 +1,6 @@
 import pygame
-import time
+from engine.core import clock
+from engine.physics.spatial_hash import SpatialHash
 import math # math 임포트 추가
 
 class NoiseEvent:
@@ -7,12 +8,12 @@ class NoiseEvent:
         self.x, self.y = x, y
         self.radius = radius
         self.color = color
-        self.start_time = time.time()
+        self.start_time = clock.now()
         self.duration = duration
         self.alpha = 150
 
     def update(self):
-        elapsed = time.time() - self.start_time
+        elapsed = clock.now() - self.start_time
         progress = elapsed / self.duration
         if progress > 1.0:
             return False
@@ -26,12 +27,12 @@ class SoundIndicator:
         self.listener_pos = listener_pos # PxANIC!에서는 player.rect.center를 사용했지만, 여기서는 Vector2
         self.sound_pos = sound_pos       # Vector2
         self.color = color
-        self.start_time = time.time()
+        self.start_time = clock.now()
         self.duration = duration
         self.alpha = 255
 
     def update(self):
-        elapsed = time.time() - self.start_time
+        elapsed = clock.now() - self.start_time
         progress = elapsed / self.duration
         if progress > 1.0:
             return False
@@ -108,11 +109,22 @@ class SoundIndicator:
 class InteractionManager:
     def __init__(self):
         self.noises = []
+        self.noise_grid = SpatialHash(8) # 소음 위치 색인 (AI 감지용)
+        self.max_noise_radius = 0
         self.interactables = []
         self.sound_indicators = [] # SoundDirectionIndicator 리스트 추가
 
     def emit_noise(self, x, y, radius, color=(200, 200, 200), duration=1.0): # duration 추가
-        self.noises.append(NoiseEvent(x, y, radius, color, duration))
+        noise = NoiseEvent(x, y, radius, color, duration)
+        self.noises.append(noise)
+        self.noise_grid.update(noise, x, y)
+        if radius > self.max_noise_radius: self.max_noise_radius = radius
+
+    def noises_near(self, x, y):
+        """(x, y)가 반경 안에 드는 소음 목록 (발생 순서 유지, 색인에서 가장 큰 소음 반경 안만 검사)"""
+        hits = {noise for dist, noise in self.noise_grid.query_radius(x, y, self.max_noise_radius) if dist < noise.radius}
+        if not hits: return []
+        return [noise for noise in self.noises if noise in hits]
 
     def register_interactable(self, node):
         if node not in self.interactables:
@@ -123,7 +135,13 @@ class InteractionManager:
         self.sound_indicators.append(SoundIndicator(listener_pos, sound_pos, color, duration))
 
     def update(self):
-        self.noises = [n for n in self.noises if n.update()]
+        alive = [n for n in self.noises if n.update()]
+        if len(alive) != len(self.noises):
+            alive_set = set(alive)
+            for n in self.noises:
+                if n not in alive_set: self.noise_grid.remove(n)
+            self.max_noise_radius = max((n.radius for n in alive), default=0)
+        self.noises = alive
         self.sound_indicators = [i for i in self.sound_indicators if i.update()] # 인디케이터 업데이트
 
     def draw(self, screen, camera):
@@ -134,7 +152,7 @@ class InteractionManager:
             sx, sy = camera.world_to_screen(ix, iy)
             
             # Draw expanding ring
-            elapsed = time.time() - n.start_time
+            elapsed = clock.now() - n.start_time
             curr_rad = int(n.radius * (elapsed / n.duration) * 32) # Scale to pixels
             
             s = pygame.Surface((curr_rad * 2, curr_rad * 2), pygame.SRCALPHA)
@@ -1,6 +1,11 @@
 from pygame.math import Vector3
 
 class Node:
+    # 정적 노드(맵 블록 등)는 생성 후 움직이지 않으며, Renderer가 렌더 엔트리를 유지/재사용함
+    is_static = False
+    # False면 부모의 _update 순회에서 빠짐 (맵 블록처럼 매 프레임 할 일이 없는 노드). 실행 중 변경은 set_awake 사용
+    awake = True
+
     def __init__(self, name="Node"):
         self.name = name
         self.tag = name
@@ -30,11 +35,23 @@ class Node:
         node.parent = self
         self.children.append(node)
         node._ready()
+        self.mark_dirty()
 
     def remove_child(self, node):
         if node in self.children:
             self.children.remove(node)
             node.parent = None
+            node._exit_tree()
+            self.mark_dirty()
+
+    def mark_dirty(self):
+        """트리 구성/모양 변경을 조상에게 알림 (StaticWorld가 미리 만든 목록을 다시 만들도록)"""
+        if self.parent: self.parent.mark_dirty()
+
+    def set_awake(self, awake):
+        if self.awake == awake: return
+        self.awake = awake
+        self.mark_dirty()
 
     def get_global_position(self):
         if self.parent and isinstance(self.parent, Node):
@@ -44,13 +61,18 @@ class Node:
     def _ready(self):
         pass
 
+    def _exit_tree(self):
+        """부모에서 떨어질 때 호출 (자손 포함). 서비스 색인 등 노드가 등록해 둔 곳에서 스스로 빠지는 자리"""
+        for child in self.children:
+            child._exit_tree()
+
     def _update(self, dt, services, game_state):
         """핵심: 컴포넌트와 자식들에게 game_state를 누락 없이 전달"""
         for comp in self.components:
             comp.update(dt, services, game_state)
             
         for child in self.children:
-            child._update(dt, services, game_state)
+            if child.awake: child._update(dt, services, game_state)
             
         self.update(dt, services, game_state)
 
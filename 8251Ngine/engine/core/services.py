@@ -0,0 +1,37 @@
+from time import perf_counter
+from engine.core import startup_profiler
+
+class ServiceRegistry(dict):
+    """
+    App.services 용 딕셔너리.
+    register(name, factory)로 등록한 서비스는 services[name] / services.get(name)으로 처음 접근할 때 생성됩니다.
+    값을 직접 넣은 서비스(services[name] = obj)는 일반 딕셔너리처럼 동작합니다.
+    매 프레임 도는 코드는 peek(name)으로 아직 만들어지지 않은 서비스를 건너뛸 수 있습니다.
+    """
+    def __init__(self, services=None):
+        super().__init__(services or {})
+        self._factories = {}
+
+    def register(self, name, factory):
+        self._factories[name] = factory
+        dict.pop(self, name, None)
+
+    def __missing__(self, name):
+        factory = self._factories.pop(name, None)
+        if factory is None: raise KeyError(name)
+        t0 = perf_counter()
+        service = factory()
+        startup_profiler.record(f"service '{name}'", (perf_counter() - t0) * 1000)
+        self[name] = service
+        return service
+
+    def __contains__(self, name):
+        return dict.__contains__(self, name) or name in self._factories
+
+    def get(self, name, default=None):
+        if name in self: return self[name]
+        return default
+
+    def peek(self, name):
+        """이미 생성된 서비스만 반환 (생성하지 않음)"""
+        return dict.get(self, name)
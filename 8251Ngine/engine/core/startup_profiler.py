@@ -0,0 +1,101 @@
+"""
+시작 시간 프로파일러
+--profile-startup 인자나 ENGINE_PROFILE_STARTUP=1 환경 변수로 켜면, 무거운 import보다 먼저 enable()이 호출되어
+모듈별 import 시간(누적/자체)과 시작 단계(mark), 서비스 생성 시간(record)을 모았다가
+첫 프레임이 그려진 직후 finish()에서 한 번 출력하고 꺼집니다. 꺼져 있으면 모든 함수가 아무 일도 하지 않습니다.
+"""
+import builtins
+import os
+import sys
+from time import perf_counter
+
+ENV_FLAG = "ENGINE_PROFILE_STARTUP"
+ARG_FLAG = "--profile-startup"
+
+class StartupProfiler:
+    def __init__(self):
+        self.start = perf_counter()
+        self.imports = {} # {모듈: [누적 ms, 자체 ms]}
+        self.marks = [] # [(이름, 시작부터 ms)]
+        self.records = [] # [(이름, ms)]
+        self._stack = []
+        self._orig_import = None
+
+    def install(self):
+        self._orig_import = builtins.__import__
+        builtins.__import__ = self._import
+
+    def uninstall(self):
+        if self._orig_import is not None:
+            builtins.__import__ = self._orig_import
+            self._orig_import = None
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        # 이미 로드된 모듈은 측정하지 않음 (함수 안의 지역 import가 매번 여기를 지남)
+        if level == 0 and name in sys.modules:
+            return self._orig_import(name, globals, locals, fromlist, level)
+
+        t0 = perf_counter()
+        self._stack.append(0.0)
+        try:
+            return self._orig_import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = (perf_counter() - t0) * 1000
+            children = self._stack.pop()
+            if self._stack: self._stack[-1] += elapsed
+            if level:
+                # 상대 import는 패키지 이름을 붙여 기록
+                package = (globals or {}).get('__package__') or ''
+                name = f"{package}.{name}" if name else package
+            entry = self.imports.setdefault(name, [0.0, 0.0])
+            entry[0] += elapsed
+            entry[1] += elapsed - children
+
+    def mark(self, label):
+        self.marks.append((label, (perf_counter() - self.start) * 1000))
+
+    def record(self, label, ms):
+        self.records.append((label, ms))
+
+    def report(self, top=15):
+        total = (perf_counter() - self.start) * 1000
+        lines = [f"[Startup] {total:.1f} ms to first frame"]
+        prev = 0.0
+        for label, at in self.marks:
+            lines.append(f"  {label:<40} +{at - prev:8.1f} ms  (at {at:.1f} ms)")
+            prev = at
+        if self.records:
+            lines.append("  services / lazy init:")
+            for label, ms in self.records:
+                lines.append(f"    {label:<38} {ms:8.2f} ms")
+        lines.append(f"  slowest imports (cumulative / self, top {top}):")
+        for name, (cum, own) in sorted(self.imports.items(), key=lambda kv: -kv[1][0])[:top]:
+            lines.append(f"    {name:<38} {cum:8.1f} / {own:6.1f} ms")
+        print("\n".join(lines))
+
+PROFILER = None
+
+def requested():
+    return ARG_FLAG in sys.argv or os.environ.get(ENV_FLAG) == "1"
+
+def enable():
+    global PROFILER
+    if PROFILER is None:
+        PROFILER = StartupProfiler()
+        PROFILER.install()
+    return PROFILER
+
+def mark(label):
+    if PROFILER: PROFILER.mark(label)
+
+def record(label, ms):
+    if PROFILER: PROFILER.record(label, ms)
+
+def finish():
+    """첫 프레임 뒤 호출: 보고서를 출력하고 import 훅을 해제"""
+    global PROFILER
+    if PROFILER is None: return
+    PROFILER.mark("first frame")
+    PROFILER.uninstall()
+    PROFILER.report()
+    PROFILER = None
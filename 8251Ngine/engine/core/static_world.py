@@ -0,0 +1,52 @@
+from engine.core.node import Node
+
+class StaticWorld(Node):
+    """
+    맵 블록처럼 배치 후 움직이지 않는 노드를 담는 컨테이너.
+    - 갱신: 자식 전체를 매 프레임 순회하지 않고, 깨어 있는(awake) 자식만 미리 모아 둔 목록으로 갱신
+    - 그리기: 보이는 노드를 미리 평탄화한 목록(drawables)으로 제출, 구성이 그대로면 Renderer가 제출 자체를 건너뜀
+    - 조명: 자손 중 조명 노드 목록(lights)을 미리 모아 둠
+    자손의 추가/제거, set_awake, Block3D.set_tile_id는 mark_dirty()로 version을 올려 목록을 다시 만들게 합니다.
+    (visible을 직접 바꾼 경우에는 mark_dirty()를 호출해야 반영됩니다)
+    """
+    def __init__(self, name="StaticWorld"):
+        super().__init__(name)
+        self.version = 0
+        self._built_version = -1
+        self._drawables = []
+        self._awake = []
+        self._lights = []
+
+    def mark_dirty(self):
+        self.version += 1
+
+    def _rebuild(self):
+        drawables, lights = [], []
+        def walk(node, visible):
+            for child in node.children:
+                child_visible = visible and child.visible
+                if child_visible: drawables.append(child)
+                if hasattr(child, 'get_light_surface'): lights.append(child)
+                walk(child, child_visible)
+        walk(self, self.visible)
+        self._drawables, self._lights = drawables, lights
+        # 잠든 노드는 Node._update와 같이 자식까지 통째로 건너뜀
+        self._awake = [child for child in self.children if child.awake]
+        self._built_version = self.version
+
+    def drawables(self):
+        """보이는 자손 노드 목록 (부모가 자식보다 먼저)"""
+        if self._built_version != self.version: self._rebuild()
+        return self._drawables
+
+    def lights(self):
+        """자손 중 조명 노드 목록 (보이지 않는 것 포함, LightingManager가 visible을 확인)"""
+        if self._built_version != self.version: self._rebuild()
+        return self._lights
+
+    def _update(self, dt, services, game_state):
+        # [최적화] 수천 개의 블록을 재귀 순회하지 않고 깨어 있는 노드만 갱신
+        if self._built_version != self.version: self._rebuild()
+        for node in self._awake:
+            node._update(dt, services, game_state)
+        self.update(dt, services, game_state)
@@ -19,6 +19,10 @@ class StatusComponent(Component):
         self.frozen_timer = 0.0 # 추가: 동결 해제까지 남은 시간
         self.node = None
 
+    @property
+    def alive(self):
+        return not self.is_dead
+
     def _on_added(self, node):
         self.node = node
         if hasattr(node, 'role'): self.role = node.role
@@ -74,20 +78,31 @@ class StatusComponent(Component):
             target_roles = ["MAFIA"]
             emotion_type = 'ANXIETY'
 
-        if emotion_type and target_roles and 'all_entities' in game_state:
-            min_dist = 999.0
-            for entity in game_state['all_entities']:
-                if entity == self.node: continue
-                if hasattr(entity, 'role') and entity.role in target_roles:
-                    dist = self.node.position.distance_to(entity.position)
-                    if dist < min_dist: min_dist = dist
-            
+        if emotion_type and target_roles and ('entities' in game_state or 'all_entities' in game_state):
+            min_dist = self._nearest_target_dist(game_state, target_roles)
             if min_dist <= 30:
                 level = max(1, 6 - int(min_dist / 5))
                 self.emotions[emotion_type] = min(5, level)
 
         if not self.emotions: self.emotions['CALM'] = 1
 
+    def _nearest_target_dist(self, game_state, target_roles):
+        """target_roles 역할을 가진 가장 가까운 엔티티까지의 거리 (반경 30 밖이면 999)"""
+        index = game_state.get('entities')
+        if index is not None:
+            # [최적화] 씬 전체(맵 블록 포함) 순회 대신 엔티티 색인에서 반경 30 안만 검사
+            pos = self.node.position
+            dist, _ = index.nearest(pos.x, pos.y, 30, exclude=self.node, predicate=lambda e: getattr(e, 'role', None) in target_roles)
+            return 999.0 if dist is None else dist
+
+        min_dist = 999.0
+        for entity in game_state['all_entities']:
+            if entity == self.node: continue
+            if hasattr(entity, 'role') and entity.role in target_roles:
+                dist = self.node.position.distance_to(entity.position)
+                if dist < min_dist: min_dist = dist
+        return min_dist
+
     def apply_emotion_effects(self, game_state):
         fear = self.emotions.get('FEAR', 0)
         pain = self.emotions.get('PAIN', 0)
@@ -1,4 +1,5 @@
 import pygame
+from engine.core import clock
 
 class TimeManager:
     PHASES = {
@@ -61,7 +62,7 @@ class TimeManager:
         # Ambient color should also be synced or smoothly transitioned
         self.current_ambient = self.PHASES[self.current_phase]['ambient']
         self.target_ambient = self.current_ambient # Instantly sync ambient color
-        self.last_tick = time.time() # Reset last_tick to prevent large dt next update
+        self.last_tick = clock.now() # Reset last_tick to prevent large dt next update
 
     def _lerp_ambient(self, dt):
         # Smooth transition speed
@@ -2,12 +2,55 @@ import pygame
 from engine.core.node import Node
 from engine.graphics.geometry import IsoGeometry
 from engine.core.math_utils import TILE_WIDTH, TILE_HEIGHT, HEIGHT_SCALE
-from engine.assets.tile_engine import TileEngine
+from engine.assets.tile_engine import TileEngine, ISO_DIAMOND
 
 # Global cache to prevent redundant surface creation
 BLOCK_CACHE = {}
 
+def render_block_surface(tile_id, size_z, color, top=None):
+    """
+    Draws one block image: cube sides (unless floor) + iso top texture.
+    top: diamond top face from TileEngine.get_top (the atlas builder passes its own)
+    """
+    # Use TileEngine's helper to get category
+    category = TileEngine.get_tile_category(tile_id) if tile_id else 0
+    
+    is_floor = (category == 1 or category == 2) or size_z < 0.1
+    
+    visual_height_px = 0 if is_floor else int(size_z * HEIGHT_SCALE)
+    
+    # Surface Height: Tile Height + Wall/Block Height
+    surf_h = TILE_HEIGHT + visual_height_px
+    surf = pygame.Surface((TILE_WIDTH, surf_h), pygame.SRCALPHA)
+    
+    draw_color = color
+    if tile_id and tile_id in TileEngine.TILE_DATA:
+        draw_color = TileEngine.TILE_DATA[tile_id]['color']
+    
+    # 1. Base Geometry (Sides for walls)
+    if not is_floor:
+        # Draw simple cube base for sides
+        IsoGeometry.draw_cube(surf, TILE_WIDTH // 2, visual_height_px, TILE_WIDTH, TILE_HEIGHT, visual_height_px, draw_color)
+
+    # 2. Top Texture Mapping (already scaled and masked to the diamond)
+    if tile_id:
+        # For walls, top is at (0, 0). For floors, it's also at (0, 0) but they have no height offset in logic usually,
+        # but visual_height_px is 0 for floor, so it works.
+        surf.blit(top if top is not None else TileEngine.get_top(tile_id), (0, 0))
+        
+        # Overlay border for definition
+        pygame.draw.polygon(surf, (0, 0, 0, 40), ISO_DIAMOND, 1)
+
+    else:
+         # Fallback if no tile_id but color exists
+         if is_floor:
+             IsoGeometry.draw_cube(surf, TILE_WIDTH // 2, 0, TILE_WIDTH, TILE_HEIGHT, 2, draw_color) # Thin plate
+    return surf
+
 class Block3D(Node):
+    is_static = True # 맵 블록은 배치 후 이동하지 않음 (Renderer 유지형 렌더 그래프 대상)
+    awake = False # 매 프레임 갱신할 것이 없음 (_update 순회에서 자식과 함께 제외)
+
     def __init__(self, name="Block", size_z=1.0, color=(150, 150, 150), zone_id=0, interact_type="NONE", tile_id=None):
         super().__init__(name)
         self.size_z = size_z # 시각적 높이
@@ -25,56 +68,11 @@ class Block3D(Node):
             self.cached_surf = BLOCK_CACHE[cache_key]
             return
 
-        sid = str(self.tile_id) if self.tile_id else ""
-        # Use TileEngine's helper to get category
-        category = TileEngine.get_tile_category(self.tile_id) if self.tile_id else 0
-        
-        is_floor = (category == 1 or category == 2) or self.size_z < 0.1
-        
-        visual_height_px = 0 if is_floor else int(self.size_z * HEIGHT_SCALE)
-        
-        # Surface Height: Tile Height + Wall/Block Height
-        surf_h = TILE_HEIGHT + visual_height_px
-        surf = pygame.Surface((TILE_WIDTH, surf_h), pygame.SRCALPHA)
-        
-        draw_color = self.color
-        if self.tile_id and self.tile_id in TileEngine.TILE_DATA:
-            draw_color = TileEngine.TILE_DATA[self.tile_id]['color']
-        
-        # 1. Base Geometry (Sides for walls)
-        if not is_floor:
-            # Draw simple cube base for sides
-            IsoGeometry.draw_cube(surf, TILE_WIDTH // 2, visual_height_px, TILE_WIDTH, TILE_HEIGHT, visual_height_px, draw_color)
-
-        # 2. Top Texture Mapping
-        if self.tile_id:
-            tile_tex = TileEngine.create_texture(self.tile_id)
-            # Resize texture to fit the isometric diamond shape roughly (naive mapping)
-            # Better approach: Rotate 45deg and scale Y by 0.5
-            
-            # Create diamond mask
-            mask = pygame.Surface((TILE_WIDTH, TILE_HEIGHT), pygame.SRCALPHA)
-            points = [(TILE_WIDTH // 2, 0), (TILE_WIDTH, TILE_HEIGHT // 2), (TILE_WIDTH // 2, TILE_HEIGHT), (0, TILE_HEIGHT // 2)]
-            pygame.draw.polygon(mask, (255, 255, 255, 255), points)
-            
-            # Prepare Texture
-            scaled_tex = pygame.transform.scale(tile_tex, (TILE_WIDTH, TILE_HEIGHT))
-            
-            # Apply Mask
-            scaled_tex.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-            
-            # Blit to Surface top
-            # For walls, top is at (0, 0). For floors, it's also at (0, 0) but they have no height offset in logic usually,
-            # but visual_height_px is 0 for floor, so it works.
-            surf.blit(scaled_tex, (0, 0))
-            
-            # Overlay border for definition
-            pygame.draw.polygon(surf, (0, 0, 0, 40), points, 1)
-
-        else:
-             # Fallback if no tile_id but color exists
-             if is_floor:
-                 IsoGeometry.draw_cube(surf, TILE_WIDTH // 2, 0, TILE_WIDTH, TILE_HEIGHT, 2, draw_color) # Thin plate
+        # [최적화] 아틀라스에 카테고리 기본 높이로 미리 그려 둔 블록이 있으면 그대로 사용
+        surf = TileEngine.get_block(self.tile_id, self.size_z) if self.tile_id else None
+        if surf is None:
+            top = TileEngine.get_top(self.tile_id) if self.tile_id else None
+            surf = render_block_surface(self.tile_id, self.size_z, self.color, top)
 
         BLOCK_CACHE[cache_key] = surf
         self.cached_surf = surf
@@ -84,6 +82,7 @@ class Block3D(Node):
         self.tile_id = new_tile_id
         # Invalidate current surface and regen
         self._regen_texture()
+        self.mark_dirty() # StaticWorld/Renderer가 바뀐 텍스처를 다시 제출하도록
 
     def get_sprite(self):
         return self.cached_surf
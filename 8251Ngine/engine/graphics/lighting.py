@@ -5,19 +5,26 @@ from engine.core.node import Node
 from engine.core.math_utils import IsoMath
 
 class LightSource(Node):
+    # [최적화] 같은 설정(반경/색/세기)의 조명(맵 가로등 등)은 원 서피스 한 장을 공유
+    _shared_surfaces = {} # {stamp_key: Surface}
+    SHARED_SURFACE_LIMIT = 256
+
     def __init__(self, name="Light", radius=200, color=(255, 255, 200), intensity=1.0):
         super().__init__(name)
         self.radius = radius
         self.color = color
         self.intensity = intensity
-        self._cache_surf = None
-        self._cache_key = None
+
+    def stamp_key(self):
+        """get_light_surface()의 모양을 결정하는 값 (LightingManager 스탬프 캐시 키)"""
+        return (self.radius, self.color, self.intensity)
 
     def get_light_surface(self):
         """Returns a cached light circle surface with smooth gradient"""
-        key = (self.radius, self.color, self.intensity)
-        if self._cache_surf and self._cache_key == key:
-            return self._cache_surf
+        key = self.stamp_key()
+        surf = LightSource._shared_surfaces.get(key)
+        if surf is not None:
+            return surf
         
         size = int(self.radius * 2)
         surf = pygame.Surface((size, size), pygame.SRCALPHA)
@@ -31,8 +38,8 @@ class LightSource(Node):
             alpha = int(max_alpha * (1 - progress * progress)) 
             pygame.draw.circle(surf, (*self.color, alpha // steps), center, int(r))
             
-        self._cache_surf = surf
-        self._cache_key = key
+        if len(LightSource._shared_surfaces) >= LightSource.SHARED_SURFACE_LIMIT: LightSource._shared_surfaces.clear()
+        LightSource._shared_surfaces[key] = surf
         return surf
 
 class DirectionalLight(Node):
@@ -53,7 +60,10 @@ class LightingManager:
         self.lightmap_h = int(height * self.scale_factor)
         
         self.lightmap = pygame.Surface((self.lightmap_w, self.lightmap_h))
+        self._reset_buffers()
+        self._stamps = {} # {(stamp_key, scale_factor): 축소된 조명 스탬프 | None}
         self.lights = [] # Point Lights
+        self._light_set = set() # 중복 등록 검사용 (lights 리스트 선형 탐색 대신)
         self.directional_light = None # Single Sun/Moon
         
         # Weather & Environment
@@ -62,10 +72,30 @@ class LightingManager:
         self.clarity = 255 
         self.particles = []
 
+    def _composite(self, sun, stamps, screen_poly):
+        self.lightmap.fill(self.ambient_color)
+        if sun: self.lightmap.fill(sun, special_flags=pygame.BLEND_RGB_ADD)
+        if stamps: self.lightmap.blits(stamps, doreturn=False)
+
+        if screen_poly is not None:
+            mask_surf = self._mask_surf
+            mask_surf.fill((0, 0, 0, 0))
+            if len(screen_poly) > 2:
+                pygame.draw.polygon(mask_surf, (255, 255, 255, self.clarity), screen_poly)
+                pygame.draw.lines(mask_surf, (255, 255, 255, self.clarity // 2), True, screen_poly, width=6)
+                self.lightmap.blit(mask_surf, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+
+        if self.weather_type == 'FOG':
+            self.lightmap.fill((100, 100, 110), special_flags=pygame.BLEND_RGB_MULT)
+
+        pygame.transform.smoothscale(self.lightmap, (self.width, self.height), self._full_lightmap)
+
     def set_directional_light(self, light):
         self.directional_light = light
 
     def add_light(self, light):
+        if light in self._light_set: return
+        self._light_set.add(light)
         self.lights.append(light)
 
     def update_resolution(self, width, height):
@@ -75,6 +105,27 @@ class LightingManager:
         self.lightmap_w = int(width * self.scale_factor)
         self.lightmap_h = int(height * self.scale_factor)
         self.lightmap = pygame.Surface((self.lightmap_w, self.lightmap_h))
+        self._reset_buffers()
+
+    def _reset_buffers(self):
+        # [최적화] FOV 마스크 / 화면 크기 라이트맵은 해상도가 바뀔 때만 새로 만들고 매 프레임 재사용
+        self._mask_surf = pygame.Surface((self.lightmap_w, self.lightmap_h), pygame.SRCALPHA)
+        self._full_lightmap = pygame.Surface((self.width, self.height), 0, self.lightmap)
+        self._composite_key = None # 마지막으로 합성한 입력 (같으면 합성 생략)
+
+    def _get_stamp(self, light):
+        """라이트맵 배율로 미리 축소해 둔 조명 스탬프 (너무 작으면 None)"""
+        key = (light.stamp_key(), self.scale_factor)
+        if key in self._stamps: return self._stamps[key]
+        lsurf = light.get_light_surface()
+        target_w = int(lsurf.get_width() * self.scale_factor)
+        target_h = int(lsurf.get_height() * self.scale_factor)
+        stamp = None
+        if target_w >= 1 and target_h >= 1:
+            stamp = pygame.transform.smoothscale(lsurf, (target_w, target_h))
+        if len(self._stamps) >= LightSource.SHARED_SURFACE_LIMIT: self._stamps.clear()
+        self._stamps[key] = stamp
+        return stamp
 
     def update_weather(self, dt):
         """Update weather particles"""
@@ -98,51 +149,43 @@ class LightingManager:
             self.particles.clear()
 
     def render(self, screen, camera, fov_polygon=None):
-        self.lightmap.fill(self.ambient_color)
-        
+        sf = self.scale_factor
+        sun = None
         if self.directional_light and self.directional_light.intensity > 0:
             r = int(self.directional_light.color[0] * self.directional_light.intensity)
             g = int(self.directional_light.color[1] * self.directional_light.intensity)
             b = int(self.directional_light.color[2] * self.directional_light.intensity)
-            self.lightmap.fill((r, g, b), special_flags=pygame.BLEND_RGB_ADD)
-        
+            sun = (r, g, b)
+
+        # 1. 화면 안의 조명 스탬프와 위치 수집
+        stamps = []
         for light in self.lights:
             if not light.visible: continue
             gpos = light.get_global_position()
             sx, sy = camera.world_to_screen(*IsoMath.cart_to_iso(gpos.x, gpos.y, gpos.z))
-            lx = int(sx * self.scale_factor)
-            ly = int(sy * self.scale_factor)
-            l_rad = light.radius * self.scale_factor
+            lx = int(sx * sf)
+            ly = int(sy * sf)
+            l_rad = light.radius * sf
             if not (-l_rad < lx < self.lightmap_w + l_rad and -l_rad < ly < self.lightmap_h + l_rad): continue
 
-            lsurf = light.get_light_surface()
-            target_w = int(lsurf.get_width() * self.scale_factor)
-            target_h = int(lsurf.get_height() * self.scale_factor)
-            if target_w < 1 or target_h < 1: continue
-            
-            scaled_light = pygame.transform.smoothscale(lsurf, (target_w, target_h))
-            dest_rect = scaled_light.get_rect(center=(lx, ly))
-            self.lightmap.blit(scaled_light, dest_rect, special_flags=pygame.BLEND_RGB_ADD)
+            stamp = self._get_stamp(light)
+            if stamp is None: continue
+            w, h = stamp.get_size()
+            stamps.append((stamp, (lx - w // 2, ly - h // 2), None, pygame.BLEND_RGB_ADD))
 
+        screen_poly = None
         if fov_polygon:
-            mask_surf = pygame.Surface((self.lightmap_w, self.lightmap_h), pygame.SRCALPHA)
             screen_poly = []
             for px, py in fov_polygon:
                 sx, sy = camera.world_to_screen(*IsoMath.cart_to_iso(px, py))
-                screen_poly.append((int(sx * self.scale_factor), int(sy * self.scale_factor)))
-            
-            if len(screen_poly) > 2:
-                pygame.draw.polygon(mask_surf, (255, 255, 255, self.clarity), screen_poly)
-                pygame.draw.lines(mask_surf, (255, 255, 255, self.clarity // 2), True, screen_poly, width=6)
-                self.lightmap.blit(mask_surf, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-
-        if self.weather_type == 'FOG':
-            fog_surf = pygame.Surface((self.lightmap_w, self.lightmap_h))
-            fog_surf.fill((100, 100, 110))
-            self.lightmap.blit(fog_surf, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
+                screen_poly.append((int(sx * sf), int(sy * sf)))
 
-        full_lightmap = pygame.transform.smoothscale(self.lightmap, (self.width, self.height))
-        screen.blit(full_lightmap, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+        # 2. [최적화] 카메라/조명/환경광/시야가 지난 프레임과 같으면 합성된 라이트맵을 그대로 사용
+        key = (self.ambient_color, sun, stamps, screen_poly, self.clarity, self.weather_type == 'FOG')
+        if key != self._composite_key:
+            self._composite(sun, stamps, screen_poly)
+            self._composite_key = key
+        screen.blit(self._full_lightmap, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
 
         if self.weather_type == 'RAIN':
             for p in self.particles:
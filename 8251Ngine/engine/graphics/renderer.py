@@ -1,15 +1,37 @@
+import heapq
 import pygame
 from engine.graphics.camera import Camera
 from engine.core.math_utils import IsoMath, TILE_HEIGHT
 from engine.graphics.shadow_renderer import ShadowRenderer
-from settings import ENABLE_SHADOWS, SHADOW_QUALITY, USE_CULLING
+from engine.graphics.sprite_cache import ScaledSpriteCache
+from engine.core.frame_profiler import PROFILER
+from settings import ENABLE_SHADOWS, SHADOW_QUALITY, USE_CULLING, SPRITE_CACHE_MB
 
 class Renderer:
+    FLOOR_CHUNK_SIZE = 8 # 바닥 청크 한 변의 타일 수 (8x8 타일 = 약 512x256px)
+
     def __init__(self, screen):
         self.screen = screen
         self.camera = Camera()
-        self.render_queue = [] # 바닥과 물체 모두 임시 저장
+        self.render_queue = [] # 동적 노드(캐릭터, 투사체 등)만 매 프레임 임시 저장
         self.clip_rect = None 
+
+        # [최적화] 정적 노드(Block3D 등) 유지형 렌더 그래프
+        # 한 번 등록되면 iso 위치/깊이를 다시 계산하지 않고 깊이순 정렬 상태로 유지됨
+        self._static_entries = {} # {node: entry}
+        self._static_objects = [] # 깊이순 정렬된 벽/물체 엔트리
+        self._static_dirty = False # 새 엔트리 추가로 재정렬이 필요한지
+        self._static_seen = 0 # 이번 프레임에 submit된 정적 노드 수
+        self._frame = 0
+        self._worlds = {} # {StaticWorld: (제출한 version, 등록된 엔트리 수)}
+        self._retained = set() # 이번 프레임에 제출 없이 유지된 StaticWorld
+        
+        # [최적화] 정적 바닥은 NxN 타일 청크 단위로 한 장의 서피스에 미리 합성 (PxANIC! _floor_cache와 동일 개념)
+        self._floor_chunks = {} # {(cx, cy): {'entries': [...], 'surf': Surface|None, 'rect': Rect|None, 'dirty': bool}}
+        self._floor_chunk_order = [] # 그리기 순서 (cx + cy 오름차순)
+        
+        # [최적화] 줌 배율별 스케일 스프라이트 캐시 (매 프레임 transform.scale 방지)
+        self.sprite_cache = ScaledSpriteCache(SPRITE_CACHE_MB * 1024 * 1024)
         
         self.camera.update_viewport(screen.get_width(), screen.get_height())
         
@@ -24,44 +46,144 @@ class Renderer:
 
     def clear_queue(self):
         self.render_queue.clear()
+        self._frame += 1
+        self._static_seen = 0
+        self._retained.clear()
+
+    def clear_static(self):
+        """씬 교체 시 유지 중인 정적 렌더 엔트리를 모두 비웁니다."""
+        self._static_entries.clear()
+        self._static_objects.clear()
+        self._floor_chunks.clear()
+        self._floor_chunk_order = []
+        self._static_dirty = False
+        self._worlds.clear()
+        self.sprite_cache.clear()
+
+    def _make_entry(self, node, sprite):
+        gpos = node.get_global_position()
+
+        # [수정] 픽셀 위치 계산
+        iso_x, iso_y = IsoMath.cart_to_iso(gpos.x, gpos.y, gpos.z)
+
+        # [수정] 깊이 계산 (정수형으로 변환하여 깜빡임 방지)
+        depth = IsoMath.get_depth(gpos.x, gpos.y, gpos.z)
+
+        # 바닥 여부 확인 (높이가 0.1 미만이면 바닥 취급)
+        is_floor = getattr(node, 'size_z', 0) < 0.1
+
+        # 캐릭터(GameEntity/Player)는 size_z가 없어도 무조건 물체 레이어로 분류
+        # GameEntity는 role을 가짐. NpcEntity도 GameEntity 상속받아 role 가짐.
+        if hasattr(node, 'role') or hasattr(node, 'is_moving'):
+            is_floor = False # 캐릭터나 움직이는 엔티티는 무조건 오브젝트로
+
+        return {
+            'is_floor': is_floor, # 레이어 구분을 위한 플래그
+            'depth': depth,
+            'sprite': sprite,
+            'pos': (iso_x, iso_y),
+            'scale': node.scale,
+            'node': node
+        }
+
+    def register_static(self, node):
+        """
+        움직이지 않는 노드를 유지형 렌더 그래프에 등록합니다.
+        위치/깊이는 등록 시 한 번만 계산되고, 정렬은 다음 flush에서 한 번만 수행됩니다.
+        """
+        sprite = node.get_sprite()
+        if not sprite: return None
+        entry = self._make_entry(node, sprite)
+        entry['seen'] = self._frame
+        self._static_entries[node] = entry
+        if entry['is_floor']:
+            gpos = node.get_global_position()
+            n = self.FLOOR_CHUNK_SIZE
+            key = (int(gpos.x) // n, int(gpos.y) // n)
+            chunk = self._floor_chunks.get(key)
+            if chunk is None:
+                chunk = {'entries': [], 'surf': None, 'rect': None, 'dirty': True}
+                self._floor_chunks[key] = chunk
+                self._floor_chunk_order = sorted(self._floor_chunks, key=lambda k: (k[0] + k[1], k[1]))
+            entry['chunk'] = key
+            chunk['entries'].append(entry)
+            chunk['dirty'] = True
+        else:
+            self._static_objects.append(entry)
+            self._static_dirty = True
+        return entry
+
+    def unregister_static(self, node):
+        entry = self._static_entries.pop(node, None)
+        if entry is None: return
+        if entry['is_floor']:
+            self._remove_from_chunk(entry)
+        else:
+            self._static_objects.remove(entry)
+
+    def _remove_from_chunk(self, entry):
+        key = entry['chunk']
+        chunk = self._floor_chunks[key]
+        chunk['entries'].remove(entry)
+        chunk['dirty'] = True
+        if not chunk['entries']:
+            if chunk['surf'] is not None: self.sprite_cache.discard(chunk['surf'])
+            del self._floor_chunks[key]
+            self._floor_chunk_order.remove(key)
 
     def submit(self, node):
+        if node.is_static:
+            # [최적화] 정적 노드는 엔트리를 재사용하고 '이번 프레임에 보임' 표시만 갱신
+            entry = self._static_entries.get(node)
+            if entry is None:
+                entry = self.register_static(node)
+                if entry is None: return
+            else:
+                sprite = node.get_sprite()
+                if not sprite: return
+                if entry['sprite'] is not sprite:
+                    # set_tile_id로 텍스처가 바뀐 경우 반영 (위치/깊이는 불변) - 바닥이면 해당 청크만 무효화
+                    entry['sprite'] = sprite
+                    if entry['is_floor']: self._floor_chunks[entry['chunk']]['dirty'] = True
+                entry['seen'] = self._frame
+            self._static_seen += 1
+            return
+
         if hasattr(node, 'get_sprite'):
             sprite = node.get_sprite()
             if sprite:
-                gpos = node.get_global_position()
-                
-                # [수정] 픽셀 위치 계산
-                iso_x, iso_y = IsoMath.cart_to_iso(gpos.x, gpos.y, gpos.z)
-                
-                # [수정] 깊이 계산 (정수형으로 변환하여 깜빡임 방지)
-                depth = IsoMath.get_depth(gpos.x, gpos.y, gpos.z)
-                
-                # 바닥 여부 확인 (높이가 0.1 미만이면 바닥 취급)
-                is_floor = getattr(node, 'size_z', 0) < 0.1
-                
-                # 캐릭터(GameEntity/Player)는 size_z가 없어도 무조건 물체 레이어로 분류
-                # GameEntity는 role을 가짐. NpcEntity도 GameEntity 상속받아 role 가짐.
-                if hasattr(node, 'role') or hasattr(node, 'is_moving'): 
-                    is_floor = False # 캐릭터나 움직이는 엔티티는 무조건 오브젝트로
-
-                self.render_queue.append({
-                    'is_floor': is_floor, # 레이어 구분을 위한 플래그
-                    'depth': depth,
-                    'sprite': sprite,
-                    'pos': (iso_x, iso_y),
-                    'scale': node.scale,
-                    'node': node
-                })
+                self.render_queue.append(self._make_entry(node, sprite))
+
+    def submit_static_world(self, world):
+        """
+        StaticWorld의 보이는 노드를 제출합니다.
+        [최적화] 지난 제출 이후 구성이 바뀌지 않았으면(version 동일) 노드를 하나도 순회하지 않고 엔트리를 그대로 유지합니다.
+        """
+        submitted = self._worlds.get(world)
+        if submitted and submitted[0] == world.version:
+            self._retained.add(world)
+            self._static_seen += submitted[1]
+            return
+
+        seen_before = self._static_seen
+        for node in world.drawables():
+            self.submit(node)
+            entry = self._static_entries.get(node)
+            if entry is not None: entry['world'] = world
+        self._worlds[world] = (world.version, self._static_seen - seen_before)
 
     def flush(self, services):
         self.camera.update()
+        # 줌을 양자화하여 스케일 캐시 키를 안정화 (위치 계산도 같은 값을 사용해야 청크 사이 틈이 생기지 않음)
+        self.camera.zoom = ScaledSpriteCache.quantize(self.camera.zoom)
         zoom = self.camera.zoom
         
         if self.clip_rect:
             self.screen.set_clip(self.clip_rect)
 
-        # 1. 큐 분리 (바닥 vs 물체)
+        self._sync_static()
+
+        # 1. 동적 큐 분리 (바닥 vs 물체) - 정적 노드는 이미 레이어별로 정렬되어 있음
         floors = []
         objects = []
         
@@ -71,20 +193,90 @@ class Renderer:
             else:
                 objects.append(item)
 
+        # 동적 노드 수만큼만 정렬 (맵 크기와 무관)
+        floors.sort(key=lambda x: x['depth'])
+        objects.sort(key=lambda x: x['depth'])
+
         # [최적화] 그림자 처리 (물체만 생성, 바닥 위 & 물체 아래에 그려짐)
         if ENABLE_SHADOWS: # settings에서 ENABLE_SHADOWS 설정 확인
-            self._render_shadows(services, objects) # _render_shadows는 항상 services와 objects를 받음
+            with PROFILER.scope("shadows"): self._render_shadows(services, self._merge_layer(self._static_objects, objects)) # _render_shadows는 항상 services와 objects를 받음
 
-        # 2. 바닥 먼저 그리기 (배경) - 깊이 순 정렬
-        floors.sort(key=lambda x: x['depth'])
-        self._render_list(floors, zoom)
+        # 2. 바닥 먼저 그리기 (배경) - 정적 바닥은 청크 단위로, 동적 바닥은 개별로
+        with PROFILER.scope("floor"):
+            self._render_floor_chunks(zoom)
+            self._render_list(floors, zoom)
 
         # 3. 물체 그리기 (전경) - 바닥을 덮어씀
-        objects.sort(key=lambda x: x['depth'])
-        self._render_list(objects, zoom)
+        with PROFILER.scope("objects"): self._render_list(self._merge_layer(self._static_objects, objects), zoom)
 
         self.screen.set_clip(None)
 
+    def _sync_static(self):
+        """이번 프레임에 submit되지 않은 정적 엔트리(제거/숨김)를 정리하고 필요 시 재정렬합니다."""
+        if self._static_seen < len(self._static_entries):
+            frame = self._frame
+            # 제출 없이 유지된 StaticWorld의 엔트리는 이번 프레임에 본 것으로 취급
+            retained = self._retained
+            def is_stale(e): return e['seen'] != frame and e.get('world') not in retained
+            stale = [n for n, e in self._static_entries.items() if is_stale(e)]
+            for node in stale:
+                entry = self._static_entries.pop(node)
+                if entry['is_floor']: self._remove_from_chunk(entry)
+            self._static_objects = [e for e in self._static_objects if not is_stale(e)]
+
+        if self._static_dirty:
+            # 대부분 이미 정렬된 목록이므로 Timsort가 사실상 선형 시간에 끝남
+            self._static_objects.sort(key=lambda x: x['depth'])
+            self._static_dirty = False
+
+    @staticmethod
+    def _merge_layer(static_items, dynamic_items):
+        """정렬된 정적/동적 목록을 깊이 기준으로 병합 (같은 깊이에서는 정적 노드가 먼저)"""
+        if not dynamic_items: return static_items
+        if not static_items: return dynamic_items
+        return heapq.merge(static_items, dynamic_items, key=lambda x: x['depth'])
+
+    def _bake_floor_chunk(self, chunk):
+        """청크 안의 바닥 스프라이트를 깊이순으로 한 장의 서피스에 합성 (iso 월드 좌표, 줌 1 기준)"""
+        entries = sorted(chunk['entries'], key=lambda x: x['depth'])
+        rects = []
+        for item in entries:
+            px, py = item['pos']
+            rects.append(item['sprite'].get_rect(midbottom=(round(px), round(py) + TILE_HEIGHT)))
+        
+        bounds = rects[0].unionall(rects[1:])
+        if chunk['surf'] is not None: self.sprite_cache.discard(chunk['surf'])
+        surf = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        for item, rect in zip(entries, rects):
+            surf.blit(item['sprite'], (rect.x - bounds.x, rect.y - bounds.y))
+        
+        chunk['surf'] = surf
+        chunk['rect'] = bounds
+        chunk['dirty'] = False
+
+    def _render_floor_chunks(self, zoom):
+        screen_rect = self.clip_rect or self.screen.get_rect()
+        
+        for key in self._floor_chunk_order:
+            chunk = self._floor_chunks[key]
+            if chunk['dirty']:
+                self._bake_floor_chunk(chunk)
+            
+            bounds = chunk['rect']
+            sx, sy = self.camera.world_to_screen(bounds.x, bounds.y)
+            w = int(bounds.w * zoom)
+            h = int(bounds.h * zoom)
+            if w < 1 or h < 1: continue
+            
+            # 청크 단위 컬링
+            if USE_CULLING and not screen_rect.colliderect((sx, sy, w, h)):
+                continue
+            
+            img = chunk['surf']
+            if zoom != 1.0:
+                img = self.sprite_cache.get(img, zoom, (w, h))
+            self.screen.blit(img, (sx, sy))
+
     def _render_shadows(self, services, objects):
         time_manager = services.get("time")
         # 밤이거나 그림자 설정 꺼짐이면 패스
@@ -129,10 +321,8 @@ class Renderer:
             img = item['sprite']
             
             if zoom != 1.0:
-                w = int(img.get_width() * zoom)
-                h = int(img.get_height() * zoom)
-                if w < 1 or h < 1: continue
-                img = pygame.transform.scale(img, (w, h))
+                img = self.sprite_cache.get(img, zoom)
+                if img is None: continue
             
             offset_y = offset_y_base * zoom 
             rect = img.get_rect(midbottom=(sx, sy + offset_y))
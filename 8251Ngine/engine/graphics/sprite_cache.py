@@ -0,0 +1,74 @@
+import pygame
+from collections import OrderedDict
+
+class ScaledSpriteCache:
+    """
+    줌 배율별로 스케일된 스프라이트를 캐싱합니다.
+    키는 (원본 서피스 id, 양자화된 줌)이며, 바이트 예산을 넘으면 가장 오래 안 쓴 항목부터 제거(LRU)합니다.
+    원본 서피스 참조를 함께 보관하므로 캐시에 있는 동안 id가 재사용되지 않습니다.
+    """
+    ZOOM_STEP = 0.01 # 줌 양자화 단위
+
+    def __init__(self, budget_bytes=64 * 1024 * 1024):
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        self._entries = OrderedDict() # {(id(src), qzoom): (src, scaled, nbytes)}
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def quantize(cls, zoom):
+        return round(round(zoom / cls.ZOOM_STEP) * cls.ZOOM_STEP, 4)
+
+    def get(self, surf, zoom, size=None):
+        """
+        surf를 zoom 배율로 스케일한 서피스를 반환합니다. (zoom은 quantize된 값이어야 함)
+        size를 주면 그 크기로 스케일합니다. 너무 작아지면 None.
+        """
+        key = (id(surf), zoom)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        if size is None:
+            size = (int(surf.get_width() * zoom), int(surf.get_height() * zoom))
+        if size[0] < 1 or size[1] < 1: return None
+
+        scaled = pygame.transform.scale(surf, size)
+        nbytes = size[0] * size[1] * scaled.get_bytesize()
+        self._entries[key] = (surf, scaled, nbytes)
+        self.used_bytes += nbytes
+        self._evict()
+        return scaled
+
+    def discard(self, surf):
+        """원본 서피스가 더 이상 쓰이지 않을 때(청크 재합성 등) 관련 항목을 즉시 제거"""
+        sid = id(surf)
+        for key in [k for k, e in self._entries.items() if k[0] == sid and e[0] is surf]:
+            self.used_bytes -= self._entries.pop(key)[2]
+
+    def clear(self):
+        self._entries.clear()
+        self.used_bytes = 0
+
+    def _evict(self):
+        while self.used_bytes > self.budget_bytes and len(self._entries) > 1:
+            _, (_, _, nbytes) = self._entries.popitem(last=False)
+            self.used_bytes -= nbytes
+            self.evictions += 1
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'bytes': self.used_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / total if total else 0.0
+        }
@@ -27,24 +27,8 @@ class TileNode(Node):
         if self.layer == 0: # Flat Floor (바닥)
             # Transform 32x32 Flat -> 64x32 Isometric Diamond (Screen Aligned)
             # 회전하지 않고 가로 2배, 세로 1배로 늘린 후 마름모 마스킹
-            
-            # 1. Scale: Width 200%, Height 100%
-            # (Perspective Squash: 사실상 높이가 50% 줄어든 효과)
-            scaled = pygame.transform.scale(tex, (TILE_WIDTH, TILE_HEIGHT))
-            
-            # 2. Masking to Diamond
-            mask = pygame.Surface((TILE_WIDTH, TILE_HEIGHT), pygame.SRCALPHA)
-            points = [
-                (TILE_WIDTH // 2, 0),
-                (TILE_WIDTH, TILE_HEIGHT // 2),
-                (TILE_WIDTH // 2, TILE_HEIGHT),
-                (0, TILE_HEIGHT // 2)
-            ]
-            pygame.draw.polygon(mask, (255, 255, 255), points)
-            
-            # 3. Apply Mask
-            self.sprite = scaled.copy()
-            self.sprite.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+            # [최적화] 아틀라스에 미리 만들어 둔 마름모 윗면 사용
+            self.sprite = TileEngine.get_top(self.tid)
             
             self.size_z = 0.05 
 
@@ -3,6 +3,7 @@ import websockets
 import json
 import threading
 from asyncio import Queue
+from engine.net.snapshot import MSG_SNAPSHOT, message_type, peek_snapshot, decode_snapshot, encode_ack, encode_move
 
 class NetworkManager:
     def __init__(self, uri):
@@ -15,6 +16,10 @@ class NetworkManager:
         self.thread = None
         self.running = False
 
+        # 델타 스냅샷 복원용 (ack한 틱의 상태를 기준으로 다음 델타를 적용)
+        self.snapshot_states = {0: {}} # {tick: {entity_id: (x, y, fx, fy, is_moving)}}
+        self.last_snapshot_tick = 0
+
     def start(self):
         self.running = True
         self.thread = threading.Thread(target=self._run_event_loop, daemon=True)
@@ -35,6 +40,8 @@ class NetworkManager:
             try:
                 async with websockets.connect(self.uri) as websocket:
                     self.websocket = websocket
+                    self.snapshot_states = {0: {}}
+                    self.last_snapshot_tick = 0
                     print("Connected to server.")
                     
                     initial_message = await websocket.recv()
@@ -66,16 +73,40 @@ class NetworkManager:
     async def _receive_handler(self):
         try:
             async for message in self.websocket:
+                if isinstance(message, bytes):
+                    await self._handle_binary(message)
+                    continue
                 await self.incoming_messages.put(json.loads(message))
         except:
             pass
 
+    async def _handle_binary(self, data):
+        if message_type(data) != MSG_SNAPSHOT: return
+        tick, base_tick = peek_snapshot(data)
+        if tick <= self.last_snapshot_tick: return
+        base = self.snapshot_states.get(base_tick)
+        if base is None: return # 기준 상태가 없으면 서버가 전체 스냅샷을 보낼 때까지 무시
+
+        tick, state, changed, removed = decode_snapshot(data, base)
+        self.snapshot_states = {t: s for t, s in self.snapshot_states.items() if t >= base_tick}
+        self.snapshot_states[tick] = state
+        self.last_snapshot_tick = tick
+        await self.websocket.send(encode_ack(tick))
+
+        # 기존 MOVE 처리 경로(set_network_state)를 그대로 쓰도록 바뀐 엔티티만 MOVE 메시지로 변환
+        for eid in changed:
+            x, y, fx, fy, is_moving = state[eid]
+            await self.incoming_messages.put({
+                "type": "MOVE", "id": eid, "x": x, "y": y,
+                "is_moving": is_moving, "facing": [fx, fy]
+            })
+
     async def _send_handler(self):
         try:
             while True:
                 message = await self.outgoing_messages.get()
                 if self.websocket:
-                    await self.websocket.send(json.dumps(message))
+                    await self.websocket.send(message if isinstance(message, bytes) else json.dumps(message))
                 self.outgoing_messages.task_done()
         except asyncio.CancelledError:
             pass
@@ -96,15 +127,9 @@ class NetworkManager:
         return messages
 
     def send_move(self, x, y, is_moving, facing_dir, ent_id=None):
-        msg = {
-            "type": "MOVE",
-            "id": ent_id if ent_id else self.client_id,
-            "x": x,
-            "y": y,
-            "is_moving": is_moving,
-            "facing": [int(facing_dir.x), int(facing_dir.y)]
-        }
-        self.send(msg)
+        # [최적화] JSON 대신 고정 크기 바이너리로 전송 (서버가 모아서 스냅샷으로 배포)
+        eid = ent_id if ent_id else self.client_id
+        self.send(encode_move(eid, x, y, is_moving, int(facing_dir.x), int(facing_dir.y)))
 
     def stop(self):
         self.running = False
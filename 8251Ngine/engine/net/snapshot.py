@@ -0,0 +1,111 @@
+import struct
+
+# 바이너리 메시지 종류 (첫 바이트)
+MSG_SNAPSHOT = 1 # 서버 -> 클라이언트: 델타 스냅샷
+MSG_ACK = 2      # 클라이언트 -> 서버: 받은 스냅샷 틱 확인
+MSG_MOVE = 3     # 클라이언트 -> 서버: 엔티티 상태 입력
+
+# 엔티티 필드 마스크
+FIELD_X = 0x01
+FIELD_Y = 0x02
+FIELD_FACING = 0x04
+FIELD_MOVING = 0x08
+FIELD_REMOVED = 0x80
+
+SNAPSHOT_HEADER = struct.Struct("<BIIH") # type, tick, base_tick, entity_count
+ENTITY_HEADER = struct.Struct("<IB")     # id(uint32: 서버 id는 재사용하지 않고 계속 증가), mask
+F32 = struct.Struct("<f")
+FACING = struct.Struct("<bb")
+U8 = struct.Struct("<B")
+ACK = struct.Struct("<BI")               # type, tick
+MOVE = struct.Struct("<BIffbbB")         # type, id(uint32), x, y, fx, fy, is_moving
+
+# 엔티티 상태는 (x, y, fx, fy, is_moving) 튜플로 주고받습니다.
+
+def message_type(data):
+    return data[0] if data else 0
+
+def encode_snapshot(tick, base_tick, base, current):
+    """
+    base(클라이언트가 ack한 상태) 대비 current에서 바뀐 필드만 담은 스냅샷을 만듭니다.
+    base_tick이 0이면 전체 스냅샷. 바뀐 것이 없으면 None.
+    """
+    parts = []
+    count = 0
+    for eid, state in current.items():
+        old = base.get(eid)
+        mask = 0
+        if old is None:
+            mask = FIELD_X | FIELD_Y | FIELD_FACING | FIELD_MOVING
+        else:
+            if state[0] != old[0]: mask |= FIELD_X
+            if state[1] != old[1]: mask |= FIELD_Y
+            if state[2] != old[2] or state[3] != old[3]: mask |= FIELD_FACING
+            if state[4] != old[4]: mask |= FIELD_MOVING
+        if not mask: continue
+
+        parts.append(ENTITY_HEADER.pack(eid, mask))
+        if mask & FIELD_X: parts.append(F32.pack(state[0]))
+        if mask & FIELD_Y: parts.append(F32.pack(state[1]))
+        if mask & FIELD_FACING: parts.append(FACING.pack(state[2], state[3]))
+        if mask & FIELD_MOVING: parts.append(U8.pack(1 if state[4] else 0))
+        count += 1
+
+    for eid in base:
+        if eid not in current:
+            parts.append(ENTITY_HEADER.pack(eid, FIELD_REMOVED))
+            count += 1
+
+    if not count: return None
+    return SNAPSHOT_HEADER.pack(MSG_SNAPSHOT, tick, base_tick, count) + b"".join(parts)
+
+def peek_snapshot(data):
+    """(tick, base_tick)"""
+    _, tick, base_tick, _ = SNAPSHOT_HEADER.unpack_from(data, 0)
+    return tick, base_tick
+
+def decode_snapshot(data, base):
+    """
+    base 상태에 델타를 적용한 새 상태와 바뀐(또는 사라진) 엔티티 id 목록을 반환합니다.
+    반환: (tick, state, changed_ids, removed_ids)
+    """
+    _, tick, _, count = SNAPSHOT_HEADER.unpack_from(data, 0)
+    offset = SNAPSHOT_HEADER.size
+    state = dict(base)
+    changed, removed = [], []
+
+    for _ in range(count):
+        eid, mask = ENTITY_HEADER.unpack_from(data, offset)
+        offset += ENTITY_HEADER.size
+        if mask & FIELD_REMOVED:
+            state.pop(eid, None)
+            removed.append(eid)
+            continue
+
+        x, y, fx, fy, moving = state.get(eid, (0.0, 0.0, 0, 1, False))
+        if mask & FIELD_X:
+            x = F32.unpack_from(data, offset)[0]; offset += F32.size
+        if mask & FIELD_Y:
+            y = F32.unpack_from(data, offset)[0]; offset += F32.size
+        if mask & FIELD_FACING:
+            fx, fy = FACING.unpack_from(data, offset); offset += FACING.size
+        if mask & FIELD_MOVING:
+            moving = bool(U8.unpack_from(data, offset)[0]); offset += U8.size
+        state[eid] = (x, y, fx, fy, moving)
+        changed.append(eid)
+
+    return tick, state, changed, removed
+
+def encode_ack(tick):
+    return ACK.pack(MSG_ACK, tick)
+
+def decode_ack(data):
+    return ACK.unpack_from(data, 0)[1]
+
+def encode_move(eid, x, y, is_moving, fx, fy):
+    return MOVE.pack(MSG_MOVE, eid, x, y, fx, fy, 1 if is_moving else 0)
+
+def decode_move(data):
+    """(id, (x, y, fx, fy, is_moving))"""
+    _, eid, x, y, fx, fy, moving = MOVE.unpack_from(data, 0)
+    return eid, (x, y, fx, fy, bool(moving))
@@ -6,6 +6,15 @@ class CollisionWorld:
         # pyspatialgrid 대신 간단한 Dictionary 기반 공간 해싱 사용
         self.static_grid = {}
         self.cell_size = 2.0 # 그리드 셀 크기
+        
+        # [최적화] 타일 단위 점유 그리드 (FOV/레이캐스트 전용)
+        # 정수 좌표 블록 하나가 중심 기준 1x1 셀을 막음. 한 셀에 여러 바디가 있을 수 있어 카운트로 관리
+        self.occ_x0 = 0 # 그리드 원점 (타일 좌표)
+        self.occ_y0 = 0
+        self.occ_w = 0
+        self.occ_h = 0
+        self.occupancy = bytearray()
+        self.static_version = 0 # 정적 바디가 바뀔 때마다 증가 (길찾기 캐시 무효화용)
 
     def _get_grid_coords(self, pos):
         return (int(pos.x // self.cell_size), int(pos.y // self.cell_size))
@@ -25,11 +34,112 @@ class CollisionWorld:
         if coords not in self.static_grid:
             self.static_grid[coords] = []
         self.static_grid[coords].append(entity)
+        self._mark_occupancy(entity, pos, 1)
+        self.static_version += 1
 
     def remove_static(self, entity):
-        coords = self._get_grid_coords(entity.get_global_position())
+        pos = entity.get_global_position()
+        coords = self._get_grid_coords(pos)
         if coords in self.static_grid and entity in self.static_grid[coords]:
             self.static_grid[coords].remove(entity)
+            self._mark_occupancy(entity, pos, -1)
+            self.static_version += 1
+
+    def _mark_occupancy(self, entity, pos, delta):
+        # 지면(z=0) 높이의 시선을 막지 않는 바디는 제외 (check_collision의 높이 판정과 동일)
+        body_h = getattr(entity, 'size_z', 1.0) * 5
+        if not (0 < entity.position.z + body_h and 1.8 > entity.position.z):
+            return
+        
+        ix, iy = math.floor(pos.x + 0.5), math.floor(pos.y + 0.5)
+        if delta > 0:
+            self._ensure_occupancy_bounds(ix, iy)
+        elif not (0 <= ix - self.occ_x0 < self.occ_w and 0 <= iy - self.occ_y0 < self.occ_h):
+            return
+        
+        idx = (iy - self.occ_y0) * self.occ_w + (ix - self.occ_x0)
+        self.occupancy[idx] = max(0, min(255, self.occupancy[idx] + delta))
+
+    def _ensure_occupancy_bounds(self, ix, iy):
+        """셀이 그리드 밖이면 그리드를 확장 (맵 로딩 중에만 발생, 여유분을 두고 키움)"""
+        x0, y0, w, h = self.occ_x0, self.occ_y0, self.occ_w, self.occ_h
+        if w and x0 <= ix < x0 + w and y0 <= iy < y0 + h:
+            return
+        
+        if not w:
+            nx0, ny0, nx1, ny1 = ix, iy, ix + 1, iy + 1
+        else:
+            nx0, ny0 = min(x0, ix), min(y0, iy)
+            nx1, ny1 = max(x0 + w, ix + 1), max(y0 + h, iy + 1)
+            # 한 번에 조금씩 커지지 않도록 절반씩 여유를 둠
+            if nx0 < x0: nx0 -= w // 2
+            if ny0 < y0: ny0 -= h // 2
+            if nx1 > x0 + w: nx1 += w // 2
+            if ny1 > y0 + h: ny1 += h // 2
+        
+        nw, nh = nx1 - nx0, ny1 - ny0
+        grid = bytearray(nw * nh)
+        for row in range(h):
+            src = row * w
+            dst = (row + y0 - ny0) * nw + (x0 - nx0)
+            grid[dst:dst + w] = self.occupancy[src:src + w]
+        
+        self.occ_x0, self.occ_y0, self.occ_w, self.occ_h = nx0, ny0, nw, nh
+        self.occupancy = grid
+
+    def is_cell_blocked(self, ix, iy):
+        lx, ly = ix - self.occ_x0, iy - self.occ_y0
+        if 0 <= lx < self.occ_w and 0 <= ly < self.occ_h:
+            return self.occupancy[ly * self.occ_w + lx] > 0
+        return False
+
+    def cast_ray(self, ox, oy, dx, dy, max_dist):
+        """
+        점유 그리드 위에서 DDA(Amanatides-Woo)로 광선을 진행시켜 첫 충돌 지점까지의 거리를 반환합니다.
+        충돌이 없으면 max_dist. 방향 (dx, dy)는 정규화되어 있어야 합니다.
+        """
+        occ = self.occupancy
+        w, h = self.occ_w, self.occ_h
+        if not w: return max_dist
+        
+        # 셀 (i, j)는 [i-0.5, i+0.5) 구간이므로 0.5만큼 밀어 정수 경계로 맞춤
+        ux = ox + 0.5 - self.occ_x0
+        uy = oy + 0.5 - self.occ_y0
+        cx, cy = math.floor(ux), math.floor(uy)
+        
+        if 0 <= cx < w and 0 <= cy < h and occ[cy * w + cx]:
+            return 0.0
+        
+        if dx > 0:
+            step_x, t_delta_x, t_max_x = 1, 1.0 / dx, (cx + 1 - ux) / dx
+        elif dx < 0:
+            step_x, t_delta_x, t_max_x = -1, -1.0 / dx, (ux - cx) / -dx
+        else:
+            step_x, t_delta_x, t_max_x = 0, math.inf, math.inf
+        
+        if dy > 0:
+            step_y, t_delta_y, t_max_y = 1, 1.0 / dy, (cy + 1 - uy) / dy
+        elif dy < 0:
+            step_y, t_delta_y, t_max_y = -1, -1.0 / dy, (uy - cy) / -dy
+        else:
+            step_y, t_delta_y, t_max_y = 0, math.inf, math.inf
+        
+        while True:
+            if t_max_x < t_max_y:
+                t = t_max_x
+                cx += step_x
+                t_max_x += t_delta_x
+            else:
+                t = t_max_y
+                cy += step_y
+                t_max_y += t_delta_y
+            
+            if t >= max_dist: return max_dist
+            if 0 <= cx < w and 0 <= cy < h:
+                if occ[cy * w + cx]: return t
+            elif (cx < 0 and step_x <= 0) or (cx >= w and step_x >= 0) or \
+                 (cy < 0 and step_y <= 0) or (cy >= h and step_y >= 0):
+                return max_dist # 그리드 밖으로 벗어나는 중이면 더 이상 막을 것이 없음
 
     def get_nearby_objects(self, pos):
         objects = []
@@ -1,5 +1,4 @@
 import math
-import pygame
 
 class FOVSystem:
     def __init__(self, collision_world):
@@ -39,16 +38,14 @@ class FOVSystem:
         end_angle_rear = start_angle_main + 360
         
         # Cast rays for the main cone with full radius
-        step_main = (end_angle_main - start_angle_main) / (self.ray_count * 0.8)
-        for i in range(int(self.ray_count * 0.8) + 1):
-            angle = start_angle_main + i * step_main
-            points.append(self._cast_ray(origin_pos.x, origin_pos.y, angle, view_radius))
+        main_count = int(self.ray_count * 0.8)
+        step_main = (end_angle_main - start_angle_main) / main_count
+        self._cast_fan(points, origin_pos.x, origin_pos.y, math.radians(start_angle_main), math.radians(step_main), main_count + 1, view_radius)
 
         # Cast rays for the rear arc with smaller radius
-        step_rear = (end_angle_rear - start_angle_rear) / (self.ray_count * 0.2)
-        for i in range(int(self.ray_count * 0.2) + 1):
-            angle = start_angle_rear + i * step_rear
-            points.append(self._cast_ray(origin_pos.x, origin_pos.y, angle, rear_radius))
+        rear_count = int(self.ray_count * 0.2)
+        step_rear = (end_angle_rear - start_angle_rear) / rear_count
+        self._cast_fan(points, origin_pos.x, origin_pos.y, math.radians(start_angle_rear), math.radians(step_rear), rear_count + 1, rear_radius)
             
         return points
 
@@ -65,25 +62,25 @@ class FOVSystem:
         angle_step = math.radians((end_angle - start_angle) / num_steps)
         start_angle_rad = base_angle_rad + math.radians(start_angle - (end_angle - start_angle)/2)
 
-        for i in range(num_steps + 1):
-            angle = start_angle_rad + i * angle_step
-            points.append(self._cast_ray(origin.x, origin.y, angle, radius))
+        self._cast_fan(points, origin.x, origin.y, start_angle_rad, angle_step, num_steps + 1, radius)
         return points
 
+    def _cast_fan(self, points, ox, oy, start_rad, step_rad, count, max_dist):
+        """
+        [최적화] 부채꼴의 모든 광선을 한 번에 캐스팅.
+        CollisionWorld의 점유 그리드 위에서 DDA로 진행하므로 샘플마다 check_collision/Vector3 생성이 없음.
+        """
+        cast = self.world.cast_ray
+        cos, sin = math.cos, math.sin
+        append = points.append
+        for i in range(count):
+            angle = start_rad + i * step_rad
+            dx, dy = cos(angle), sin(angle)
+            dist = cast(ox, oy, dx, dy, max_dist)
+            append((ox + dx * dist, oy + dy * dist))
+
     def _cast_ray(self, ox, oy, angle_rad, max_dist):
         dx = math.cos(angle_rad)
         dy = math.sin(angle_rad)
-        
-        x, y = ox, oy
-        step_size = 0.5
-        dist = 0
-        
-        while dist < max_dist:
-            x += dx * step_size
-            y += dy * step_size
-            dist += step_size
-            
-            if self.world.check_collision(pygame.math.Vector3(x, y, 0), size=0.1):
-                return (x, y)
-                
-        return (x, y)
+        dist = self.world.cast_ray(ox, oy, dx, dy, max_dist)
+        return (ox + dx * dist, oy + dy * dist)
@@ -1,51 +1,218 @@
 import heapq
+import math
+from collections import OrderedDict
 from pygame.math import Vector2
 
+SQRT2 = math.sqrt(2)
+
 class NavigationManager:
-    def __init__(self, collision_world):
+    """
+    CollisionWorld의 점유 그리드를 보행 가능 그리드로 사용하는 점프 포인트 탐색(JPS) 길찾기.
+    - 8방향 이동, 벽 모서리 가로지르기 금지 (대각선은 양옆 직교 칸이 모두 비어 있어야 함)
+    - 최근 (start, goal) 결과를 LRU 캐시에 보관하고, 정적 블록이 바뀌면(static_version) 캐시 무효화
+    - 프레임당 새 탐색 횟수를 제한하여 다수의 AI가 한 프레임에 몰려도 프레임 타임이 튀지 않음
+    """
+    OUTER_MARGIN = 8 # 블록 범위/출발/도착 바깥으로 보행 가능하게 넓히는 칸 수 (맵 외곽을 돌아가는 경로용)
+
+    def __init__(self, collision_world, requests_per_frame=8, cache_size=256, max_expansions=4000):
         self.collision_world = collision_world
+        self.requests_per_frame = requests_per_frame
+        self.cache_size = cache_size
+        self.max_expansions = max_expansions
+
+        self._cache = OrderedDict() # {(start, goal): tuple(path)}
+        self._cache_version = collision_world.static_version
+        self._budget = requests_per_frame
+        self._walk = None # (bytearray, stride, bounds) 캐시
+        self._walk_version = -1
+
+        self.cache_hits = 0
+        self.searches = 0
+        self.deferred = 0
+
+    def begin_frame(self):
+        """매 프레임 시작 시 호출 (App._update). 탐색 예산을 초기화합니다."""
+        self._budget = self.requests_per_frame
 
     def get_path(self, start_pos, end_pos):
+        """
+        start -> end 경로(시작 칸 제외, 점프 포인트 목록)를 반환합니다.
+        경로가 없으면 [], 이번 프레임 탐색 예산을 다 썼으면 None (다음 프레임에 다시 요청).
+        """
         start = (int(start_pos.x), int(start_pos.y))
         goal = (int(end_pos.x), int(end_pos.y))
         
         if start == goal: return []
 
-        queue = [(0, start)]
-        came_from = {start: None}
-        cost_so_far = {start: 0}
+        if self._cache_version != self.collision_world.static_version:
+            self._cache.clear()
+            self._cache_version = self.collision_world.static_version
+
+        key = (start, goal)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self.cache_hits += 1
+            return list(cached) # 호출자가 pop으로 소비하므로 복사본 반환
+
+        if self._budget <= 0:
+            self.deferred += 1
+            return None
+        self._budget -= 1
+        self.searches += 1
+
+        path = self._search(start, goal)
+        self._cache[key] = tuple(path)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return path
+
+    def _walk_grid(self, start, goal):
+        """
+        보행 가능 그리드(1=보행 가능)와 그 원점을 만들어 캐시합니다.
+        정적 블록 범위 밖도 보행 가능(이전 check_collision 기반 A*와 동일)하므로, 블록 범위와 start/goal을
+        모두 포함하도록 OUTER_MARGIN칸 넓힌 영역을 보행 가능으로 채우고 블록 점유를 덮어씁니다.
+        맨 바깥 테두리 1칸만 막아 두어 탐색 중 범위 검사가 필요 없습니다.
+        """
+        world = self.collision_world
+        m = self.OUTER_MARGIN
+        w, h = world.occ_w, world.occ_h
+        xs = [start[0], goal[0]] + ([world.occ_x0, world.occ_x0 + w - 1] if w else [])
+        ys = [start[1], goal[1]] + ([world.occ_y0, world.occ_y0 + h - 1] if h else [])
+        x0, y0 = min(xs) - m, min(ys) - m
+        bounds = (x0, y0, max(xs) + m - x0 + 1, max(ys) + m - y0 + 1)
+
+        # 대부분의 요청은 블록 범위 안이라 영역이 같으므로 캐시가 재사용됨
+        if self._walk is not None and self._walk_version == world.static_version and self._walk[2] == bounds:
+            return self._walk
+
+        bw, bh = bounds[2], bounds[3]
+        stride = bw + 2
+        walk = bytearray(stride * (bh + 2))
+        inner = b'\x01' * bw
+        for row in range(bh):
+            base = (row + 1) * stride + 1
+            walk[base:base + bw] = inner
+        occ = world.occupancy
+        for row in range(h):
+            base = (world.occ_y0 - y0 + row + 1) * stride + (world.occ_x0 - x0 + 1)
+            walk[base:base + w] = bytes(0 if c else 1 for c in occ[row * w:(row + 1) * w])
+
+        self._walk = (walk, stride, bounds)
+        self._walk_version = world.static_version
+        return self._walk
+
+    def _search(self, start, goal):
+        walk, stride, bounds = self._walk_grid(start, goal)
+        ox, oy = bounds[0] - 1, bounds[1] - 1 # 덧댄 그리드의 원점
+
+        def to_index(p):
+            lx, ly = p[0] - ox, p[1] - oy
+            if 0 <= lx < stride and 0 <= ly < len(walk) // stride:
+                return ly * stride + lx
+            return None
+
+        s_idx, g_idx = to_index(start), to_index(goal)
+        if g_idx is None or not walk[g_idx]: return []
+        if s_idx is None: return []
+
+        def jump(idx, dx, dy):
+            # idx는 방향 (dx, dy)로 한 칸 진행한 위치
+            step = dx + dy * stride
+            while True:
+                if not walk[idx]: return None
+                if idx == g_idx: return idx
+                if dx and dy:
+                    # 대각선 이동: 직교 방향으로 점프 포인트가 있으면 여기가 점프 포인트
+                    if jump(idx + dx, dx, 0) is not None or jump(idx + dy * stride, 0, dy) is not None: return idx
+                    if not (walk[idx + dx] and walk[idx + dy * stride]): return None
+                elif dx:
+                    if (walk[idx - stride] and not walk[idx - stride - dx]) or \
+                       (walk[idx + stride] and not walk[idx + stride - dx]):
+                        return idx
+                else:
+                    back = dy * stride
+                    if (walk[idx - 1] and not walk[idx - 1 - back]) or \
+                       (walk[idx + 1] and not walk[idx + 1 - back]):
+                        return idx
+                idx += step
+
+        def neighbors(idx, parent):
+            if parent is None:
+                result = []
+                for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+                    if walk[idx + dx + dy * stride]: result.append((dx, dy))
+                for dx, dy in ((1, 1), (1, -1), (-1, 1), (-1, -1)):
+                    if walk[idx + dx] and walk[idx + dy * stride] and walk[idx + dx + dy * stride]:
+                        result.append((dx, dy))
+                return result
+
+            x, y = idx % stride, idx // stride
+            px, py = parent % stride, parent // stride
+            dx = (x > px) - (x < px)
+            dy = (y > py) - (y < py)
+            result = []
+            if dx and dy:
+                can_y = walk[idx + dy * stride]
+                can_x = walk[idx + dx]
+                if can_y: result.append((0, dy))
+                if can_x: result.append((dx, 0))
+                if can_x and can_y: result.append((dx, dy))
+            elif dx:
+                up, down = walk[idx + stride], walk[idx - stride]
+                if walk[idx + dx]:
+                    result.append((dx, 0))
+                    if up: result.append((dx, 1))
+                    if down: result.append((dx, -1))
+                if up: result.append((0, 1))
+                if down: result.append((0, -1))
+            else:
+                right, left = walk[idx + 1], walk[idx - 1]
+                if walk[idx + dy * stride]:
+                    result.append((0, dy))
+                    if right: result.append((1, dy))
+                    if left: result.append((-1, dy))
+                if right: result.append((1, 0))
+                if left: result.append((-1, 0))
+            return result
+
+        def octile(a, b):
+            dx = abs(a % stride - b % stride)
+            dy = abs(a // stride - b // stride)
+            return (dx + dy) + (SQRT2 - 2) * min(dx, dy)
+
+        queue = [(0, s_idx)]
+        came_from = {s_idx: None}
+        cost_so_far = {s_idx: 0}
+        expansions = 0
 
         while queue:
             current = heapq.heappop(queue)[1]
 
-            if current == goal:
+            if current == g_idx:
                 break
 
-            for dx, dy in [(0,1),(0,-1),(1,0),(-1,0)]:
-                next_node = (current[0] + dx, current[1] + dy)
+            expansions += 1
+            if expansions > self.max_expansions: return []
                 
-                # 충돌 체크 (CollisionWorld 활용)
-                from pygame.math import Vector3
-                if self.collision_world.check_collision(Vector3(next_node[0], next_node[1], 0)):
-                    continue
+            for dx, dy in neighbors(current, came_from[current]):
+                next_node = jump(current + dx + dy * stride, dx, dy)
+                if next_node is None: continue
 
-                new_cost = cost_so_far[current] + 1
+                new_cost = cost_so_far[current] + octile(current, next_node)
                 if next_node not in cost_so_far or new_cost < cost_so_far[next_node]:
                     cost_so_far[next_node] = new_cost
-                    priority = new_cost + self._heuristic(goal, next_node)
+                    priority = new_cost + octile(g_idx, next_node)
                     heapq.heappush(queue, (priority, next_node))
                     came_from[next_node] = current
 
-        if goal not in came_from: return []
+        if g_idx not in came_from: return []
 
-        # 경로 재구성
+        # 경로 재구성 (점프 포인트 사이는 직선/대각선 직선이므로 그대로 웨이포인트로 사용)
         path = []
-        curr = goal
-        while curr != start:
-            path.append(curr)
+        curr = g_idx
+        while curr != s_idx:
+            path.append((curr % stride + ox, curr // stride + oy))
             curr = came_from[curr]
         path.reverse()
         return path
-
-    def _heuristic(self, a, b):
-        return abs(a[0] - b[0]) + abs(a[1] - b[1])
@@ -0,0 +1,104 @@
+import math
+
+class SpatialHash:
+    """
+    움직이는 오브젝트(엔티티, 소음 등)용 균일 격자.
+    위치가 바뀔 때 update(obj, x, y)를 호출하면 셀을 옮겨 담고, 반경/부채꼴 질의는 주변 셀만 검사합니다.
+    좌표는 월드(타일) 단위이며, 셀이 바뀌지 않은 이동은 위치만 갱신합니다.
+    (서버의 InterestGrid와 같은 구조이지만 id 대신 오브젝트 자체를 담습니다)
+    """
+    def __init__(self, cell_size=8.0):
+        self.cell_size = cell_size
+        self.inv_cell_size = 1.0 / cell_size
+
+        self.cells = {} # {(gx, gy): {obj, ...}}
+        self.positions = {} # {obj: (x, y)}
+        self.obj_cells = {} # {obj: (gx, gy)}
+
+    def __len__(self):
+        return len(self.positions)
+
+    def __contains__(self, obj):
+        return obj in self.positions
+
+    def _get_cell_coords(self, x, y):
+        return math.floor(x * self.inv_cell_size), math.floor(y * self.inv_cell_size)
+
+    def update(self, obj, x, y):
+        self.positions[obj] = (x, y)
+        key = self._get_cell_coords(x, y)
+        old_key = self.obj_cells.get(obj)
+        if old_key == key: return
+
+        if old_key is not None:
+            cell = self.cells.get(old_key)
+            if cell is not None:
+                cell.discard(obj)
+                if not cell: del self.cells[old_key]
+        self.cells.setdefault(key, set()).add(obj)
+        self.obj_cells[obj] = key
+
+    def remove(self, obj):
+        self.positions.pop(obj, None)
+        key = self.obj_cells.pop(obj, None)
+        if key is None: return
+        cell = self.cells.get(key)
+        if cell is not None:
+            cell.discard(obj)
+            if not cell: del self.cells[key]
+
+    def clear(self):
+        self.cells.clear()
+        self.positions.clear()
+        self.obj_cells.clear()
+
+    def get_position(self, obj):
+        return self.positions.get(obj)
+
+    def query_radius(self, x, y, radius, exclude=None, predicate=None):
+        """(x, y)에서 radius 안에 있는 [(거리, obj)] (정렬하지 않음)"""
+        inv = self.inv_cell_size
+        gx0, gy0 = math.floor((x - radius) * inv), math.floor((y - radius) * inv)
+        gx1, gy1 = math.floor((x + radius) * inv), math.floor((y + radius) * inv)
+        r_sq = radius * radius
+        cells, positions = self.cells, self.positions
+
+        result = []
+        # 셀 수가 오브젝트 수보다 많으면(넓은 반경) 오브젝트를 직접 훑는 편이 빠름
+        if (gx1 - gx0 + 1) * (gy1 - gy0 + 1) > len(cells):
+            buckets = cells.values()
+        else:
+            buckets = [cells[k] for k in ((cx, cy) for cy in range(gy0, gy1 + 1) for cx in range(gx0, gx1 + 1)) if k in cells]
+        for cell in buckets:
+            for obj in cell:
+                if obj is exclude: continue
+                ox, oy = positions[obj]
+                d_sq = (ox - x) ** 2 + (oy - y) ** 2
+                if d_sq > r_sq: continue
+                if predicate and not predicate(obj): continue
+                result.append((math.sqrt(d_sq), obj))
+        return result
+
+    def query_cone(self, x, y, radius, direction, angle_deg, exclude=None, predicate=None):
+        """radius 안에서 direction 기준 angle_deg 부채꼴 안에 있는 [(거리, obj)] (원점과 겹친 오브젝트 포함)"""
+        dx, dy = direction
+        length = math.hypot(dx, dy)
+        if not length: return self.query_radius(x, y, radius, exclude, predicate)
+        dx, dy = dx / length, dy / length
+        min_dot = math.cos(math.radians(angle_deg / 2))
+        positions = self.positions
+
+        result = []
+        for dist, obj in self.query_radius(x, y, radius, exclude, predicate):
+            if dist > 0:
+                ox, oy = positions[obj]
+                if ((ox - x) * dx + (oy - y) * dy) / dist < min_dot: continue
+            result.append((dist, obj))
+        return result
+
+    def nearest(self, x, y, radius, exclude=None, predicate=None):
+        """radius 안에서 가장 가까운 (거리, obj), 없으면 (None, None)"""
+        best = (None, None)
+        for dist, obj in self.query_radius(x, y, radius, exclude, predicate):
+            if best[0] is None or dist < best[0]: best = (dist, obj)
+        return best
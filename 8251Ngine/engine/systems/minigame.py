@@ -1,5 +1,5 @@
 import pygame
-import time
+from engine.core import clock
 import random
 
 class Minigame:
@@ -9,7 +9,7 @@ class Minigame:
         self.callback = callback # (success: bool) -> None
         self.active = True
         self.progress = 0.0
-        self.start_time = time.time()
+        self.start_time = clock.now()
         self.duration = 5.0 / difficulty
         
         # Type specific
@@ -20,7 +20,7 @@ class Minigame:
     def update(self, dt, input_manager):
         if not self.active: return
         
-        elapsed = time.time() - self.start_time
+        elapsed = clock.now() - self.start_time
         if elapsed > self.duration:
             self.finish(False)
             return
@@ -1,5 +1,5 @@
 import pygame
-import time
+from engine.core import clock
 from engine.core.math_utils import IsoMath
 
 class Popup:
@@ -7,12 +7,12 @@ class Popup:
         self.text = text
         self.pos = [x, y, z]
         self.color = color
-        self.start_time = time.time()
+        self.start_time = clock.now()
         self.duration = duration
         self.alive = True
 
     def update(self, dt):
-        elapsed = time.time() - self.start_time
+        elapsed = clock.now() - self.start_time
         if elapsed > self.duration:
             self.alive = False
         # 위로 떠오르는 효과
@@ -22,6 +22,7 @@ class Popup:
 class WorldPopupManager:
     def __init__(self):
         self.popups = []
+        self.font = None # 첫 draw 때 생성 (SysFont 조회가 느림)
 
     def add_popup(self, text, x, y, z, color=(255, 255, 255), duration=1.5):
         self.popups.append(Popup(text, x, y, z, color, duration))
@@ -30,13 +31,14 @@ class WorldPopupManager:
         self.popups = [p for p in self.popups if p.update(dt)]
 
     def draw(self, screen, camera):
-        font = pygame.font.SysFont("arial", 14, bold=True)
+        if self.font is None: self.font = pygame.font.SysFont("arial", 14, bold=True)
+        font = self.font
         for p in self.popups:
             ix, iy = IsoMath.cart_to_iso(p.pos[0], p.pos[1], p.pos[2])
             sx, sy = camera.world_to_screen(ix, iy)
             
             # Fade out
-            elapsed = time.time() - p.start_time
+            elapsed = clock.now() - p.start_time
             alpha = int(255 * (1.0 - (elapsed / p.duration)))
             
             txt_surf = font.render(p.text, True, p.color)
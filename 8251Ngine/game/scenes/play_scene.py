@@ -2,6 +2,7 @@ import pygame
 import random
 import os
 from engine.core.node import Node
+from engine.core.static_world import StaticWorld
 from engine.graphics.block import Block3D
 from engine.physics.collision import CollisionWorld
 from engine.core.math_utils import IsoMath
@@ -9,12 +10,15 @@ from engine.graphics.lighting import LightSource, DirectionalLight
 from game.scripts.entity import GameEntity
 from engine.physics.fov import FOVSystem
 from game.utils.map_loader import MapLoader
-from engine.ui.gui import Control, Label, Panel
+from engine.ui.gui import Control, Label, Panel, Button
 from settings import SCREEN_WIDTH, SCREEN_HEIGHT, ITEMS, SPEED_WALK, SPEED_RUN, SPEED_CROUCH, PHASE_SETTINGS, TILE_SIZE, MAX_PLAYERS, INDOOR_ZONES, VENDING_MACHINE_TID, CCTV_TID
 from game.data.colors import COLORS
 from game.ui.widgets.cctv_view import CCTVViewWidget # CCTVViewWidget 임포트
+from engine.core import clock
 
 class PlayScene(Node):
+    npc_count = 5 # 로컬 NPC 수 (헤드리스 시뮬레이션에서 조정)
+
     def _ready(self, services):
         self.services = services
         print("PlayScene Ready. Loading PxANIC! Map...")
@@ -27,6 +31,7 @@ class PlayScene(Node):
         # [네트워크 관련 추가]
         self.last_sent_pos = (0, 0) # PxANIC!의 last_sent_pos 초기화
         self.other_players = {} # 다른 플레이어 엔티티 관리를 위한 딕셔너리
+        self.participants = {} # {player_id: 목록 항목} (PLAYER_LIST로 받고 PLAYER_LIST_DELTA로 갱신)
         self.game_started = False # 게임 시작 상태 플래그 추가
         self.last_phase = None # 이전 시간 단계 추적용
         
@@ -152,8 +157,11 @@ class PlayScene(Node):
         import json
         with open(tiles_path, 'r', encoding='utf-8') as f: TileEngine.init(json.load(f))
         
+        # 맵 블록은 StaticWorld 아래에 두어 매 프레임 update/그리기 순회에서 빠지게 함
+        self.static_world = StaticWorld("StaticWorld")
+        self.add_child(self.static_world)
         self.map_loader = MapLoader(map_path, tiles_path)
-        self.block_map = self.map_loader.build_world(self, self.collision_world)
+        self.block_map = self.map_loader.build_world(self.static_world, self.collision_world)
         
         from game.systems.action_system import ActionSystem
         from game.systems.combat_system import CombatSystem
@@ -203,12 +211,16 @@ class PlayScene(Node):
         from game.scripts.npc import NpcEntity
         print("Spawning NPCs...")
         self.npcs = []
-        for i in range(5):
+        for i in range(self.npc_count):
             npc = NpcEntity(f"Citizen_{i}")
-            nx, ny = random.randint(5, 15), random.randint(5, 15)
-            if not self.collision_world.check_collision(pygame.math.Vector3(nx, ny, 0)):
-                npc.position.x, npc.position.y = nx, ny
-                self.add_child(npc); self.npcs.append(npc)
+            # [수정] 벽과 겹친 자리는 다시 뽑아 요청한 수만큼 배치 (조용히 빠뜨리지 않음)
+            for _ in range(100):
+                nx, ny = random.randint(5, 15), random.randint(5, 15)
+                if not self.collision_world.check_collision(pygame.math.Vector3(nx, ny, 0)): break
+            else:
+                raise RuntimeError(f"No free spawn spot for {npc.name}")
+            npc.position.x, npc.position.y = nx, ny
+            self.add_child(npc); self.npcs.append(npc)
 
     def update(self, dt, services, game_state):
         input_manager = services["input"]
@@ -249,54 +261,15 @@ class PlayScene(Node):
                 elif e.get('type') == 'TIME_SYNC': # 시간 동기화
                     time_manager.sync_time(e['phase_idx'], e['timer'], e['day'])
                     print(f"Time Sync: Day {e['day']}, Phase {e['phase_idx']}, Timer {e['timer']}")
-                elif e.get('type') == 'PLAYER_LIST': # 플레이어 목록 업데이트
-                    # 현재 씬에 있는 다른 플레이어 ID 집합
-                    current_other_player_ids = set(self.other_players.keys())
-                    
-                    # 새로운 플레이어 목록 ID 집합
-                    new_player_list_ids = {p['id'] for p in e['participants'] if p['id'] != network_manager.client_id}
-                    
-                    # 제거해야 할 플레이어 (씬에는 있지만 새 목록에 없는 경우)
-                    for removed_id in current_other_player_ids - new_player_list_ids:
-                        if removed_id in self.other_players:
-                            removed_entity = self.other_players.pop(removed_id)
-                            self.remove_child(removed_entity)
-                            print(f"Removed player {removed_id}")
-                            
-                    # 추가하거나 업데이트해야 할 플레이어
-                    for p_data in e['participants']:
-                        player_id = p_data['id']
-                        if player_id == network_manager.client_id: # 자기 자신은 스킵
-                            # 자기 자신의 역할, 서브 역할, 그룹 업데이트
-                            if 'role' in p_data: self.player.set_role(p_data['role'], p_data.get('sub_role'))
-                            if 'group' in p_data: self.player.set_group(p_data['group'])
-                            continue
-                            
-                        if player_id not in self.other_players: # 새로운 플레이어
-                            # GameEntity 생성 시 client_id 전달
-                            new_player_entity = GameEntity(name=p_data.get('name', f"Player {player_id+1}"), client_id=player_id)
-                            new_player_entity.position.x = p_data.get('x', 0)
-                            new_player_entity.position.y = p_data.get('y', 0)
-                            new_player_entity.set_role(p_data.get('role', 'CITIZEN'), p_data.get('sub_role'))
-                            if 'group' in p_data: new_player_entity.set_group(p_data['group']) # 그룹 설정
-                            new_player_entity.is_moving = p_data.get('is_moving', False)
-                            # facing_direction은 Vector2로 변환 필요
-                            if 'facing' in p_data and isinstance(p_data['facing'], (list, tuple)):
-                                new_player_entity.facing_direction = pygame.math.Vector2(p_data['facing'][0], p_data['facing'][1])
-                            
-                            self.add_child(new_player_entity)
-                            self.other_players[player_id] = new_player_entity
-                            print(f"Added new player {player_id}: {p_data.get('name')}")
-                        else: # 기존 플레이어 업데이트 (역할, 이름, 그룹 등)
-                            existing_entity = self.other_players[player_id]
-                            existing_entity.name = p_data.get('name', existing_entity.name)
-                            existing_entity.set_role(p_data.get('role', existing_entity.role), p_data.get('sub_role', existing_entity.sub_role))
-                            if 'group' in p_data: existing_entity.set_group(p_data['group']) # 그룹 설정
-                            # 위치는 MOVE 메시지에서 지속적으로 업데이트되므로 여기서는 역할 등만 업데이트
-                            # print(f"Updated existing player {player_id}: {p_data.get('name')}")
-
-                    print(f"Player List updated. Current other players: {list(self.other_players.keys())}")
-                    self._update_player_list_ui(e['participants']) # UI 업데이트
+                elif e.get('type') == 'PLAYER_LIST': # 플레이어 목록 전체 (접속 직후)
+                    participants = {p['id']: p for p in e['participants']}
+                    removed_ids = [pid for pid in self.participants if pid not in participants]
+                    self.participants = participants
+                    self._apply_player_list(e['participants'], removed_ids, network_manager.client_id)
+                elif e.get('type') == 'PLAYER_LIST_DELTA': # [최적화] 바뀐/나간 참가자만 반영
+                    for p_data in e['changed']: self.participants[p_data['id']] = p_data
+                    for removed_id in e['removed']: self.participants.pop(removed_id, None)
+                    self._apply_player_list(e['changed'], e['removed'], network_manager.client_id)
                 elif event.key == pygame.K_q:
                     # [CCTV Logic]
                     if self.player.status.role == "POLICE": # PxANIC! 역할 확인
@@ -394,6 +367,49 @@ class PlayScene(Node):
                 lbl.set_text(f"{i+1}. {info.get('name', key)} x{count}")
             else: lbl.set_text("")
 
+    def _apply_player_list(self, changed, removed_ids, client_id):
+        """PLAYER_LIST / PLAYER_LIST_DELTA 공통: 나간 플레이어를 제거하고 바뀐 참가자를 추가/갱신"""
+        # 제거해야 할 플레이어 (씬에는 있지만 목록에서 빠진 경우)
+        for removed_id in removed_ids:
+            if removed_id in self.other_players:
+                removed_entity = self.other_players.pop(removed_id)
+                self.remove_child(removed_entity) # 엔티티 색인에서는 GameEntity._exit_tree가 제거
+                print(f"Removed player {removed_id}")
+
+        # 추가하거나 업데이트해야 할 플레이어
+        for p_data in changed:
+            player_id = p_data['id']
+            if player_id == client_id: # 자기 자신은 스킵
+                # 자기 자신의 역할, 서브 역할, 그룹 업데이트
+                if 'role' in p_data: self.player.set_role(p_data['role'], p_data.get('sub_role'))
+                if 'group' in p_data: self.player.set_group(p_data['group'])
+                continue
+
+            if player_id not in self.other_players: # 새로운 플레이어
+                # GameEntity 생성 시 client_id 전달
+                new_player_entity = GameEntity(name=p_data.get('name', f"Player {player_id+1}"), client_id=player_id)
+                new_player_entity.position.x = p_data.get('x', 0)
+                new_player_entity.position.y = p_data.get('y', 0)
+                new_player_entity.set_role(p_data.get('role', 'CITIZEN'), p_data.get('sub_role'))
+                if 'group' in p_data: new_player_entity.set_group(p_data['group']) # 그룹 설정
+                new_player_entity.is_moving = p_data.get('is_moving', False)
+                # facing_direction은 Vector2로 변환 필요
+                if 'facing' in p_data and isinstance(p_data['facing'], (list, tuple)):
+                    new_player_entity.facing_direction = pygame.math.Vector2(p_data['facing'][0], p_data['facing'][1])
+
+                self.add_child(new_player_entity)
+                self.other_players[player_id] = new_player_entity
+                print(f"Added new player {player_id}: {p_data.get('name')}")
+            else: # 기존 플레이어 업데이트 (역할, 이름, 그룹 등)
+                existing_entity = self.other_players[player_id]
+                existing_entity.name = p_data.get('name', existing_entity.name)
+                existing_entity.set_role(p_data.get('role', existing_entity.role), p_data.get('sub_role', existing_entity.sub_role))
+                if 'group' in p_data: existing_entity.set_group(p_data['group']) # 그룹 설정
+                # 위치는 MOVE 메시지에서 지속적으로 업데이트되므로 여기서는 역할 등만 업데이트
+
+        print(f"Player List updated. Current other players: {list(self.other_players.keys())}")
+        self._update_player_list_ui(list(self.participants.values())) # UI 업데이트
+
     def _update_player_list_ui(self, participants):
         # MAX_PLAYERS 대신 실제 참가자 수에 맞춰 표시
         for i, lbl in enumerate(self.player_labels):
@@ -488,7 +504,7 @@ class PlayScene(Node):
         # 마피아 NPC 동결 로직
         for n in [x for x in self.npcs if x.status.role == "MAFIA" and x.status.alive]:
             n.status.is_frozen = True
-            n.status.frozen_timer = pygame.time.get_ticks() + 5000 # 5초 동결
+            n.status.frozen_timer = clock.get_ticks() + 5000 # 5초 동결
             self.services["interaction"].emit_noise(
                 n.position.x, n.position.y,
                 999, # SIREN의 base_rad (PxANIC! settings.py 참고)
@@ -496,14 +512,14 @@ class PlayScene(Node):
             )
         
         self.is_mafia_frozen = True
-        self.frozen_timer = pygame.time.get_ticks() + 5000
+        self.frozen_timer = clock.get_ticks() + 5000
         
         self.services["popups"].add_popup("!!! SIREN !!!", SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, 2.0, (100, 100, 255))
         self._process_sound_effect(("SIREN", self.player.position.x, self.player.position.y, 999)) # rad 999는 전역 효과
 
     def execute_sabotage(self):
         self.is_blackout = True
-        self.blackout_timer = pygame.time.get_ticks() + 10000 # 10초 정전
+        self.blackout_timer = clock.get_ticks() + 10000 # 10초 정전
         
         self.services["interaction"].emit_noise(
             self.player.position.x, self.player.position.y,
@@ -7,6 +7,7 @@ from engine.core.math_utils import IsoMath
 from engine.graphics.lighting import LightSource, DirectionalLight
 from game.scripts.entity import GameEntity
 from engine.physics.fov import FOVSystem
+from engine.core.frame_profiler import PROFILER
 from engine.core.ai import AdvancedAIComponent
 from engine.physics.navigation import NavigationManager
 
@@ -92,7 +93,7 @@ class TestScene(Node):
         state_str = "IDLE"
         if self.player:
             state_str = self._handle_player_input(dt, input_manager, services["network"])
-            app.fov_polygon = self.fov_system.calculate_fov(self.player.position)
+            with PROFILER.scope("fov"): app.fov_polygon = self.fov_system.calculate_fov(self.player.position)
 
         # [Test] 마우스 왼쪽 클릭 시 소음 발생 -> AI가 조사하러 옴
         if pygame.mouse.get_pressed()[0]:
@@ -28,6 +28,8 @@ class GameEntity(AnimatedSprite):
         self.custom = self.add_component(CustomizationComponent(skin_color, clothes_color))
         self.inventory = self.add_component(InventoryComponent())
         
+        self._entity_index = None # 자신이 등록된 services["entities"] (제거 시 스스로 빠지기 위함)
+
         # Network Interpolation
         self.target_pos = None
         self.lerp_speed = 10.0
@@ -64,6 +66,13 @@ class GameEntity(AnimatedSprite):
         
         self._setup_procedural_animations()
 
+    def _exit_tree(self):
+        # 씬에서 제거되면 엔티티 색인에서도 빠짐 (제거하는 쪽이 색인을 따로 정리할 필요 없음)
+        if self._entity_index is not None:
+            self._entity_index.remove(self)
+            self._entity_index = None
+        super()._exit_tree()
+
     def add_popup(self, msg, x_pos, y_pos, duration=1.0, color=(255, 255, 255)):
         # Wrapper for services["popups"].add_popup
         if self.services.get("popups"): # Ensure services is available
@@ -253,6 +262,12 @@ class GameEntity(AnimatedSprite):
             elif move_delta.x < -0.001: self.flip_h = True
             self._prev_pos = self.position.copy()
 
+        # 엔티티 색인 갱신 (전투/감정/AI 반경 질의용, 셀이 바뀔 때만 재배치)
+        entities = services.get("entities")
+        if entities is not None:
+            entities.update(self, self.position.x, self.position.y)
+            self._entity_index = entities
+
         if self.is_moving:
             self.anim_player.play("walk")
             # 걷는 속도에 따라 애니메이션 속도 조절
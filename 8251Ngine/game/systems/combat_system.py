@@ -40,37 +40,15 @@ class CombatSystem:
             return "Missed swing."
 
     def _find_target_in_range(self, attacker, reach, angle_deg):
-        possible_targets = [self.scene.player] + list(self.scene.other_players.values()) + self.scene.npcs # 로컬 NPC도 대상에 포함
-        
-        targets_in_range = []
-        for target in possible_targets:
-            if target == attacker: # 자신은 제외
-                continue
-            if not target.status.alive: # 죽은 대상 제외
-                continue
+        # [최적화] 플레이어+NPC 전체 거리 검사 대신 엔티티 색인에서 반경(부채꼴) 안만 조회
+        entities = self.scene.services["entities"]
+        x, y = attacker.position.x, attacker.position.y
+        alive = lambda target: getattr(target, 'alive', True) # 죽은 대상 제외
+        if angle_deg > 0: # angle_deg가 0보다 클 때만 시야각 검사
+            targets_in_range = entities.query_cone(x, y, reach * TILE_SIZE, attacker.facing_direction, angle_deg, exclude=attacker, predicate=alive)
+        else: # angle_deg가 0이면 시야각 검사 없이 범위 내 모든 대상 포함
+            targets_in_range = entities.query_radius(x, y, reach * TILE_SIZE, exclude=attacker, predicate=alive)
 
-            dist = attacker.position.distance_to(target.position)
-            if dist <= reach * TILE_SIZE: # TILE_SIZE 기준으로 거리 계산
-                # 시야각 내 대상만 선택하는 로직 추가
-                if angle_deg > 0: # angle_deg가 0보다 클 때만 시야각 검사
-                    # 공격자의 정면 방향 벡터
-                    attacker_dir = attacker.facing_direction.normalize()
-                    
-                    # 공격자 -> 타겟 벡터
-                    target_vec = (target.position - attacker.position).normalize()
-                    
-                    # 두 벡터 간의 내적 계산
-                    dot_product = attacker_dir.dot(target_vec)
-                    
-                    # 각도 계산 (라디안 -> 도)
-                    angle_between = math.degrees(math.acos(max(-1, min(1, dot_product)))) # 내적 오차 보정
-                    
-                    if angle_between <= angle_deg / 2: # 시야각 절반 내에 있는지 확인
-                        targets_in_range.append((dist, target))
-                else: # angle_deg가 0이면 시야각 검사 없이 범위 내 모든 대상 포함
-                    targets_in_range.append((dist, target))
-        
         if targets_in_range:
-            targets_in_range.sort(key=lambda x: x[0]) # 거리가 가까운 순으로 정렬
-            return targets_in_range[0][1] # 가장 가까운 대상 반환
+            return min(targets_in_range, key=lambda x: x[0])[1] # 가장 가까운 대상 반환
         return None
@@ -1,6 +1,7 @@
 import pygame
 from engine.ui.gui import Control, Label, Panel, Button
-from settings import SCREEN_WIDTH, SCREEN_HEIGHT, COLORS # COLORS는 settings.py 또는 game.data.colors에서 가져올 수 있음
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from game.data.colors import COLORS
 import random
 
 class CCTVViewWidget(Panel):
@@ -0,0 +1,70 @@
+"""
+헤드리스 시뮬레이션 벤치마크: 화면 없이(SDL dummy 드라이버) PlayScene을 고정 간격으로 최대 속도로 갱신하고
+초당 틱 수와 시스템별(lighting / interaction / systems / scene) 소요 시간을 출력합니다.
+- 시계: engine.core.clock에 FixedClock을 설치하여 틱마다 --dt 만큼만 진행 (벽시계와 무관)
+- 난수: --seed로 고정. 같은 옵션이면 마지막에 출력되는 상태 체크섬이 같아야 합니다.
+- 그리기(App._draw)와 네트워크는 하지 않습니다.
+
+사용법: python headless.py [--bots N] [--ticks N] [--seed N] [--dt 초]
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import hashlib
+import random
+import time
+from collections import deque
+from engine.core import clock
+from engine.core.app import App
+from engine.core.frame_profiler import PROFILER
+
+def state_checksum(scene, time_manager):
+    """플레이어/NPC 위치·체력·역할과 시간 단계로 만든 해시 (같은 시드 = 같은 값)"""
+    h = hashlib.md5()
+    for e in [scene.player] + scene.npcs:
+        h.update(f"{e.name}:{e.position.x:.3f}:{e.position.y:.3f}:{e.hp}:{e.alive}:{e.role}:{e.status.is_dead};".encode())
+    h.update(f"{time_manager.day_count}:{time_manager.current_phase_idx}:{time_manager.phase_timer:.3f}".encode())
+    return h.hexdigest()[:12]
+
+def run(num_bots, ticks, seed, dt):
+    random.seed(seed)
+    fixed = clock.FixedClock(dt)
+    clock.install(fixed)
+
+    t0 = time.perf_counter()
+    app = App(title="8251Ngine (headless)", use_network=False)
+    from game.scenes.play_scene import PlayScene
+    scene = PlayScene(name="MainScene")
+    scene.npc_count = num_bots
+    app.set_scene(scene)
+    setup_ms = (time.perf_counter() - t0) * 1000
+
+    # 전 구간 통계를 위해 링 버퍼를 틱 수만큼 확보
+    PROFILER.frames = deque(maxlen=ticks)
+    PROFILER.set_enabled(True)
+    start = time.perf_counter()
+    for _ in range(ticks):
+        PROFILER.begin_frame()
+        with PROFILER.scope("update"): app._update(dt)
+        PROFILER.end_frame()
+        fixed.advance()
+    elapsed = time.perf_counter() - start
+
+    avg, peak, rows = PROFILER.summary(count=ticks)
+    print(f"bots={len(scene.npcs)} ticks={ticks} dt={dt}s seed={seed} (setup {setup_ms:.0f} ms)")
+    print(f"{ticks / elapsed:.1f} ticks/s  avg {avg:.3f} ms  max {peak:.3f} ms  (simulated {ticks * dt:.0f}s in {elapsed:.2f}s)")
+    for path, row_avg, row_max in rows:
+        print(f"  {path:<24}{row_avg:8.3f} ms avg {row_max:8.3f} ms max")
+    print(f"checksum={state_checksum(scene, app.services['time'])}")
+    clock.uninstall()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="8251Ngine headless simulation benchmark")
+    parser.add_argument("--bots", type=int, default=16)
+    parser.add_argument("--ticks", type=int, default=1800)
+    parser.add_argument("--seed", type=int, default=8251)
+    parser.add_argument("--dt", type=float, default=1 / 60)
+    args = parser.parse_args()
+    run(args.bots, args.ticks, args.seed, args.dt)
@@ -1,5 +1,10 @@
+from engine.core import startup_profiler
+# --profile-startup: 무거운 import보다 먼저 켜야 import 시간이 잡힘
+if startup_profiler.requested(): startup_profiler.enable()
+
 from engine.core.app import App
 from game.scenes.play_scene import PlayScene
+startup_profiler.mark("imports")
 
 if __name__ == "__main__":
     app = App(title="PxANIC! 3D - 8251Ngine", use_network=False)
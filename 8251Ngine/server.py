@@ -6,7 +6,11 @@ import random # For random roles
 
 # settings.py에서 필요한 상수들을 임포트해야 합니다.
 # 8251Ngine/settings.py에서 TILE_SIZE, NETWORK_PORT, DEFAULT_PHASE_DURATIONS 등을 가져옵니다.
-from settings import NETWORK_PORT, DEFAULT_PHASE_DURATIONS
+from settings import NETWORK_PORT, DEFAULT_PHASE_DURATIONS, SNAPSHOT_TICK_RATE, SNAPSHOT_HISTORY, AOI_RADIUS, AOI_FAR_INTERVAL
+from engine.net.snapshot import MSG_ACK, MSG_MOVE, message_type, encode_snapshot, decode_ack, decode_move
+from engine.net.interest import InterestGrid
+
+PLAYER_STATE_FIELDS = ('x', 'y', 'facing', 'is_moving')
 
 class GameServer:
     def __init__(self):
@@ -25,6 +29,21 @@ class GameServer:
         self.last_tick = time.time()
         self.game_loop_task = None
 
+        # [최적화] 틱 기반 델타 스냅샷 (MOVE를 즉시 재전송하지 않고 모아서 전송)
+        self.entity_states = {} # {entity_id: (x, y, fx, fy, is_moving)}
+        self.entity_owners = {} # {entity_id: 마지막으로 상태를 보낸 player_id} (본인에게는 다시 보내지 않음)
+        self.removed_entities = set() # 지난 스냅샷 틱 이후 사라진 entity_id (다음 틱에 모든 view에서 제거)
+        self.owned_entities = {} # {player_id: {그 클라이언트가 상태를 보내는 다른 entity_id(봇)}}
+        # 클라이언트마다 보낸 화면(view)이 다르므로 틱 번호와 ack 기준도 클라이언트별로 관리
+        self.client_snapshots = {} # {websocket: {'seq', 'acked', 'views': {seq: view}, 'next_far'}}
+        self.snapshot_task = None
+
+        # [최적화] 관심 영역(AOI): 반경 밖 엔티티는 AOI_FAR_INTERVAL마다만 갱신
+        self.interest = InterestGrid(AOI_RADIUS)
+
+        # [최적화] 플레이어 목록은 마지막으로 보낸 내용과 달라진 참가자만 PLAYER_LIST_DELTA로 전송
+        self.player_list_sent = {} # {player_id: 마지막으로 보낸 목록 항목}
+
     async def start(self):
         # 8765 포트로 변경
         self.server = await websockets.serve(self.handle_client, self.host, 8765) # NETWORK_PORT 대신 8765
@@ -32,6 +51,7 @@ class GameServer:
 
         # 게임 루프를 비동기 태스크로 시작
         self.game_loop_task = asyncio.create_task(self._game_loop())
+        self.snapshot_task = asyncio.create_task(self._snapshot_loop())
 
         await self.server.wait_closed()
 
@@ -54,6 +74,99 @@ class GameServer:
             
             # TODO: 다른 서버 측 게임 로직 업데이트 (NPC AI, 이벤트 등)
 
+    async def _snapshot_loop(self):
+        interval = 1.0 / SNAPSHOT_TICK_RATE
+        while True:
+            await asyncio.sleep(interval)
+            removed, self.removed_entities = self.removed_entities, set()
+            if not self.connected_clients: continue
+
+            now = time.time()
+            sends = []
+            for client, pid in self.connected_clients.items():
+                snap = self.client_snapshots.get(client)
+                if snap is None: continue
+                views = snap['views']
+
+                include_far = now >= snap['next_far']
+                if include_far: snap['next_far'] = now + AOI_FAR_INTERVAL
+                view = self._client_view(pid, views[snap['seq']], include_far, removed)
+                if view is not views[snap['seq']]: # 바뀐 것이 없으면 같은 dict를 그대로 돌려받음
+                    snap['seq'] += 1
+                    views[snap['seq']] = view
+                    if len(views) > SNAPSHOT_HISTORY: # ack가 오지 않는 중간 스냅샷 정리
+                        del views[min(k for k in views if k > snap['acked'])]
+
+                if snap['seq'] == snap['acked']: continue
+                # ack가 올 때까지 같은 seq를 반복 전송 (클라이언트는 중복을 무시)
+                payload = encode_snapshot(snap['seq'], snap['acked'], views[snap['acked']], views[snap['seq']])
+                if payload: sends.append(client.send(payload))
+            if sends:
+                await asyncio.gather(*sends, return_exceptions=True)
+
+    def _client_view(self, pid, latest, include_far, removed):
+        """
+        pid 클라이언트에게 보낼 엔티티 상태. 관심 영역 밖 엔티티는 latest(마지막으로 보낸 값)를 유지.
+        바뀐 것이 없으면 latest를 그대로 반환합니다.
+        """
+        owners = self.entity_owners
+        pos = self.interest.get_position(pid)
+        p = self.players.get(pid)
+        if include_far or pos is None or (p and p.get('group') == 'SPECTATOR'):
+            view = {eid: s for eid, s in self.entity_states.items() if owners.get(eid) != pid}
+            if len(view) == len(latest) and all(latest.get(eid) == s for eid, s in view.items()): return latest
+            return view
+
+        # [최적화] 전체 엔티티를 훑지 않고 관심 영역 안 엔티티와 사라진 엔티티만 latest에 반영
+        states = self.entity_states
+        near = self.interest.query(pos[0], pos[1], AOI_RADIUS)
+        # [수정] 봇 AI를 돌리는 호스트는 자기 봇 주변 엔티티도 실시간으로 받아야 함 (관심 영역 = 본인 + 봇 주변의 합집합)
+        for bid in self.owned_entities.get(pid, ()):
+            bpos = self.interest.get_position(bid)
+            if bpos is not None: near |= self.interest.query(bpos[0], bpos[1], AOI_RADIUS)
+        view = latest
+        for eid in near:
+            if owners.get(eid) == pid: continue
+            s = states.get(eid)
+            if s is None or latest.get(eid) == s: continue
+            if view is latest: view = dict(latest)
+            view[eid] = s
+        for eid in removed:
+            if eid not in view or eid in states: continue
+            if view is latest: view = dict(latest)
+            del view[eid]
+        return view
+
+    def _apply_move(self, sender_id, eid, state):
+        if eid not in self.players: return
+        x, y, fx, fy, is_moving = state
+        self.players[eid].update({'x': x, 'y': y, 'facing': [fx, fy], 'is_moving': is_moving})
+        self.entity_states[eid] = state
+        old_owner = self.entity_owners.get(eid)
+        if old_owner != sender_id:
+            if old_owner is not None: self.owned_entities.get(old_owner, set()).discard(eid)
+            if eid != sender_id: self.owned_entities.setdefault(sender_id, set()).add(eid)
+            self.entity_owners[eid] = sender_id
+        self.interest.update(eid, x, y)
+
+    def _remove_entity(self, eid):
+        owner = self.entity_owners.pop(eid, None)
+        if owner is not None: self.owned_entities.get(owner, set()).discard(eid)
+        if self.entity_states.pop(eid, None) is not None: self.removed_entities.add(eid)
+        self.interest.remove(eid)
+
+    def _process_binary(self, sender_id, websocket, data):
+        mtype = message_type(data)
+        if mtype == MSG_MOVE:
+            eid, state = decode_move(data)
+            self._apply_move(sender_id, eid, state)
+        elif mtype == MSG_ACK:
+            seq = decode_ack(data)
+            snap = self.client_snapshots.get(websocket)
+            if snap and seq > snap['acked'] and seq in snap['views']:
+                snap['acked'] = seq
+                for old in [k for k in snap['views'] if k < seq]: del snap['views'][old]
+
     async def _advance_phase(self):
         self.current_phase_idx = (self.current_phase_idx + 1) % len(self.phases)
         new_phase = self.phases[self.current_phase_idx]
@@ -66,6 +179,7 @@ class GameServer:
         player_id = self.next_id
         self.next_id += 1
         self.connected_clients[websocket] = player_id
+        self.client_snapshots[websocket] = {'seq': 0, 'acked': 0, 'views': {0: {}}, 'next_far': 0.0}
         
         # PxANIC! 서버의 초기 플레이어 데이터 구조 참고
         self.players[player_id] = {
@@ -79,11 +193,15 @@ class GameServer:
             # Welcome message with assigned ID
             await websocket.send(json.dumps({"type": "id_assignment", "id": player_id}))
             
-            # Broadcast updated player list to all clients
-            await self._broadcast_player_list()
+            # 기존 클라이언트에게는 변경분만, 새 클라이언트에게는 전체 목록을 전송
+            await self._broadcast_player_list(exclude_pid=player_id)
+            await websocket.send(json.dumps({"type": "PLAYER_LIST", "participants": list(self.players.values())}))
 
             async for message in websocket:
                 try:
+                    if isinstance(message, bytes):
+                        self._process_binary(player_id, websocket, message)
+                        continue
                     payload = json.loads(message)
                     await self._process_message(player_id, payload)
                 except json.JSONDecodeError as e:
@@ -96,8 +214,11 @@ class GameServer:
             print(f"[SERVER] Client handling Error for {player_id}: {e}")
         finally:
             del self.connected_clients[websocket]
+            self.client_snapshots.pop(websocket, None)
+            self.owned_entities.pop(player_id, None)
             if player_id in self.players:
                 del self.players[player_id]
+            self._remove_entity(player_id)
             await self._broadcast_player_list() # Update player list after disconnect
 
     async def _process_message(self, sender_id, data):
@@ -127,6 +248,7 @@ class GameServer:
             target_id = data.get('target_id')
             if target_id in self.players and self.players[target_id].get('type') == 'BOT':
                 del self.players[target_id]
+                self._remove_entity(target_id)
                 await self._broadcast_player_list()
         elif ptype == 'START_GAME':
             # PxANIC! server의 pid == 0 (호스트) 체크
@@ -142,19 +264,22 @@ class GameServer:
                 await self._broadcast({"type": "GAME_START", "players": self.players})
                 print("[SERVER] Game Started!")
         elif ptype == 'MOVE':
+            # 구버전(JSON) 클라이언트 호환: 즉시 재전송하지 않고 다음 스냅샷에 반영
             mid = data.get('id', sender_id)
             if mid in self.players:
-                self.players[mid].update({
-                    'x': data['x'], 'y': data['y'], 
-                    'facing': data.get('facing', self.players[mid].get('facing')), 
-                    'is_moving': data.get('is_moving', False)
-                })
-                # Exclude sender, as they already know their position
-                await self._broadcast(data, exclude_pid=sender_id)
+                facing = data.get('facing') or self.players[mid].get('facing') or [0, 1]
+                self._apply_move(sender_id, mid, (float(data['x']), float(data['y']), int(facing[0]), int(facing[1]), bool(data.get('is_moving', False))))
         # TODO: Add other message types from PxANIC! server (e.g., chat, item usage, skill use, etc.)
     
-    async def _broadcast_player_list(self):
-        await self._broadcast({"type": "PLAYER_LIST", "participants": list(self.players.values())})
+    async def _broadcast_player_list(self, exclude_pid=None):
+        # 위치/방향은 스냅샷으로 전달되므로 목록 비교에서 제외
+        entries = {pid: {k: v for k, v in p.items() if k not in PLAYER_STATE_FIELDS} for pid, p in self.players.items()}
+        sent = self.player_list_sent
+        changed = [self.players[pid] for pid, entry in entries.items() if sent.get(pid) != entry]
+        removed = [pid for pid in sent if pid not in entries]
+        self.player_list_sent = entries
+        if not changed and not removed: return
+        await self._broadcast({"type": "PLAYER_LIST_DELTA", "changed": changed, "removed": removed}, exclude_pid)
 
     async def _broadcast(self, message, exclude_pid=None):
         if not self.connected_clients: return
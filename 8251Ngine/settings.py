@@ -11,6 +11,7 @@ FPS = 60
 ENABLE_SHADOWS = False       
 SHADOW_QUALITY = 'LOW'
 USE_CULLING = True
+SPRITE_CACHE_MB = 64 # 줌 배율별 스케일 스프라이트 캐시 메모리 예산
 
 # [최적화] 전역 폰트 캐시 저장소 추가
 SHARED_FONTS = {}
@@ -194,3 +195,7 @@ INDOOR_ZONES = [6, 7, 8]
 NETWORK_PORT = 5555
 SERVER_IP = "127.0.0.1" # Localhost default
 BUFFER_SIZE = 4096
+SNAPSHOT_TICK_RATE = 20 # 서버 델타 스냅샷 전송 빈도 (Hz)
+SNAPSHOT_HISTORY = 64 # 클라이언트별로 보관하는 (ack 대기 중인) 스냅샷 수
+AOI_RADIUS = 20 # 서버 관심 영역 반경 (타일): 밖에 있는 엔티티는 저빈도 갱신
+AOI_FAR_INTERVAL = 1.0 # 관심 영역 밖 엔티티 갱신 주기 (초)
@@ -0,0 +1,294 @@
+"""
+성능 벤치마크 모음 (화면 없이 실행, 고정 시드, 저장소의 map.json 사용)
+FOV / 길찾기 / 바닥·그림자 렌더링 / 조명 / 네트워크 메시지 인코딩의 핫패스를 측정해 JSON으로 저장하고,
+저장된 기준값(bench_baseline.json)과 비교하여 허용치 이상 느려진 항목이 있으면 종료 코드 1을 반환합니다.
+측정 전에 동작 확인(CHECKS)을 먼저 실행하며, 하나라도 실패하면 측정 없이 종료 코드 1을 반환합니다.
+기준값은 측정한 머신에 종속되므로, 머신을 바꾸면 --save-baseline으로 다시 만드세요.
+
+사용법: python bench.py [--filter 이름] [--out 결과.json] [--baseline 파일] [--tolerance 0.25] [--save-baseline]
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import pygame
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_baseline.json")
+SEED = 8251
+SAMPLES = 7
+SAMPLE_TIME = 0.05 # 샘플 하나의 목표 시간(초) - 호출 횟수는 자동 보정
+
+BENCHES = [] # [(이름, 준비 함수)] - 준비 함수는 측정할 무인자 함수를 반환
+CHECKS = [] # [(이름, 확인 함수)] - 최적화가 동작을 바꾸지 않았는지 확인 (실패 시 AssertionError)
+
+def bench(name):
+    def register(setup):
+        BENCHES.append((name, setup))
+        return setup
+    return register
+
+def check(name):
+    def register(fn):
+        CHECKS.append((name, fn))
+        return fn
+    return register
+
+def measure(fn):
+    """호출 1회당 시간(us)의 중앙값/최솟값"""
+    fn() # 워밍업 (캐시/지연 초기화)
+    number = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(number): fn()
+        elapsed = time.perf_counter() - t0
+        if elapsed >= SAMPLE_TIME or number >= 1 << 20: break
+        number *= 2 if elapsed <= 0 else max(2, min(10, int(SAMPLE_TIME / elapsed) + 1))
+
+    samples = []
+    for _ in range(SAMPLES):
+        t0 = time.perf_counter()
+        for _ in range(number): fn()
+        samples.append((time.perf_counter() - t0) / number * 1e6)
+    samples.sort()
+    return {'median_us': round(samples[len(samples) // 2], 3), 'min_us': round(samples[0], 3), 'iterations': number}
+
+# --- 공용 월드 (헤드리스 PlayState 1개를 모든 벤치가 공유) ---
+_STATE = None
+
+def play_state():
+    global _STATE
+    if _STATE is None:
+        from core import clock
+        from systems.pathfinding import PathfindingService
+        from headless_sim import HeadlessGame
+        clock.install(clock.FixedClock(16))
+        PathfindingService._instance = PathfindingService(num_workers=0)
+        random.seed(SEED)
+        from states.play_state import PlayState
+        _STATE = PlayState(HeadlessGame(8))
+        _STATE.enter()
+        for _ in range(5): _STATE.update(0.016) # 카메라/시야 안정화
+    return _STATE
+
+def walkable_pairs(count):
+    """시드 고정 (출발, 도착) 보행 가능 칸 쌍"""
+    mm = play_state().world.map_manager
+    rng = random.Random(SEED)
+    cells = [(x, y) for y in range(mm.height) for x in range(mm.width) if not mm.collision_map[y * mm.width + x]]
+    return [(rng.choice(cells), rng.choice(cells)) for _ in range(count)]
+
+# --- FOV ---
+@bench("fov.cast_rays")
+def _():
+    state = play_state()
+    fov, p = state.fov, state.player
+    def run():
+        fov._cache.clear() # 제자리 캐시를 비워 실제 계산을 측정
+        fov.cast_rays(p.rect.centerx, p.rect.centery, 12, None, 60)
+    return run
+
+@bench("fov.cast_rays_cone")
+def _():
+    state = play_state()
+    fov, p = state.fov, state.player
+    def run():
+        fov._cache.clear()
+        fov.cast_rays(p.rect.centerx, p.rect.centery, 12, (1, 0), 60)
+    return run
+
+@bench("fov.get_poly_points")
+def _():
+    state = play_state()
+    fov, p = state.fov, state.player
+    return lambda: fov.get_poly_points(p.rect.centerx, p.rect.centery, 12, None, 60)
+
+# --- 길찾기 ---
+@bench("pathfinding.search_x16")
+def _():
+    from systems.pathfinding import PathfindingService
+    svc = PathfindingService.get_instance()
+    walk, stride, _ = svc._walk_snapshot(play_state().world.map_manager)
+    pairs = walkable_pairs(16)
+    def run():
+        for start, goal in pairs: svc._search(walk, stride, start, goal)
+    return run
+
+# --- 렌더링 ---
+@bench("render.draw_ground")
+def _():
+    state = play_state()
+    canvas = state.lighting.draw(state.game.screen, state.camera)
+    return lambda: state.map_renderer.draw_ground(canvas, state.camera, visible_tiles=state.visible_tiles, tile_alphas=state.tile_alphas)
+
+@bench("render.draw_all_shadows")
+def _():
+    state = play_state()
+    canvas = state.lighting.draw(state.game.screen, state.camera)
+    shift_x, shift_y = state.lighting.get_shadow_params()
+    return lambda: state.map_renderer.draw_all_shadows(canvas, state.camera, shift_x, shift_y)
+
+@bench("render.frame_day")
+def _():
+    state = play_state()
+    return lambda: state.draw(state.game.screen)
+
+@bench("lighting.night")
+def _():
+    state = play_state()
+    ts = state.time_system
+    ts.sync_time(ts.phases.index('NIGHT'), ts.state_timer, ts.day_count)
+    state.lighting.update(0.016)
+    def run():
+        state.lighting.draw(state.game.screen, state.camera)
+        state.lighting.apply_lighting(state.camera)
+    return run
+
+# --- 네트워크 메시지 ---
+def _move_message():
+    return {"type": "MOVE", "id": 3, "x": 1234, "y": 987, "is_moving": True, "facing": [1, 0]}
+
+def _player_list_message(count=16):
+    roles = ('CITIZEN', 'MAFIA', 'POLICE', 'DOCTOR')
+    return {"type": "PLAYER_LIST", "participants": [
+        {'id': i, 'name': f"Player {i}", 'role': roles[i % 4], 'type': 'BOT' if i else 'PLAYER', 'group': 'PLAYER'} for i in range(count)]}
+
+@bench("net.move_encode")
+def _():
+    from server import frame
+    msg = _move_message()
+    return lambda: frame(msg)
+
+@bench("net.move_decode")
+def _():
+    from server import frame
+    body = frame(_move_message())[4:]
+    return lambda: json.loads(body.decode('utf-8'))
+
+@bench("net.player_list_encode")
+def _():
+    from server import frame
+    msg = _player_list_message()
+    return lambda: frame(msg)
+
+@bench("net.player_list_decode")
+def _():
+    from server import frame
+    body = frame(_player_list_message())[4:]
+    return lambda: json.loads(body.decode('utf-8'))
+
+# --- 동작 확인 ---
+class _FakeConnection:
+    """ClientConnection 대역: 보낸 패킷만 모아 둠"""
+    closed = False
+    def __init__(self): self.packets = []
+    def enqueue(self, packet, droppable=False):
+        self.packets.append(packet)
+        return True
+
+@check("net.aoi_host_sees_bot_area")
+def _():
+    # 호스트(봇 AI 실행) 아바타와는 멀고 봇과는 가까운 사람의 MOVE도 호스트에게 즉시 전달되어야 함
+    from server import GameServer
+    from settings import AOI_RADIUS
+    server = GameServer()
+    host, human, stranger = _FakeConnection(), _FakeConnection(), _FakeConnection()
+    server.clients = {0: host, 1: human, 2: stranger}
+    for pid in server.clients: server.players[pid] = {'id': pid, 'group': 'PLAYER', 'type': 'PLAYER'}
+    server.players[3] = {'id': 3, 'group': 'PLAYER', 'type': 'BOT'}
+    far = AOI_RADIUS * 4
+    server.process_packet(0, {"type": "MOVE", "id": 0, "x": 0, "y": 0})
+    server.process_packet(0, {"type": "MOVE", "id": 3, "x": far, "y": far}) # 호스트가 보낸 봇 위치
+    server.process_packet(2, {"type": "MOVE", "id": 2, "x": 0, "y": far * 2})
+    host.packets.clear()
+    server.process_packet(1, {"type": "MOVE", "id": 1, "x": far + 8, "y": far})
+    assert len(host.packets) == 1, "host missed a MOVE next to its bot"
+    host.packets.clear()
+    server.process_packet(2, {"type": "MOVE", "id": 2, "x": 8, "y": far * 2})
+    assert not host.packets, "MOVE far from the host and its bots was sent immediately"
+
+def run_checks(name_filter=None):
+    failed = []
+    for name, fn in CHECKS:
+        if name_filter and name_filter not in name: continue
+        try:
+            fn()
+            print(f"  {name:<28}ok")
+        except AssertionError as e:
+            print(f"  {name:<28}FAILED: {e}")
+            failed.append(name)
+    return failed
+
+# --- 실행 / 비교 ---
+def run_benches(name_filter=None):
+    results = {}
+    for name, setup in BENCHES:
+        if name_filter and name_filter not in name: continue
+        random.seed(SEED)
+        results[name] = measure(setup())
+        r = results[name]
+        print(f"  {name:<28}{r['median_us']:12.2f} us  (min {r['min_us']:.2f}, x{r['iterations']})")
+    return results
+
+def compare(results, baseline, tolerance):
+    """기준값보다 (1 + tolerance)배 넘게 느려진 항목 목록 (잡음이 적은 최솟값끼리 비교)"""
+    regressions = []
+    for name, r in results.items():
+        base = baseline.get(name)
+        if not base: continue
+        ratio = r['min_us'] / base['min_us'] if base['min_us'] else 1.0
+        mark = "REGRESSION" if ratio > 1 + tolerance else "faster" if ratio < 1 - tolerance else "ok"
+        print(f"  {name:<28}{ratio:8.2f}x  {mark}")
+        if ratio > 1 + tolerance: regressions.append(name)
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="PxANIC! benchmarks")
+    parser.add_argument("--filter", default=None)
+    parser.add_argument("--out", default=None, help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args()
+
+    print("checks:")
+    failed = run_checks(args.filter)
+    if failed:
+        print(f"{len(failed)} check(s) failed: {', '.join(failed)}")
+        return 1
+
+    print(f"PxANIC! benchmarks (seed {SEED})")
+    report = {
+        'engine': 'PxANIC!',
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'machine': platform.machine(),
+        'results': run_benches(args.filter),
+    }
+
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f: json.dump(report, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f: json.dump(report, f, indent=2)
+        print(f"Baseline saved: {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print("No baseline to compare (use --save-baseline)")
+        return 0
+
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f).get('results', {})
+    print(f"vs baseline (tolerance {args.tolerance:.0%}):")
+    regressions = compare(report['results'], baseline, args.tolerance)
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
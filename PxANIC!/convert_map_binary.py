@@ -0,0 +1,75 @@
+"""
+JSON 맵을 바이너리 맵(.pxmap)으로 변환합니다.
+MapManager.load_map은 같은 이름의 .pxmap이 JSON보다 최신이면 그것을 읽습니다.
+변환 후 모든 청크를 다시 읽어 원본과 비교(왕복 검증)합니다.
+
+사용법: python convert_map_binary.py <맵파일.json> [출력.pxmap] [--raw]
+  --raw: zlib 압축 없이 저장 (로드가 조금 더 빠르고 파일이 큼)
+"""
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from world.map_format import MapFile, binary_path, layers_from_json, write_map, KIND_TILES
+
+def verify_round_trip(path, width, height, layers):
+    """저장한 파일을 청크 단위로 다시 읽어 원본 레이어와 비교. 불일치 목록 반환"""
+    errors = []
+    with MapFile(path) as mf:
+        if (mf.width, mf.height) != (width, height):
+            return [f"크기 불일치: {(mf.width, mf.height)} != {(width, height)}"]
+        for name, kind, ids, rots in layers:
+            if name not in mf.layers:
+                errors.append(f"레이어 없음: {name}"); continue
+            for y in range(height):
+                for x in range(width):
+                    idx = y * width + x
+                    expected = (ids[idx], rots[idx] * 90 if kind == KIND_TILES else 0)
+                    actual = mf.get(name, x, y)
+                    if actual != expected:
+                        errors.append(f"{name} ({x}, {y}): {actual} != {expected}")
+                        if len(errors) > 20: return errors
+    return errors
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    compress = '--raw' not in sys.argv
+    if not args:
+        print("사용법: python convert_map_binary.py <맵파일.json> [출력.pxmap] [--raw]")
+        sys.exit(1)
+
+    input_file = Path(args[0])
+    if not input_file.exists():
+        print(f"오류: 파일을 찾을 수 없습니다 - {input_file}")
+        sys.exit(1)
+    output_file = args[1] if len(args) > 1 else binary_path(str(input_file))
+
+    t0 = time.perf_counter()
+    with open(input_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    t_json = time.perf_counter() - t0
+
+    width, height, layers = layers_from_json(data)
+    write_map(output_file, width, height, layers, compress=compress)
+
+    errors = verify_round_trip(output_file, width, height, layers)
+    if errors:
+        print("✗ 왕복 검증 실패:")
+        for e in errors: print(f"  - {e}")
+        sys.exit(1)
+
+    t0 = time.perf_counter()
+    with MapFile(output_file) as mf:
+        for name in mf.layers:
+            for cy in range(mf.rows):
+                for cx in range(mf.cols): mf.read_chunk(name, cx, cy)
+    t_bin = time.perf_counter() - t0
+
+    print(f"✓ 변환 완료: {input_file} -> {output_file}")
+    print(f"  크기 {width}x{height}, 레이어 {[name for name, _, _, _ in layers]}")
+    print(f"  파일 {os.path.getsize(input_file):,} B -> {os.path.getsize(output_file):,} B")
+    print(f"  읽기 json.load {t_json * 1000:.1f} ms / 전체 청크 디코딩 {t_bin * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""
+게임 로직용 시계
+시뮬레이션 코드(엔티티 타이머, 문, 이펙트 수명 등)는 pygame.time.get_ticks() 대신 clock.get_ticks()를 호출합니다.
+평소에는 pygame 시계 그대로이고, 헤드리스 시뮬레이션은 FixedClock을 install()하여 틱마다 고정 간격으로 시간을 진행시킵니다.
+(get_ticks를 모듈 속성으로 바꿔 끼우므로 평소 호출 비용은 pygame 함수 호출과 같습니다.)
+"""
+import pygame
+
+get_ticks = pygame.time.get_ticks
+
+class FixedClock:
+    """advance()를 호출할 때만 흐르는 시계 (ms 단위 정수)"""
+    def __init__(self, step_ms, start_ms=1000):
+        # 실제 게임처럼 0이 아닌 시각에서 시작 (pygame.init() 이후의 get_ticks()와 비슷하게)
+        self.step_ms = step_ms
+        self.now = start_ms
+
+    def get_ticks(self):
+        return self.now
+
+    def advance(self, ms=None):
+        self.now += self.step_ms if ms is None else ms
+        return self.now
+
+def install(fixed_clock):
+    global get_ticks
+    get_ticks = fixed_clock.get_ticks
+
+def uninstall():
+    global get_ticks
+    get_ticks = pygame.time.get_ticks
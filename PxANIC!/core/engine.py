@@ -1,10 +1,10 @@
 import pygame
 import sys
 import gc
-import time
 from settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
 from core.state_machine import StateMachine
 from systems.logger import GameLogger
+from systems import startup_profiler, frame_profiler
 
 class GameEngine:
     def __init__(self):
@@ -28,32 +28,29 @@ class GameEngine:
 
         from states.menu_state import MenuState
         self.state_machine.push(MenuState(self))
+        startup_profiler.mark("engine init")
         
-        # Profiling
-        self.last_profile_time = time.time()
-        self.frame_count = 0
+        # Profiling (콘솔 'prof' 명령 또는 --profile-frames로 켬)
+        self.profiler = frame_profiler.PROFILER
+        self.export_trace_on_exit = frame_profiler.requested()
+        if self.export_trace_on_exit: self.profiler.set_enabled(True)
 
     def run(self):
         self.logger.info("SYSTEM", "Engine Loop Started")
+        first_frame = True
         while self.running:
             dt = self.clock.tick(FPS) / 1000.0
             
-            # Profiling
-            start_t = time.perf_counter()
+            prof = self.profiler
+            prof.begin_frame()
+            with prof.scope("events"): self.process_events()
+            with prof.scope("update"): self.update(dt)
+            with prof.scope("draw"): self.draw()
+            prof.end_frame()
             
-            self.process_events()
-            self.update(dt)
-            self.draw()
-            
-            end_t = time.perf_counter()
-            frame_time = (end_t - start_t) * 1000
-            
-            self.frame_count += 1
-            if time.time() - self.last_profile_time >= 1.0:
-                # Uncomment to see FPS logs
-                # print(f"[Profile] FPS: {self.clock.get_fps():.1f} | Frame Time: {frame_time:.2f}ms")
-                self.last_profile_time = time.time()
-                self.frame_count = 0
+            if first_frame:
+                startup_profiler.finish()
+                first_frame = False
 
         self.quit()
 
@@ -76,9 +73,14 @@ class GameEngine:
 
     def draw(self):
         self.state_machine.draw(self.screen)
-        pygame.display.flip()
+        if self.profiler.overlay:
+            with self.profiler.scope("profiler"): self.profiler.draw_overlay(self.screen)
+        with self.profiler.scope("flip"): pygame.display.flip()
 
     def quit(self):
         self.logger.info("SYSTEM", "Engine Shutting Down")
+        if self.export_trace_on_exit and self.profiler.frames:
+            path = self.profiler.export_chrome_trace()
+            print(f"[Profile] Frame trace saved: {path}")
         pygame.quit()
         sys.exit()
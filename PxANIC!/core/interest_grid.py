@@ -0,0 +1,59 @@
+class InterestGrid:
+    """
+    서버용 관심 영역(AOI) 그리드.
+    MOVE로 받은 엔티티 좌표(픽셀)를 셀 단위로 보관하고, 특정 위치 반경 안의 엔티티를 빠르게 찾습니다.
+    """
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.inv_cell_size = 1.0 / cell_size # [Optimization] Precompute inverse
+
+        self.cells = {} # {(gx, gy): {entity_id, ...}}
+        self.positions = {} # {entity_id: (x, y)}
+        self.entity_cells = {} # {entity_id: (gx, gy)}
+
+    def _get_cell_coords(self, x, y):
+        return int(x * self.inv_cell_size), int(y * self.inv_cell_size)
+
+    def update(self, eid, x, y):
+        self.positions[eid] = (x, y)
+        key = self._get_cell_coords(x, y)
+        old_key = self.entity_cells.get(eid)
+        if old_key == key: return
+
+        if old_key is not None:
+            cell = self.cells.get(old_key)
+            if cell is not None:
+                cell.discard(eid)
+                if not cell: del self.cells[old_key]
+        self.cells.setdefault(key, set()).add(eid)
+        self.entity_cells[eid] = key
+
+    def remove(self, eid):
+        self.positions.pop(eid, None)
+        key = self.entity_cells.pop(eid, None)
+        if key is None: return
+        cell = self.cells.get(key)
+        if cell is not None:
+            cell.discard(eid)
+            if not cell: del self.cells[key]
+
+    def get_position(self, eid):
+        return self.positions.get(eid)
+
+    def query(self, x, y, radius):
+        """(x, y)에서 radius 안에 있는 엔티티 id 집합"""
+        gx, gy = self._get_cell_coords(x, y)
+        r = int(radius * self.inv_cell_size) + 1
+        r_sq = radius * radius
+        cells, positions = self.cells, self.positions
+
+        result = set()
+        for cy in range(gy - r, gy + r + 1):
+            for cx in range(gx - r, gx + r + 1):
+                cell = cells.get((cx, cy))
+                if not cell: continue
+                for eid in cell:
+                    ex, ey = positions[eid]
+                    if (ex - x) ** 2 + (ey - y) ** 2 <= r_sq:
+                        result.add(eid)
+        return result
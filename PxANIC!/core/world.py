@@ -6,6 +6,7 @@ from entities.player import Player
 from entities.npc import Dummy
 from settings import TILE_SIZE, ZONES
 from core.spatial_grid import SpatialGrid
+from core import clock
 
 class GameWorld:
     def __init__(self, game):
@@ -107,7 +108,7 @@ class GameWorld:
             self.register_entity(self.player)
 
     def update(self, dt, current_phase, weather, day_count):
-        now = pygame.time.get_ticks()
+        now = clock.get_ticks()
         if self.is_blackout and now > self.blackout_timer: self.is_blackout = False
         if self.is_mafia_frozen and now > self.frozen_timer: self.is_mafia_frozen = False
         self.map_manager.update_doors(dt, [self.player] + self.npcs)
@@ -3,6 +3,7 @@ import random
 from settings import TILE_SIZE, ITEMS
 from colors import CUSTOM_COLORS
 from world.tiles import check_collision, get_tile_function, get_tile_category, BED_TILES, HIDEABLE_TILES
+from core import clock
 
 class Entity:
     def __init__(self, x, y, map_data, map_width, map_height, zone_map, name="Entity", role="CITIZEN", map_manager=None):
@@ -77,7 +78,7 @@ class Entity:
         self.popups.append({
             'text': text,
             'color': color,
-            'timer': pygame.time.get_ticks() + 1500
+            'timer': clock.get_ticks() + 1500
         })
 
     # [추가] 경찰이 확인하는 공개 외형 정보
@@ -97,10 +98,10 @@ class Entity:
         self.hp = min(self.max_hp, self.hp + 1)
 
     def is_stunned(self):
-        return pygame.time.get_ticks() < self.stun_timer
+        return clock.get_ticks() < self.stun_timer
 
     def take_stun(self, duration_ms=2000):
-        self.stun_timer = pygame.time.get_ticks() + duration_ms
+        self.stun_timer = clock.get_ticks() + duration_ms
         self.is_moving = False
         if hasattr(self, 'path'): self.path = []
 
@@ -216,15 +217,16 @@ class Entity:
         end_gy = min(self.map_height, (self.rect.bottom // TILE_SIZE) + 1)
 
         # [최적화] 캐시 조회용 변수 미리 할당
-        collision_cache = getattr(self.map_manager, 'collision_cache', None)
+        collision_map = getattr(self.map_manager, 'collision_map', None)
+        map_w = self.map_manager.width if self.map_manager else 0
 
         for y in range(start_gy, end_gy):
             for x in range(start_gx, end_gx):
                 is_blocking = False
                 
                 # [핵심 최적화] 복잡한 타일 조회 대신 캐시된 불리언 값(True/False)만 확인
-                if collision_cache:
-                    if collision_cache[y][x]:
+                if collision_map:
+                    if collision_map[y * map_w + x]:
                         is_blocking = True
                 else:
                     # 백업 로직
@@ -1,15 +1,15 @@
 import pygame
 import random
 import math
-import heapq
-import threading
 from settings import *
 from world.tiles import check_collision, get_tile_function, BED_TILES, HIDEABLE_TILES, get_tile_interaction, get_tile_category, get_tile_name, TRANSPARENT_TILES
 from systems.logger import GameLogger
 from colors import *
 from .entity import Entity
 from systems.renderer import CharacterRenderer
+from systems.pathfinding import PathfindingService
 from systems.behavior_tree import BTNode, Composite, Selector, Sequence, Action, Condition, BTState
+from core import clock
 
 FONT_POPUP = None
 
@@ -42,11 +42,12 @@ class Dummy(Entity):
         self.path = []
         self.current_path_target = None
         self.last_pos = (self.pos_x, self.pos_y)
-        self.stuck_timer = pygame.time.get_ticks() + 2000
+        self.stuck_timer = clock.get_ticks() + 2000
         self.failed_targets = {}
 
         self.is_pathfinding = False
-        self.pending_path = None
+        self.path_future = None # PathfindingService 결과 (매 프레임 폴링)
+        self.path_request_target = None
         self.path_cooldown = 0
 
         self.action_cooldown = 0
@@ -88,7 +89,7 @@ class Dummy(Entity):
         self.ai_timer = random.randint(0, 10) # Stagger updates
 
     def add_popup(self, text, color=(255, 255, 255)):
-        self.popups.append({'text': text, 'color': color, 'timer': pygame.time.get_ticks() + 1500})
+        self.popups.append({'text': text, 'color': color, 'timer': clock.get_ticks() + 1500})
 
     def add_suspicion(self, target_name, amount):
         self.suspicion_meter[target_name] = self.suspicion_meter.get(target_name, 0) + amount
@@ -208,7 +209,7 @@ class Dummy(Entity):
         dist = math.sqrt((self.rect.centerx - self.chase_target.rect.centerx)**2 + (self.rect.centery - self.chase_target.rect.centery)**2)
         if dist > 200 and not self.ability_used and self.ap >= 5:
             self.ability_used = True; self.ap -= 5; return "USE_SIREN"
-        now = pygame.time.get_ticks()
+        now = clock.get_ticks()
         if dist < 400 and now > self.last_attack_time + 1000:
             if self.try_spend_ap(1): self.last_attack_time = now; return "SHOOT_TARGET"
         self.set_destination(self.chase_target.rect.centerx, self.chase_target.rect.centery, "Chasing")
@@ -249,7 +250,7 @@ class Dummy(Entity):
         return BTState.RUNNING
 
     def do_work(self, entity, bb):
-        now = pygame.time.get_ticks()
+        now = clock.get_ticks()
         if self.is_working:
             if now >= self.work_finish_timer:
                 self.ap -= 1; self.coins += 1; self.daily_work_count += 1
@@ -293,7 +294,7 @@ class Dummy(Entity):
         if self.ap >= 1 and self.chase_target:
             dist = math.sqrt((self.rect.centerx - self.chase_target.rect.centerx)**2 + (self.rect.centery - self.chase_target.rect.centery)**2)
             if dist < TILE_SIZE * 1.5:
-                self.ap -= 1; self.chase_target.take_damage(10); self.action_cooldown = pygame.time.get_ticks() + 1000
+                self.ap -= 1; self.chase_target.take_damage(10); self.action_cooldown = clock.get_ticks() + 1000
                 return "MURDER_OCCURRED"
             self.set_destination(self.chase_target.rect.centerx, self.chase_target.rect.centery, "Killing")
         return BTState.RUNNING
@@ -324,7 +325,7 @@ class Dummy(Entity):
     def update(self, phase, player, npcs, is_mafia_frozen, noise_list, day_count, bloody_footsteps, siren_timer=0):
         if not self.alive: return None
         self._validate_environment()
-        now = pygame.time.get_ticks(); self.check_stat_changes()
+        now = clock.get_ticks(); self.check_stat_changes()
         
         # [Sync Logic] Only Master updates logic
         if self.is_master:
@@ -339,9 +340,12 @@ class Dummy(Entity):
                         if self.map_manager: self.map_manager.unlock_door(nx, ny); self.add_popup("Unlocked!")
                     return None
                 return BTState.RUNNING
-            if self.pending_path is not None:
-                if not self.is_hiding: self.path = self.pending_path
-                self.pending_path = None; self.is_pathfinding = False
+            if self.path_future is not None and self.path_future.done():
+                result = self.path_future.result()
+                if result is not None:
+                    if result: self.current_path_target = self.path_request_target
+                    if not self.is_hiding: self.path = list(result) # 결과는 공유되므로 복사해서 소비
+                self.path_future = None; self.is_pathfinding = False
             
             blackboard = {'phase': phase, 'player': player, 'npcs': npcs, 'targets': npcs + [player], 'noise_list': noise_list, 'bloody_footsteps': bloody_footsteps, 'day_count': day_count, 'is_mafia_frozen': is_mafia_frozen}
             
@@ -403,47 +407,20 @@ class Dummy(Entity):
         if self.is_pathfinding: return False
         
         # [수정] 현재 경로가 없고 멈춰있는 상태라면 쿨타임 무시 (즉시 반응)
-        now = pygame.time.get_ticks()
+        now = clock.get_ticks()
         if self.path or self.is_moving:
             if now < self.path_cooldown: return False
             
         self.path_cooldown = now + 500
         self.is_pathfinding = True
         
-        # [수정] 스레드 안전성 확보: 현재 위치를 미리 계산하여 전달
+        # [최적화] 요청마다 스레드를 만들지 않고 공용 길찾기 워커 풀에 요청 (결과는 update에서 폴링)
         start_gx = int(self.rect.centerx // TILE_SIZE)
         start_gy = int(self.rect.centery // TILE_SIZE)
         
-        thread = threading.Thread(target=self._threaded_calculate_path, args=(start_gx, start_gy, tgx, tgy, reason))
-        thread.daemon = True; thread.start(); return True
-
-    def _threaded_calculate_path(self, start_gx, start_gy, target_gx, target_gy, reason):
-        try:
-            # start_gx, start_gy는 인자로 받음 (self.rect 접근 제거)
-            if (start_gx, start_gy) == (target_gx, target_gy): self.pending_path = []; return
-            open_set = []; heapq.heappush(open_set, (0, start_gx, start_gy)); came_from = {}; g_score = {(start_gx, start_gy): 0}
-            while open_set and len(came_from) < 5000:
-                _, cx, cy = heapq.heappop(open_set)
-                if (cx, cy) == (target_gx, target_gy): break
-                for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                    nx, ny = cx + dx, cy + dy
-                    if 0 <= nx < self.map_width and 0 <= ny < self.map_height:
-                        tid_obj = self.map_manager.get_tile(nx, ny, 'object') if self.map_manager else 0
-                        tid_wall = self.map_manager.get_tile(nx, ny, 'wall') if self.map_manager else self.map_data[ny][nx]
-                        blocked = check_collision(tid_wall) or (tid_obj != 0 and check_collision(tid_obj))
-                        if get_tile_category(tid_obj) == 5: blocked = False
-                        if (nx, ny) == (target_gx, target_gy): blocked = False
-                        if not blocked:
-                            new_g = g_score[(cx, cy)] + 1
-                            if (nx, ny) not in g_score or new_g < g_score[(nx, ny)]:
-                                g_score[(nx, ny)] = new_g; priority = new_g + abs(target_gx - nx) + abs(target_gy - ny)
-                                heapq.heappush(open_set, (priority, nx, ny)); came_from[(nx, ny)] = (cx, cy)
-            if (target_gx, target_gy) in came_from:
-                path = []; curr = (target_gx, target_gy)
-                while curr in came_from: path.append(curr); curr = came_from[curr]
-                self.pending_path = path[::-1]; self.current_path_target = (target_gx, target_gy)
-            else: self.pending_path = None; self.is_pathfinding = False
-        except: self.is_pathfinding = False
+        self.path_request_target = (tgx, tgy)
+        self.path_future = PathfindingService.get_instance().request(self.map_manager, (start_gx, start_gy), (tgx, tgy))
+        return True
 
     def process_movement(self, phase, npcs=None, slow_down=False):
         if self.is_hiding: return None
@@ -457,7 +434,7 @@ class Dummy(Entity):
         else:
             self.status_effects['DOPAMINE'] = False
 
-        now = pygame.time.get_ticks(); self.move_state, self.speed = "WALK", SPEED_WALK
+        now = clock.get_ticks(); self.move_state, self.speed = "WALK", SPEED_WALK
         if self.chase_target: 
             self.move_state, self.speed = "RUN", SPEED_RUN
             # [New] Dopamine Effect: Faster Chase
@@ -616,5 +593,5 @@ class Dummy(Entity):
         if not self.is_hiding or self.hiding_type == 2:
             y_off = 0
             for p in reversed(self.popups):
-                if pygame.time.get_ticks() < p['timer']:
+                if clock.get_ticks() < p['timer']:
                     txt = FONT_POPUP.render(p['text'], True, p['color']); screen.blit(txt, (rx + TILE_SIZE//2 - txt.get_width()//2, ry - 20 - y_off)); y_off += 15
@@ -15,6 +15,7 @@ from entities.player_logic.movement import MovementLogic
 from entities.player_logic.status import StatusLogic
 from entities.player_logic.actions import ActionLogic
 from entities.player_logic.inventory import InventoryLogic
+from core import clock
 
 class Player(Entity):
     def __init__(self, x, y, width, height, map_data, zone_map, map_manager=None):
@@ -121,7 +122,7 @@ class Player(Entity):
         if not self.alive: return []
         if self.minigame.active: self.minigame.update(); return []
         
-        now = pygame.time.get_ticks()
+        now = clock.get_ticks()
         
         # Delegate to Logic Components
         self.calculate_emotions(phase, npcs, is_blackout)
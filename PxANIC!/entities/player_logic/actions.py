@@ -5,6 +5,7 @@ from settings import TILE_SIZE, VENDING_MACHINE_TID, TREASURE_CHEST_RATES, ITEMS
 from world.tiles import get_tile_category, get_tile_interaction, get_tile_function, get_tile_name, check_collision
 from entities.bullet import Bullet
 from systems.logger import GameLogger
+from core import clock
 
 class ActionLogic:
     def __init__(self, player):
@@ -123,7 +124,7 @@ class ActionLogic:
     def do_attack(self, target):
         if not self.p.alive or self.p.role == "SPECTATOR": return None
         if not target or not target.alive: return None
-        now = pygame.time.get_ticks()
+        now = clock.get_ticks()
         if now - self.p.last_attack_time < self.p.attack_cooldown: return None
         self.p.last_attack_time = now
         
@@ -0,0 +1,96 @@
+"""
+헤드리스 시뮬레이션 벤치마크: 화면 없이(SDL dummy 드라이버) PlayState.update를 고정 간격으로 최대 속도로 돌려
+초당 틱 수와 시스템별(world / lighting / npcs / fov) 소요 시간을 출력합니다.
+- 시계: core.clock에 FixedClock을 설치하여 틱마다 --dt 만큼만 진행 (벽시계와 무관)
+- 길찾기: 워커 스레드 없이 요청 즉시 탐색 (결과 도착 시점이 실행마다 달라지지 않도록)
+- 난수: --seed로 고정. 같은 옵션이면 마지막에 출력되는 상태 체크섬이 같아야 합니다.
+- 그리기/입력/네트워크는 하지 않으며, 로컬 플레이어는 입력 없이 서 있습니다.
+
+사용법: python headless_sim.py [--bots N] [--ticks N] [--seed N] [--dt 초]
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import hashlib
+import random
+import time
+from collections import deque
+import pygame
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from core import clock
+from systems.logger import GameLogger
+from systems.pathfinding import PathfindingService
+from systems.frame_profiler import PROFILER
+
+BOT_ROLES = ('CITIZEN', 'MAFIA', 'CITIZEN', 'POLICE', 'CITIZEN', 'DOCTOR')
+
+class HeadlessGame:
+    """PlayState가 GameEngine에서 사용하는 속성만 갖춘 대역 (상태 머신/메인 루프 없음)"""
+    def __init__(self, num_bots):
+        pygame.init()
+        self.screen_width, self.screen_height = SCREEN_WIDTH, SCREEN_HEIGHT
+        self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
+        self.logger = GameLogger.get_instance()
+        self.running = True
+        participants = [{'id': 0, 'name': 'Player 1', 'role': 'CITIZEN', 'type': 'PLAYER', 'group': 'PLAYER'}]
+        for i in range(num_bots):
+            participants.append({'id': i + 1, 'name': f"Bot {i + 1}", 'role': BOT_ROLES[i % len(BOT_ROLES)], 'type': 'BOT', 'group': 'PLAYER'})
+        self.shared_data = {'participants': participants}
+
+def state_checksum(state):
+    """엔티티 위치/체력/역할과 시간 단계로 만든 해시 (같은 시드 = 같은 값)"""
+    h = hashlib.md5()
+    for e in sorted([state.player] + state.npcs, key=lambda e: e.uid):
+        h.update(f"{e.uid}:{e.pos_x:.3f}:{e.pos_y:.3f}:{e.hp}:{e.alive}:{e.role};".encode())
+    ts = state.time_system
+    h.update(f"{ts.day_count}:{ts.current_phase}:{ts.state_timer:.3f}".encode())
+    return h.hexdigest()[:12]
+
+def run(num_bots, ticks, seed, dt):
+    random.seed(seed)
+    step_ms = max(1, int(round(dt * 1000)))
+    dt = step_ms / 1000 # 시계와 update(dt)가 같은 간격을 쓰도록 ms 단위로 맞춤
+    fixed = clock.FixedClock(step_ms)
+    clock.install(fixed)
+    PathfindingService._instance = PathfindingService(num_workers=0)
+
+    t0 = time.perf_counter()
+    game = HeadlessGame(num_bots)
+    from states.play_state import PlayState
+    state = PlayState(game)
+    state.enter()
+    setup_ms = (time.perf_counter() - t0) * 1000
+
+    # 전 구간 통계를 위해 링 버퍼를 틱 수만큼 확보
+    PROFILER.frames = deque(maxlen=ticks)
+    PROFILER.set_enabled(True)
+    start = time.perf_counter()
+    for _ in range(ticks):
+        PROFILER.begin_frame()
+        with PROFILER.scope("update"): state.update(dt)
+        PROFILER.end_frame()
+        fixed.advance()
+    elapsed = time.perf_counter() - start
+
+    avg, peak, rows = PROFILER.summary(count=ticks)
+    pf = PathfindingService.get_instance()
+    print(f"bots={len(state.npcs)} ticks={ticks} dt={dt}s seed={seed} (setup {setup_ms:.0f} ms)")
+    print(f"{ticks / elapsed:.1f} ticks/s  avg {avg:.3f} ms  max {peak:.3f} ms  (simulated {ticks * dt:.0f}s in {elapsed:.2f}s)")
+    for path, row_avg, row_max in rows:
+        print(f"  {path:<24}{row_avg:8.3f} ms avg {row_max:8.3f} ms max")
+    print(f"pathfinding: {pf.requests} requests, {pf.searches} searches, {pf.cache_hits} cache hits, {pf.deduped} deduped")
+    print(f"checksum={state_checksum(state)}")
+
+    clock.uninstall()
+    GameLogger.get_instance().running = False
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="PxANIC! headless simulation benchmark")
+    parser.add_argument("--bots", type=int, default=16)
+    parser.add_argument("--ticks", type=int, default=1800)
+    parser.add_argument("--seed", type=int, default=8251)
+    parser.add_argument("--dt", type=float, default=1 / 60)
+    args = parser.parse_args()
+    run(args.bots, args.ticks, args.seed, args.dt)
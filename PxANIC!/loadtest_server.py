@@ -0,0 +1,81 @@
+"""
+서버 부하 테스트: 로컬에 GameServer를 띄우고 가짜 클라이언트 N개가 MOVE를 보내
+수신 처리량과 지연 시간(p50/p99)을 측정합니다.
+클라이언트와 서버가 같은 이벤트 루프에서 돌기 때문에 수치는 실제보다 보수적으로 나옵니다.
+
+사용법: python loadtest_server.py [클라이언트 수] [초당 MOVE 수] [측정 시간(초)] [포트]
+"""
+import asyncio
+import json
+import random
+import sys
+import time
+from server import GameServer, frame
+from settings import TILE_SIZE
+
+async def fake_client(port, rate, duration, spread, stats):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    header = await reader.readexactly(4)
+    welcome = json.loads(await reader.readexactly(int.from_bytes(header, 'big')))
+    pid = welcome['my_id']
+
+    x = random.uniform(0, spread); y = random.uniform(0, spread)
+    running = True
+
+    async def receiver():
+        try:
+            while running:
+                header = await reader.readexactly(4)
+                msg = json.loads(await reader.readexactly(int.from_bytes(header, 'big')))
+                if msg.get('type') == 'MOVE' and 'sent_at' in msg:
+                    stats['received'] += 1
+                    stats['latencies'].append(time.perf_counter() - msg['sent_at'])
+        except (asyncio.IncompleteReadError, ConnectionError, asyncio.CancelledError):
+            pass
+
+    recv_task = asyncio.create_task(receiver())
+    interval = 1.0 / rate
+    end = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        x += random.uniform(-4, 4); y += random.uniform(-4, 4)
+        writer.write(frame({"type": "MOVE", "id": pid, "x": x, "y": y, "is_moving": True, "facing": [1, 0], "sent_at": time.perf_counter()}))
+        stats['sent'] += 1
+        await writer.drain()
+        await asyncio.sleep(interval)
+
+    await asyncio.sleep(0.5) # 남은 패킷 수신 대기
+    running = False
+    recv_task.cancel()
+    writer.close()
+
+async def run(num_clients, rate, duration, port):
+    server = GameServer()
+    server.port = port
+    server_task = asyncio.create_task(server.serve())
+    await asyncio.sleep(0.2)
+
+    stats = {'sent': 0, 'received': 0, 'latencies': []}
+    # 절반 정도가 서로의 관심 영역 안에 들어오도록 배치
+    spread = TILE_SIZE * 24 * max(1, int(num_clients ** 0.5) // 2)
+    start = time.perf_counter()
+    await asyncio.gather(*[fake_client(port, rate, duration, spread, stats) for _ in range(num_clients)])
+    elapsed = time.perf_counter() - start
+
+    await asyncio.sleep(0.2) # 서버 쪽 연결 정리 대기
+    server.stop()
+    server_task.cancel()
+    await asyncio.gather(server_task, return_exceptions=True)
+
+    lat = sorted(stats['latencies'])
+    def pct(p): return lat[min(len(lat) - 1, int(len(lat) * p))] * 1000 if lat else 0.0
+    print(f"clients={num_clients} rate={rate}/s duration={duration}s")
+    print(f"sent={stats['sent']} ({stats['sent'] / elapsed:.0f}/s) received={stats['received']} ({stats['received'] / elapsed:.0f}/s)")
+    print(f"latency p50={pct(0.50):.2f}ms p99={pct(0.99):.2f}ms max={pct(1.0):.2f}ms")
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    num_clients = int(args[0]) if len(args) > 0 else 32
+    rate = float(args[1]) if len(args) > 1 else 20
+    duration = float(args[2]) if len(args) > 2 else 5
+    port = int(args[3]) if len(args) > 3 else 5556
+    asyncio.run(run(num_clients, rate, duration, port))
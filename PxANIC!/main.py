@@ -1,7 +1,12 @@
 import sys
 import os
 import subprocess
+from systems import startup_profiler
+# --profile-startup: 무거운 import보다 먼저 켜야 import 시간이 잡힘
+if startup_profiler.requested(): startup_profiler.enable()
+
 from core.engine import GameEngine
+startup_profiler.mark("imports")
 
 # 현재 디렉토리를 경로에 추가
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
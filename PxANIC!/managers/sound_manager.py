@@ -1,5 +1,6 @@
 import pygame
 import os
+from systems.synth_names import SFX_NAMES # 전부 파일로 있으면 synth/NumPy를 불러오지 않고 끝냄
 
 class SoundManager:
     _instance = None
@@ -37,6 +38,22 @@ class SoundManager:
                         print(f"[SoundManager] Failed to load {f}: {e}")
         else:
             print("[SoundManager] SFX directory not found")
+        self._synthesize_missing()
+
+    def _synthesize_missing(self):
+        """파일이 없는 효과음은 synth 레시피로 메모리에서 바로 합성 (WAV를 쓰지 않음)"""
+        missing = [key for key in SFX_NAMES if key not in self.sounds]
+        if not missing or not pygame.mixer.get_init(): return
+        # [수정] synth는 NumPy를 불러오므로 빠진 효과음이 있을 때만 가져옴
+        from systems import synth
+        if not synth.AVAILABLE: return
+        for key in missing:
+            try:
+                sound = synth.to_sound(synth.SFX[key]())
+                sound.set_volume(self.sfx_volume)
+                self.sounds[key] = sound
+            except Exception as e:
+                print(f"[SoundManager] Failed to synthesize {key}: {e}")
 
     def play_sfx(self, key, volume=None):
         if key in self.sounds:
@@ -1,22 +1,75 @@
-import socket
-import threading
+import asyncio
 import json
 import time
-from settings import NETWORK_PORT, BUFFER_SIZE, DEFAULT_PHASE_DURATIONS
+from settings import NETWORK_PORT, DEFAULT_PHASE_DURATIONS, AOI_RADIUS, AOI_FAR_INTERVAL, CLIENT_QUEUE_THROTTLE, CLIENT_QUEUE_LIMIT
+from core.interest_grid import InterestGrid
+
+def frame(data):
+    """4바이트 길이 헤더 + JSON 본문"""
+    serialized = json.dumps(data).encode('utf-8')
+    return len(serialized).to_bytes(4, 'big') + serialized
+
+class ClientConnection:
+    """
+    클라이언트 하나의 송신 큐와 writer 태스크.
+    패킷은 큐에 쌓아 두고 writer가 한 번에 모아서(writelines) 보냅니다.
+    """
+    def __init__(self, pid, reader, writer):
+        self.pid = pid
+        self.reader = reader
+        self.writer = writer
+        self.queue = []
+        self.wakeup = asyncio.Event()
+        self.closed = False
+        self.dropped_moves = 0
+        self.task = asyncio.create_task(self._writer_loop())
+
+    def enqueue(self, packet, droppable=False):
+        """큐가 가득 차면 MOVE(droppable)는 버리고, 그 외 패킷은 연결 종료 (False 반환)"""
+        if self.closed: return False
+        pending = len(self.queue)
+        if pending >= CLIENT_QUEUE_LIMIT: return False
+        if droppable and pending >= CLIENT_QUEUE_THROTTLE:
+            self.dropped_moves += 1
+            return True
+        self.queue.append(packet)
+        self.wakeup.set()
+        return True
+
+    async def _writer_loop(self):
+        try:
+            while not self.closed:
+                await self.wakeup.wait()
+                self.wakeup.clear()
+                if not self.queue: continue
+                # [최적화] 쌓인 패킷을 한 번의 writelines로 전송
+                packets, self.queue = self.queue, []
+                self.writer.writelines(packets)
+                await self.writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self.closed = True
+
+    def close(self):
+        if self.closed and self.task.done(): return
+        self.closed = True
+        self.wakeup.set()
+        try: self.writer.close()
+        except: pass
 
 class GameServer:
     def __init__(self):
         self.host = "0.0.0.0"
         self.port = NETWORK_PORT
-        self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        
-        self.clients = {} # {socket: pid}
+        self.server = None
+
+        self.clients = {} # {pid: ClientConnection}
         self.players = {} # {pid: data}
         self.next_id = 0
         self.game_started = False
         self.running = True
-        
+
         # Time Management
         self.phases = ["DAWN", "MORNING", "NOON", "AFTERNOON", "EVENING", "NIGHT"]
         self.current_phase_idx = 0
@@ -24,46 +77,51 @@ class GameServer:
         self.state_timer = DEFAULT_PHASE_DURATIONS[self.phases[0]]
         self.last_tick = time.time()
 
+        # [최적화] 관심 영역(AOI): MOVE는 반경 안의 클라이언트에게만 즉시, 나머지는 주기적으로 최신 위치만 전송
+        self.interest = InterestGrid(AOI_RADIUS)
+        self.global_watchers = set() # 위치가 아직 없거나 관전자인 클라이언트 (모든 MOVE 수신)
+        self.far_pending = {} # {entity_id: (packet, exclude_pid, near_pids)}
+        self.bot_owners = {} # {bot_id: 봇의 MOVE를 보내는 클라이언트(호스트) pid} - 봇 주변 MOVE도 그 클라이언트에게 즉시 전송
+        self.last_far_flush = time.time()
+
     def start(self):
         try:
-            self.server_socket.bind((self.host, self.port))
-            self.server_socket.listen(10)
-            print(f"[SERVER] Running on {self.host}:{self.port}")
-
-            threading.Thread(target=self.game_loop, daemon=True).start()
-
-            while self.running:
-                client_sock, addr = self.server_socket.accept()
-                pid = self.next_id
-                self.next_id += 1
-                
-                self.clients[client_sock] = pid
-                self.players[pid] = {
-                    'id': pid, 'name': f"Player {pid+1}", 'role': 'CITIZEN',
-                    'group': 'PLAYER', 'type': 'PLAYER', 'x': -1000, 'y': -1000, 'alive': True
-                }
-
-                thread = threading.Thread(target=self.handle_client, args=(client_sock, pid))
-                thread.daemon = True
-                thread.start()
+            asyncio.run(self.serve())
+        except KeyboardInterrupt:
+            pass
         except Exception as e:
             print(f"[SERVER] Critical Error: {e}")
+
+    async def serve(self):
+        self.server = await asyncio.start_server(self.handle_client, self.host, self.port, reuse_address=True)
+        print(f"[SERVER] Running on {self.host}:{self.port}")
+        loop_task = asyncio.create_task(self.game_loop())
+        try:
+            async with self.server:
+                await self.server.serve_forever()
         finally:
-            self.server_socket.close()
+            loop_task.cancel()
+
+    def stop(self):
+        self.running = False
+        if self.server: self.server.close()
+        for conn in list(self.clients.values()): conn.close()
 
-    def game_loop(self):
+    async def game_loop(self):
         while self.running:
-            time.sleep(0.1)
+            await asyncio.sleep(0.1)
+            if time.time() - self.last_far_flush >= AOI_FAR_INTERVAL:
+                self.flush_far_moves()
             if not self.game_started: continue
-            
+
             now = time.time()
             dt = now - self.last_tick
             self.last_tick = now
-            
+
             self.state_timer -= dt
             if self.state_timer <= 0:
                 self._advance_phase()
-                
+
             if int(now) % 1 == 0:
                 self.broadcast({"type": "TIME_SYNC", "phase_idx": self.current_phase_idx, "timer": self.state_timer, "day": self.day_count})
 
@@ -74,20 +132,25 @@ class GameServer:
         self.state_timer = DEFAULT_PHASE_DURATIONS.get(new_phase, 30)
         self.broadcast({"type": "TIME_SYNC", "phase_idx": self.current_phase_idx, "timer": self.state_timer, "day": self.day_count})
 
-    def handle_client(self, sock, pid):
-        self.send_to(sock, {"type": "WELCOME", "my_id": pid})
+    async def handle_client(self, reader, writer):
+        pid = self.next_id
+        self.next_id += 1
+
+        conn = ClientConnection(pid, reader, writer)
+        self.clients[pid] = conn
+        self.players[pid] = {
+            'id': pid, 'name': f"Player {pid+1}", 'role': 'CITIZEN',
+            'group': 'PLAYER', 'type': 'PLAYER', 'x': -1000, 'y': -1000, 'alive': True
+        }
+        self._refresh_watcher(pid)
+
+        self.send_to(pid, {"type": "WELCOME", "my_id": pid})
         self.broadcast_player_list()
         try:
-            while self.running:
-                header = sock.recv(4)
-                if not header: break
+            while self.running and not conn.closed:
+                header = await reader.readexactly(4)
                 msg_len = int.from_bytes(header, byteorder='big')
-                data = b""
-                while len(data) < msg_len:
-                    packet = sock.recv(msg_len - len(data))
-                    if not packet: break
-                    data += packet
-                if not data: break
+                data = await reader.readexactly(msg_len)
                 try:
                     payload = json.loads(data.decode('utf-8'))
                     self.process_packet(pid, payload)
@@ -95,16 +158,20 @@ class GameServer:
                     print(f"[SERVER] JSON Error from {pid}: {e}")
                 except Exception as e:
                     print(f"[SERVER] Packet Error from {pid}: {e}")
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
         except Exception as e:
             print(f"[SERVER] Client Handler Error: {e}")
         finally:
-            self.remove_client(sock, pid)
+            self.remove_client(pid)
 
-    def remove_client(self, sock, pid):
-        if sock in self.clients: del self.clients[sock]
+    def remove_client(self, pid):
+        conn = self.clients.pop(pid, None)
+        if conn is None: return
+        conn.close()
         if pid in self.players: del self.players[pid]
-        try: sock.close()
-        except: pass
+        self._forget_entity(pid)
+        for bid in [bid for bid, owner in self.bot_owners.items() if owner == pid]: del self.bot_owners[bid]
         self.broadcast_player_list()
 
     def process_packet(self, pid, data):
@@ -116,7 +183,7 @@ class GameServer:
         elif ptype == 'CHANGE_GROUP':
             tid = data.get('target_id')
             if tid in self.players:
-                self.players[tid]['group'] = data.get('group'); self.broadcast_player_list()
+                self.players[tid]['group'] = data.get('group'); self._refresh_watcher(tid); self.broadcast_player_list()
         elif ptype == 'ADD_BOT':
             bid = self.next_id; self.next_id += 1
             self.players[bid] = {
@@ -128,45 +195,94 @@ class GameServer:
             target_id = data.get('target_id')
             if target_id in self.players and self.players[target_id].get('type') == 'BOT':
                 del self.players[target_id]
+                self._forget_entity(target_id)
                 self.broadcast_player_list()
         elif ptype == 'START_GAME':
             if pid == 0:
                 # [Game Start Logic] Assign Random Roles
                 import random
                 available_roles = ["FARMER", "MINER", "FISHER", "POLICE", "MAFIA", "DOCTOR"]
-                
+
                 for p in self.players.values():
                     if p['role'] == 'RANDOM':
                         p['role'] = random.choice(available_roles)
-                
+
                 self.game_started = True; self.last_tick = time.time()
                 self.broadcast({"type": "GAME_START", "players": self.players})
         elif ptype == 'MOVE':
             mid = data.get('id', pid) # Can be bot ID sent by host
             if mid in self.players:
+                if mid != pid: self.bot_owners[mid] = pid
                 self.players[mid].update({'x': data['x'], 'y': data['y'], 'facing': data.get('facing'), 'is_moving': data.get('is_moving')})
-                self.broadcast(data, exclude_pid=pid)
+                self.broadcast_move(mid, data, exclude_pid=pid)
 
     def broadcast_player_list(self):
         self.broadcast({"type": "PLAYER_LIST", "participants": list(self.players.values())})
 
-    def send_to(self, sock, data):
+    def _deliver(self, pid, packet, droppable=False):
+        conn = self.clients.get(pid)
+        if conn is None or conn.closed: return
+        if not conn.enqueue(packet, droppable):
+            # 송신 큐가 한계를 넘은 느린 클라이언트는 연결 종료 (다른 클라이언트를 막지 않도록)
+            print(f"[SERVER] Dropping slow client {pid}")
+            conn.close()
+
+    def send_to(self, pid, data):
         try:
-            serialized = json.dumps(data).encode('utf-8')
-            sock.sendall(len(serialized).to_bytes(4, 'big') + serialized)
+            self._deliver(pid, frame(data))
         except Exception as e:
             print(f"[SERVER] Send Error: {e}")
 
     def broadcast(self, data, exclude_pid=None):
         try:
-            serialized = json.dumps(data).encode('utf-8')
-            packet = len(serialized).to_bytes(4, 'big') + serialized
-            for sock, pid in self.clients.items():
+            packet = frame(data)
+            for pid in list(self.clients):
                 if pid != exclude_pid:
-                    try: sock.sendall(packet)
-                    except: pass
+                    self._deliver(pid, packet)
         except Exception as e:
             print(f"[SERVER] Broadcast Error: {e}")
 
+    def _refresh_watcher(self, pid):
+        p = self.players.get(pid)
+        if pid in self.clients and p and (p.get('group') == 'SPECTATOR' or self.interest.get_position(pid) is None):
+            self.global_watchers.add(pid)
+        else:
+            self.global_watchers.discard(pid)
+
+    def _forget_entity(self, eid):
+        self.interest.remove(eid)
+        self.far_pending.pop(eid, None)
+        self.global_watchers.discard(eid)
+        self.bot_owners.pop(eid, None)
+
+    def broadcast_move(self, eid, data, exclude_pid=None):
+        """반경 안의 클라이언트와 전체 수신 클라이언트에게만 즉시 전송 (나머지는 flush_far_moves에서)"""
+        try:
+            packet = frame(data)
+            self.interest.update(eid, data['x'], data['y'])
+            near = self.interest.query(data['x'], data['y'], AOI_RADIUS)
+            if self.bot_owners:
+                # [수정] 호스트는 자기 봇 주변의 움직임도 실시간으로 알아야 봇 AI(추적/반응)가 정상 동작
+                owners = self.bot_owners
+                near |= {owners[nid] for nid in near if nid in owners}
+            recipients = (near | self.global_watchers) if self.global_watchers else near
+            self.far_pending[eid] = (packet, exclude_pid, near)
+            if eid in self.global_watchers:
+                self._refresh_watcher(eid) # 첫 위치를 받으면 AOI 대상으로 전환
+            for pid in recipients:
+                if pid != exclude_pid:
+                    self._deliver(pid, packet, droppable=True)
+        except Exception as e:
+            print(f"[SERVER] Move Broadcast Error: {e}")
+
+    def flush_far_moves(self):
+        """관심 영역 밖 클라이언트에게 엔티티별 최신 MOVE를 저빈도로 전송"""
+        self.last_far_flush = time.time()
+        pending, self.far_pending = self.far_pending, {}
+        for packet, exclude_pid, near in pending.values():
+            for pid in list(self.clients):
+                if pid == exclude_pid or pid in near or pid in self.global_watchers: continue
+                self._deliver(pid, packet, droppable=True)
+
 if __name__ == "__main__":
-    GameServer().start()
\ No newline at end of file
+    GameServer().start()
@@ -12,6 +12,8 @@ SHARED_FONTS = {}
 # [Shadow Settings]
 SHADOW_MAX_OFFSET = 24  # Max pixels the shadow moves horizontally
 SHADOW_MAX_SCALE_X = 1.8 # Max horizontal stretch factor
+SHADOW_SHIFT_STEP = 0.05 # 그림자 방향(shift) 양자화 단위 - 같은 구간이면 캐시된 그림자 재사용
+SHADOW_ATLAS_MB = 32 # 기울인 그림자 캐시 메모리 한도
 
 MAX_PLAYERS = 15
 MAX_SPECTATORS = 5
@@ -195,4 +197,8 @@ except Exception as e:
 # [Network Settings]
 NETWORK_PORT = 5555
 SERVER_IP = "127.0.0.1" # Localhost default
-BUFFER_SIZE = 4096
\ No newline at end of file
+BUFFER_SIZE = 4096
+AOI_RADIUS = 16 * TILE_SIZE # 서버 관심 영역 반경 (px): 낮 시야 12칸 + 여유 4칸
+AOI_FAR_INTERVAL = 1.0 # 관심 영역 밖 엔티티 위치를 보내는 주기 (초)
+CLIENT_QUEUE_THROTTLE = 256 # 클라이언트 송신 큐가 이만큼 쌓이면 MOVE 패킷은 버림
+CLIENT_QUEUE_LIMIT = 1024 # 이 이상 쌓이면 느린 클라이언트로 보고 연결 종료
\ No newline at end of file
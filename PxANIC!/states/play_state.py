@@ -16,10 +16,12 @@ from managers.resource_manager import ResourceManager
 from ui import UI
 from entities.bullet import Bullet
 from systems.debug_console import DebugConsole
+from systems.frame_profiler import PROFILER
 from entities.npc import Dummy
 from ui.widgets.pause_menu import PauseMenu
 from ui.widgets.cctv_view import CCTVViewWidget
 from world.tiles import get_texture
+from core import clock
 
 class PlayState(BaseState):
     def __init__(self, game):
@@ -136,7 +138,7 @@ class PlayState(BaseState):
                     if not hasattr(n, 'last_sent_pos'): n.last_sent_pos = (0, 0)
                     if n_pos != n.last_sent_pos: self.game.network.send({"type": "MOVE", "id": n.uid, "x": n_pos[0], "y": n_pos[1], "is_moving": n.is_moving, "facing": n.facing_dir}); n.last_sent_pos = n_pos
         # Update Work Target Navigation
-        now = pygame.time.get_ticks()
+        now = clock.get_ticks()
         if now > self.work_check_timer:
             self.work_check_timer = now + 500 # Check every 0.5s
             self.work_target_tid = None
@@ -157,7 +159,8 @@ class PlayState(BaseState):
                     step = self.player.work_step % 3
                     self.work_target_tid = WORK_SEQ[job_key][step]
 
-        self.time_system.update(dt); self.world.update(dt, self.current_phase, self.weather, self.day_count); self.lighting.update(dt)
+        with PROFILER.scope("world"): self.time_system.update(dt); self.world.update(dt, self.current_phase, self.weather, self.day_count)
+        with PROFILER.scope("lighting"): self.lighting.update(dt)
         if self.camera: self.camera.resize(self.game.screen_width, self.game.screen_height)
         if not self.player.is_dead and not (self.ui.show_vending or self.ui.show_inventory or self.ui.show_voting or self.is_chatting):
             if not self.player.is_stunned():
@@ -171,8 +174,8 @@ class PlayState(BaseState):
             nearest = min([math.hypot(n.rect.centerx-self.player.rect.centerx, n.rect.centery-self.player.rect.centery) for n in self.npcs if n.role == "MAFIA" and n.alive] + [float('inf')])
             if nearest < 640:
                 self.player.emotions['ANXIETY'] = int((640 - nearest) / 60)
-                if pygame.time.get_ticks() - self.heartbeat_timer > max(300, int(nearest * 2)):
-                    self.heartbeat_timer = pygame.time.get_ticks(); self.world.effects.append(VisualSound(self.player.rect.centerx, self.player.rect.centery, "THUMP", (100, 0, 0), size_scale=0.5))
+                if clock.get_ticks() - self.heartbeat_timer > max(300, int(nearest * 2)):
+                    self.heartbeat_timer = clock.get_ticks(); self.world.effects.append(VisualSound(self.player.rect.centerx, self.player.rect.centery, "THUMP", (100, 0, 0), size_scale=0.5))
             else: self.player.emotions['ANXIETY'] = 0
         if self.current_phase == "NIGHT" and random.random() < 0.005:
             for n in self.npcs:
@@ -181,8 +184,9 @@ class PlayState(BaseState):
                     if 0 <= gy < self.world.map_manager.height and 0 <= gx < self.world.map_manager.width:
                         zid = self.world.map_manager.zone_map[gy][gx]
                         if zid in ZONES and zid != 1: self.time_system.mafia_last_seen_zone = ZONES[zid]['name']
-        for n in self.npcs:
-            if not n.is_stunned(): self._handle_npc_action(n.update(self.current_phase, self.player, self.npcs, self.world.is_mafia_frozen, self.world.noise_list, self.day_count, self.world.bloody_footsteps), n, 0)
+        with PROFILER.scope("npcs"):
+            for n in self.npcs:
+                if not n.is_stunned(): self._handle_npc_action(n.update(self.current_phase, self.player, self.npcs, self.world.is_mafia_frozen, self.world.noise_list, self.day_count, self.world.bloody_footsteps), n, 0)
         if self.player.role == "SPECTATOR": self._update_spectator_camera()
         else: self.camera.smooth_update(self.player.rect.centerx, self.player.rect.centery, dt)
 
@@ -196,12 +200,13 @@ class PlayState(BaseState):
             if self.player.role == "POLICE" and self.player.flashlight_on and self.current_phase in ['EVENING', 'NIGHT', 'DAWN']:
                 direction = self.player.facing_dir
         
-        self.visible_tiles = self.fov.cast_rays(self.player.rect.centerx, self.player.rect.centery, rad, direction, 60)
-        for tile in self.visible_tiles: self.tile_alphas[tile] = min(255, self.tile_alphas.get(tile, 0) + 15)
-        for tile in list(self.tile_alphas.keys()):
-            if tile not in self.visible_tiles:
-                self.tile_alphas[tile] -= 15
-                if self.tile_alphas[tile] <= 0: del self.tile_alphas[tile]
+        with PROFILER.scope("fov"):
+            self.visible_tiles = self.fov.cast_rays(self.player.rect.centerx, self.player.rect.centery, rad, direction, 60)
+            for tile in self.visible_tiles: self.tile_alphas[tile] = min(255, self.tile_alphas.get(tile, 0) + 15)
+            for tile in list(self.tile_alphas.keys()):
+                if tile not in self.visible_tiles:
+                    self.tile_alphas[tile] -= 15
+                    if self.tile_alphas[tile] <= 0: del self.tile_alphas[tile]
 
     def _update_spectator_camera(self):
         keys = pygame.key.get_pressed()
@@ -225,12 +230,12 @@ class PlayState(BaseState):
 
     def execute_siren(self):
         for n in [x for x in self.npcs if x.role == "MAFIA" and x.alive]:
-            n.is_frozen = True; n.frozen_timer = pygame.time.get_ticks() + 5000; self.world.effects.append(VisualSound(n.rect.centerx, n.rect.centery, "SIREN", (0, 0, 255), 2.0))
-        self.world.is_mafia_frozen = True; self.world.frozen_timer = pygame.time.get_ticks() + 5000
+            n.is_frozen = True; n.frozen_timer = clock.get_ticks() + 5000; self.world.effects.append(VisualSound(n.rect.centerx, n.rect.centery, "SIREN", (0, 0, 255), 2.0))
+        self.world.is_mafia_frozen = True; self.world.frozen_timer = clock.get_ticks() + 5000
         self.ui.show_alert("!!! SIREN !!!", (100, 100, 255)); self.sound_system.sound_manager.play_sfx("SIREN")
 
     def execute_sabotage(self):
-        self.world.is_blackout = True; self.world.blackout_timer = pygame.time.get_ticks() + 10000
+        self.world.is_blackout = True; self.world.blackout_timer = clock.get_ticks() + 10000
         self.world.effects.append(VisualSound(self.player.rect.centerx, self.player.rect.centery, "BOOM", (50, 50, 50), 3.0))
         self.ui.show_alert("!!! SABOTAGE !!!", (255, 0, 0)); self.sound_system.sound_manager.play_sfx("EXPLOSION")
         for t in [x for x in self.npcs + [self.player] if x.role in ["CITIZEN", "DOCTOR"] and x.alive]: t.emotions['FEAR'] = 1
@@ -285,13 +290,13 @@ class PlayState(BaseState):
     def draw(self, screen):
         screen.fill(COLORS['BG'])
         if not self.camera: return
-        canvas = self.lighting.draw(screen, self.camera)
+        with PROFILER.scope("lighting"): canvas = self.lighting.draw(screen, self.camera)
         canvas.fill(COLORS['BG'])
         
         # 1. Draw Map Ground (Floor, Objects, Mask)
         if self.map_renderer:
             vis = self.visible_tiles if self.player.role != "SPECTATOR" else None
-            self.map_renderer.draw_ground(canvas, self.camera, visible_tiles=vis, tile_alphas=self.tile_alphas)
+            with PROFILER.scope("floor"): self.map_renderer.draw_ground(canvas, self.camera, visible_tiles=vis, tile_alphas=self.tile_alphas)
         
         # 2. Collect All Renderables (Entities + Walls + Doors)
         render_list = []
@@ -319,42 +324,45 @@ class PlayState(BaseState):
 
         # [Draw All Shadows] - Walls, Objects, Trees (Sprite-based)
         if self.map_renderer:
-            self.map_renderer.draw_all_shadows(canvas, self.camera, shift_x, shift_y)
+            with PROFILER.scope("shadows"): self.map_renderer.draw_all_shadows(canvas, self.camera, shift_x, shift_y)
 
         # 4. Draw Sorted
-        for obj in render_list:
-            if isinstance(obj, dict): # Map Object
-                ox = obj['rect'].x - self.camera.x
-                oy = obj['rect'].y - self.camera.y
-                tid = obj['tid']
-                rot = obj['rot']
-                img = get_texture(tid, rot)
+        with PROFILER.scope("objects"):
+            for obj in render_list:
+                if isinstance(obj, dict): # Map Object
+                    ox = obj['rect'].x - self.camera.x
+                    oy = obj['rect'].y - self.camera.y
+                    tid = obj['tid']
+                    rot = obj['rot']
+                    img = get_texture(tid, rot)
                 
-                if obj['type'] == 'WALL':
-                    # Draw Face (Darker?)
-                    # For now just draw standard
-                    canvas.blit(img, (ox, oy))
+                    if obj['type'] == 'WALL':
+                        # Draw Face (Darker?)
+                        # For now just draw standard
+                        canvas.blit(img, (ox, oy))
                     
-                    # Draw Top (Shifted Up)
-                    top_y = oy - WALL_HEIGHT
-                    canvas.blit(img, (ox, top_y))
+                        # Draw Top (Shifted Up)
+                        top_y = oy - WALL_HEIGHT
+                        canvas.blit(img, (ox, top_y))
                     
-                    # Add highlight to top to differentiate
-                    # Simple way: Add white overlay with ADD blend
-                    highlight = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
-                    highlight.fill((30, 30, 30, 0)) # Slight brighten
-                    canvas.blit(highlight, (ox, top_y), special_flags=pygame.BLEND_RGBA_ADD)
+                        # Add highlight to top to differentiate
+                        # Simple way: Add white overlay with ADD blend
+                        highlight = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
+                        highlight.fill((30, 30, 30, 0)) # Slight brighten
+                        canvas.blit(highlight, (ox, top_y), special_flags=pygame.BLEND_RGBA_ADD)
                     
-                else: # DOOR
-                    canvas.blit(img, (ox, oy))
+                    else: # DOOR
+                        canvas.blit(img, (ox, oy))
                     
-            else: # Entity
-                CharacterRenderer.draw_shadow(canvas, obj, self.camera.x, self.camera.y, shift_x, shift_y)
-                CharacterRenderer.draw_entity(canvas, obj, self.camera.x, self.camera.y, self.player.role, self.current_phase, self.player.device_on)
+                else: # Entity
+                    CharacterRenderer.draw_shadow(canvas, obj, self.camera.x, self.camera.y, shift_x, shift_y)
+                    CharacterRenderer.draw_entity(canvas, obj, self.camera.x, self.camera.y, self.player.role, self.current_phase, self.player.device_on)
 
-        for fx in self.world.effects: fx.draw(canvas, self.camera.x, self.camera.y)
-        for i in self.world.indicators: i.draw(canvas, self.player.rect, self.camera.x, self.camera.y)
-        if self.player.role != "SPECTATOR": self.lighting.apply_lighting(self.camera)
+        with PROFILER.scope("effects"):
+            for fx in self.world.effects: fx.draw(canvas, self.camera.x, self.camera.y)
+            for i in self.world.indicators: i.draw(canvas, self.player.rect, self.camera.x, self.camera.y)
+        if self.player.role != "SPECTATOR":
+            with PROFILER.scope("lighting"): self.lighting.apply_lighting(self.camera)
 
         # [Work Target Indicator - Highlight] - DRAWN ON CANVAS
         self.found_visible_work_target = False
@@ -377,7 +385,7 @@ class PlayState(BaseState):
                         pygame.draw.rect(canvas, (glow_val, glow_val, 0), (stx, sty, TILE_SIZE, TILE_SIZE), 2)
 
         # --- FINAL SCALING: CANVAS -> SCREEN ---
-        screen.blit(pygame.transform.scale(canvas, (self.game.screen_width, self.game.screen_height)), (0, 0))
+        with PROFILER.scope("scale"): screen.blit(pygame.transform.scale(canvas, (self.game.screen_width, self.game.screen_height)), (0, 0))
         
         # [Minigame] Draw on SCREEN space to be always in the center
         if self.player.minigame.active:
@@ -465,8 +473,9 @@ class PlayState(BaseState):
                         end_y = arrow_py + math.sin(angle) * 15
                         pygame.draw.line(screen, (255, 255, 0), (arrow_px, arrow_py), (end_x, end_y), 3)
 
-        if self.ui: self.ui.draw(screen)
-        self.console.draw(screen)
+        with PROFILER.scope("ui"):
+            if self.ui: self.ui.draw(screen)
+            self.console.draw(screen)
         
         if self.cctv_widget.active:
             self.cctv_widget.draw(screen)
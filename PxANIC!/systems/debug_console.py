@@ -2,6 +2,7 @@ import pygame
 from settings import SCREEN_WIDTH, SCREEN_HEIGHT, ITEMS
 from entities.npc import Dummy
 from core.world import TILE_SIZE
+from systems.frame_profiler import PROFILER
 
 class DebugConsole:
     def __init__(self, game, play_state):
@@ -25,7 +26,8 @@ class DebugConsole:
             'time': self.cmd_time,
             'god': self.cmd_god,
             'kill': self.cmd_kill,
-            'money': self.cmd_money
+            'money': self.cmd_money,
+            'prof': self.cmd_prof
         }
 
     def toggle(self):
@@ -101,7 +103,7 @@ class DebugConsole:
     # --- Commands ---
 
     def cmd_help(self, args):
-        return "Commands: spawn, give, tp, time, god, kill, money"
+        return "Commands: spawn, give, tp, time, god, kill, money, prof"
 
     def cmd_spawn(self, args):
         if not args: return "Usage: /spawn [role]"
@@ -166,3 +168,20 @@ class DebugConsole:
         amount = int(args[0]) if args else 100
         self.play_state.player.coins += amount
         return f"Added {amount} coins"
+
+    def cmd_prof(self, args):
+        # 프레임 프로파일러: prof (오버레이) / prof on|off (기록만) / prof export [파일] / prof clear
+        sub = args[0].lower() if args else ""
+        if not sub:
+            return f"Profiler overlay {'ON' if PROFILER.toggle_overlay() else 'OFF'}"
+        if sub in ("on", "off"):
+            PROFILER.set_enabled(sub == "on")
+            return f"Profiler recording {sub.upper()}"
+        if sub == "export":
+            if not PROFILER.frames: return "No frames recorded. Use /prof or /prof on first."
+            path = PROFILER.export_chrome_trace(args[1] if len(args) > 1 else None)
+            return f"Trace of {len(PROFILER.frames)} frames saved: {path}"
+        if sub == "clear":
+            PROFILER.clear()
+            return "Profiler history cleared"
+        return "Usage: /prof [on|off|export [file]|clear]"
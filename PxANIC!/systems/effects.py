@@ -2,6 +2,7 @@ import pygame
 import math
 import random
 from settings import SCREEN_WIDTH, SCREEN_HEIGHT, SHARED_FONTS
+from core import clock
 
 class VisualSound:
     def __init__(self, x, y, text, color, size_scale=1.0, duration=1500, shake=False, blink=False):
@@ -11,7 +12,7 @@ class VisualSound:
         self.base_color = color
         self.color = color
         self.duration = duration
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = clock.get_ticks()
         self.alive = True
         
         self.shake = shake
@@ -57,7 +58,7 @@ class VisualSound:
         return final_surf
 
     def update(self):
-        now = pygame.time.get_ticks()
+        now = clock.get_ticks()
         elapsed = now - self.start_time
         if elapsed > self.duration:
             self.alive = False
@@ -101,7 +102,7 @@ class SoundDirectionIndicator:
         self.source_x = source_x
         self.source_y = source_y
         self.duration = duration
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = clock.get_ticks()
         self.alive = True
         
         if SoundDirectionIndicator._SHARED_GLOW_SURF is None:
@@ -117,7 +118,7 @@ class SoundDirectionIndicator:
         return surf
 
     def update(self):
-        if pygame.time.get_ticks() - self.start_time > self.duration:
+        if clock.get_ticks() - self.start_time > self.duration:
             self.alive = False
 
     def draw(self, screen, player_rect, camera_x, camera_y):
@@ -136,7 +137,7 @@ class SoundDirectionIndicator:
         edge_x = cx + math.cos(angle) * radius_x
         edge_y = cy + math.sin(angle) * radius_y
         
-        elapsed = pygame.time.get_ticks() - self.start_time
+        elapsed = clock.get_ticks() - self.start_time
         alpha = 255 - int(255 * (elapsed / self.duration))
         
         final_surf = self.glow_img.copy()
@@ -1,142 +1,231 @@
 import math
-import pygame
+from collections import OrderedDict
 from settings import TILE_SIZE, SCREEN_WIDTH, SCREEN_HEIGHT, INDOOR_ZONES
 from world.tiles import check_collision, TRANSPARENT_TILES
 
+# 8개 옥탄트 변환 계수 (xx, xy, yx, yy)
+OCTANTS = [
+    (1, 0, 0, 1), (0, 1, 1, 0), (0, -1, 1, 0), (-1, 0, 0, 1),
+    (-1, 0, 0, -1), (0, -1, -1, 0), (0, 1, -1, 0), (1, 0, 0, -1)
+]
+
+class TileBitset:
+    """
+    보이는 타일 집합을 맵 크기의 비트셋으로 표현합니다.
+    (x, y) in / 순회 / len 을 지원하므로 기존 set 사용처를 그대로 대체할 수 있습니다.
+    """
+    __slots__ = ('width', 'height', 'bits', 'indices')
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.bits = bytearray((width * height + 7) >> 3)
+        self.indices = [] # 순회용 (삽입 순서)
+
+    def add_index(self, idx):
+        byte, mask = idx >> 3, 1 << (idx & 7)
+        if not self.bits[byte] & mask:
+            self.bits[byte] |= mask
+            self.indices.append(idx)
+
+    def add(self, tile):
+        x, y = tile
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.add_index(y * self.width + x)
+
+    def __contains__(self, tile):
+        x, y = tile
+        if not (0 <= x < self.width and 0 <= y < self.height): return False
+        idx = y * self.width + x
+        return bool(self.bits[idx >> 3] & (1 << (idx & 7)))
+
+    def __iter__(self):
+        w = self.width
+        for idx in self.indices:
+            yield (idx % w, idx // w)
+
+    def __len__(self):
+        return len(self.indices)
+
 class FOV:
+    """
+    불투명도 그리드 위에서 재귀 섀도캐스팅으로 시야를 계산합니다.
+    - 그리드는 실내/실외 시점별로 두 벌 (실외에서는 유리가 아닌 실내 타일이 시야를 막음)
+    - MapManager.set_tile 리스너로 해당 칸만 갱신하고 결과 캐시를 무효화
+    - 결과는 (타일, 반경, 방향)별로 캐시되어, 제자리에 있으면 재계산하지 않음
+    """
+    CACHE_SIZE = 32
+    RADIUS_STEP = 0.25 # 반경 양자화 단위 (타일)
+
     def __init__(self, map_width, map_height, map_manager):
         self.map_width = map_width
         self.map_height = map_height
         self.map_manager = map_manager
-        
+
         self.sin_table = {}
         self.cos_table = {}
         for deg in range(361):
             rad = math.radians(deg)
             self.sin_table[deg] = math.sin(rad)
             self.cos_table[deg] = math.cos(rad)
-        
+
+        self.opaque_indoor = None # 실내 시점: 막힘 && !투명
+        self.opaque_outdoor = None # 실외 시점: 위 + (실내 && !투명)
+        self.indoor = None
+        self._grid_key = None
+        self._cache = OrderedDict()
+        map_manager.tile_listeners.append(self._on_tile_changed)
+
+    def _ensure_grid(self):
+        mm = self.map_manager
+        # load_map은 레이어(TileLayer)를 새로 만들므로 id로 맵 교체를 감지
+        key = (mm.width, mm.height, id(mm.map_data['wall']), id(mm.zone_map))
+        if key == self._grid_key: return
+
+        self.map_width, self.map_height = mm.width, mm.height
+        size = mm.width * mm.height
+        self.opaque_indoor = bytearray(size)
+        self.opaque_outdoor = bytearray(size)
+        self.indoor = bytearray(size)
+        for y in range(mm.height):
+            for x in range(mm.width):
+                self._update_cell(x, y)
+        self._grid_key = key
+        self._cache.clear()
+
+    def _update_cell(self, x, y):
+        mm = self.map_manager
+        idx = y * self.map_width + x
+        tid_wall = mm.map_data['wall'].tids[idx]
+        is_blocking = False
+        is_transparent = False
+        if tid_wall != 0:
+            if check_collision(tid_wall): is_blocking = True
+            if tid_wall in TRANSPARENT_TILES: is_transparent = True
+        if not is_blocking:
+            tid_obj = mm.map_data['object'].tids[idx]
+            if tid_obj != 0:
+                if check_collision(tid_obj): is_blocking = True
+                if tid_obj in TRANSPARENT_TILES: is_transparent = True
+
+        is_indoor = mm.zone_map[y][x] in INDOOR_ZONES
+        self.indoor[idx] = is_indoor
+        self.opaque_indoor[idx] = is_blocking and not is_transparent
+        # 실외에서 실내를 볼 때: 유리가 아니면 벽이든 바닥이든 시야 차단
+        self.opaque_outdoor[idx] = (is_blocking or is_indoor) and not is_transparent
+
+    def _on_tile_changed(self, gx, gy, layer):
+        if self._grid_key is None or layer == 'floor': return # 바닥은 시야에 영향 없음
+        if not (0 <= gx < self.map_width and 0 <= gy < self.map_height): return
+        self._update_cell(gx, gy)
+        self._cache.clear()
+
     def cast_rays(self, px, py, radius, direction=None, angle_width=60):
-        visible_tiles = set()
-        
+        """보이는 타일을 TileBitset으로 반환합니다. 반환값은 캐시와 공유되므로 수정하지 마세요."""
+        self._ensure_grid()
+        width, height = self.map_width, self.map_height
         cx, cy = int(px // TILE_SIZE), int(py // TILE_SIZE)
-        visible_tiles.add((cx, cy)) 
-        
-        if radius <= 0: return visible_tiles
-
-        player_zone = 0
-        if 0 <= cx < self.map_width and 0 <= cy < self.map_height:
-            player_zone = self.map_manager.zone_map[cy][cx]
-        is_player_indoors = (player_zone in INDOOR_ZONES)
 
-        max_dist_px = radius * TILE_SIZE
-        step_size = TILE_SIZE / 2.0  
-        
+        radius = max(0, round(radius / self.RADIUS_STEP) * self.RADIUS_STEP)
         if direction and (direction[0] != 0 or direction[1] != 0):
-            center_angle = math.degrees(math.atan2(direction[1], direction[0]))
-            if center_angle < 0: center_angle += 360
-            
-            start_angle = int(center_angle - angle_width / 2)
-            end_angle = int(center_angle + angle_width / 2)
-            angle_step = 2
+            direction = (direction[0], direction[1])
+        else:
+            direction = None
+
+        key = (cx, cy, radius, direction, angle_width)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        visible = TileBitset(width, height)
+        if 0 <= cx < width and 0 <= cy < height:
+            visible.add_index(cy * width + cx)
+            if radius > 0:
+                opaque = self.opaque_indoor if self.indoor[cy * width + cx] else self.opaque_outdoor
+                cone = None
+                if direction:
+                    center = math.atan2(direction[1], direction[0])
+                    cone = (center, math.radians(angle_width) / 2)
+                r_int = int(math.ceil(radius))
+                radius_sq = (radius + 0.5) ** 2 # 기존 광선 방식처럼 반경에 걸친 칸까지 포함
+                for xx, xy, yx, yy in OCTANTS:
+                    self._cast_light(visible, opaque, cx, cy, 1, 1.0, 0.0, r_int, radius_sq, xx, xy, yx, yy, cone)
         else:
-            start_angle = 0
-            end_angle = 360
-            angle_step = 3 
+            visible.add((cx, cy))
+
+        self._cache[key] = visible
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return visible
 
-        wall_data = self.map_manager.map_data['wall']
-        obj_data = self.map_manager.map_data['object']
-        zone_data = self.map_manager.zone_map
+    def _cast_light(self, visible, opaque, cx, cy, row, start, end, r_int, radius_sq, xx, xy, yx, yy, cone):
+        if start < end: return
         width, height = self.map_width, self.map_height
-        
-        sin_tbl = self.sin_table
-        cos_tbl = self.cos_table
+        new_start = 0.0
+        for j in range(row, r_int + 1):
+            dx, dy = -j - 1, -j
+            blocked = False
+            while dx <= 0:
+                dx += 1
+                l_slope = (dx - 0.5) / (dy + 0.5)
+                r_slope = (dx + 0.5) / (dy - 0.5)
+                if start < r_slope: continue
+                if end > l_slope: break
 
-        for angle_deg in range(start_angle, end_angle, angle_step):
-            norm_deg = angle_deg % 360
-            sin_a = sin_tbl[norm_deg]
-            cos_a = cos_tbl[norm_deg]
-            
-            current_dist = 0
-            while current_dist < max_dist_px:
-                current_dist += step_size
-                
-                nx = px + cos_a * current_dist
-                ny = py + sin_a * current_dist
-                
-                gx, gy = int(nx // TILE_SIZE), int(ny // TILE_SIZE)
-                
-                if not (0 <= gx < width and 0 <= gy < height):
-                    break
-                
-                visible_tiles.add((gx, gy))
-
-                # Collision & Visibility Check
-                w_val = wall_data[gy][gx]
-                tid_wall = w_val[0] if isinstance(w_val, (tuple, list)) else w_val
-                
-                is_blocking = False
-                is_transparent = False
-
-                # Wall Check
-                if tid_wall != 0:
-                    if check_collision(tid_wall): is_blocking = True
-                    if tid_wall in TRANSPARENT_TILES: is_transparent = True
-                
-                # Object Check
-                if not is_blocking:
-                    o_val = obj_data[gy][gx]
-                    tid_obj = o_val[0] if isinstance(o_val, (tuple, list)) else o_val
-                    if tid_obj != 0:
-                        if check_collision(tid_obj): is_blocking = True
-                        if tid_obj in TRANSPARENT_TILES: is_transparent = True
-
-                # Zone Logic (Indoor/Outdoor)
-                target_zone = zone_data[gy][gx]
-                is_target_indoors = (target_zone in INDOOR_ZONES)
-                
-                if not is_player_indoors and is_target_indoors:
-                    # Outside looking In
-                    if is_transparent:
-                        pass # Can see through glass
-                    elif is_blocking:
-                        break # Wall blocks view
-                    else:
-                        break # Floor inside is not visible unless through glass
-                
-                if is_blocking and not is_transparent:
-                    break
-        return visible_tiles
+                x, y = cx + dx * xx + dy * xy, cy + dx * yx + dy * yy
+                if 0 <= x < width and 0 <= y < height:
+                    idx = y * width + x
+                    is_opaque = opaque[idx]
+                    if dx * dx + dy * dy <= radius_sq:
+                        if cone is None or self._in_cone(x - cx, y - cy, cone):
+                            visible.add_index(idx)
+                else:
+                    is_opaque = 1 # 맵 밖은 시야 차단
+
+                if blocked:
+                    if is_opaque:
+                        new_start = r_slope
+                        continue
+                    blocked = False
+                    start = new_start
+                elif is_opaque and j < r_int:
+                    blocked = True
+                    self._cast_light(visible, opaque, cx, cy, j + 1, start, l_slope, r_int, radius_sq, xx, xy, yx, yy, cone)
+                    new_start = r_slope
+            if blocked: break
+
+    @staticmethod
+    def _in_cone(dx, dy, cone):
+        center, half = cone
+        diff = (math.atan2(dy, dx) - center + math.pi) % (2 * math.pi) - math.pi
+        return abs(diff) <= half
 
     def get_poly_points(self, px, py, radius, direction=None, angle_width=60):
+        self._ensure_grid()
         points = []
-        points.append((px, py)) 
+        points.append((px, py))
 
         if radius <= 0: return points
 
         cx, cy = int(px // TILE_SIZE), int(py // TILE_SIZE)
-        player_zone = 0
-        if 0 <= cx < self.map_width and 0 <= cy < self.map_height:
-             player_zone = self.map_manager.zone_map[cy][cx]
-        is_player_indoors = (player_zone in INDOOR_ZONES)
+        width, height = self.map_width, self.map_height
+        # [최적화] 타일 튜플/충돌 판정 대신 미리 계산된 불투명도 그리드 조회
+        is_player_indoors = (0 <= cx < width and 0 <= cy < height) and self.indoor[cy * width + cx]
+        opaque = self.opaque_indoor if is_player_indoors else self.opaque_outdoor
 
         max_dist_px = radius * TILE_SIZE
-        step_size = 16.0 
-        
+        step_size = 16.0
+
         start_angle, end_angle, angle_step = 0, 360, 2
         if direction and (direction[0] != 0 or direction[1] != 0):
             center_angle = math.degrees(math.atan2(direction[1], direction[0]))
             if center_angle < 0: center_angle += 360
-            
+
             start_angle = int(center_angle - angle_width / 2)
             end_angle = int(center_angle + angle_width / 2)
             angle_step = 1
 
-        width, height = self.map_width, self.map_height
-        wall_data = self.map_manager.map_data['wall']
-        obj_data = self.map_manager.map_data['object']
-        zone_data = self.map_manager.zone_map
-        
         sin_tbl = self.sin_table
         cos_tbl = self.cos_table
 
@@ -144,57 +233,20 @@ class FOV:
             norm_deg = angle_deg % 360
             sin_a = sin_tbl[norm_deg]
             cos_a = cos_tbl[norm_deg]
-            
+
             current_dist = 0
             hit_x, hit_y = px, py
-            
+
             while current_dist < max_dist_px:
                 current_dist += step_size
                 nx = px + cos_a * current_dist
                 ny = py + sin_a * current_dist
-                
-                gx, gy = int(nx // TILE_SIZE), int(ny // TILE_SIZE)
-                
-                if not (0 <= gx < width and 0 <= gy < height):
-                    hit_x, hit_y = nx, ny
-                    break
-                
-                is_blocking = False
-                is_transparent = False
-                
-                # Wall
-                w_val = wall_data[gy][gx]
-                tid_wall = w_val[0] if isinstance(w_val, (tuple, list)) else w_val
-                if tid_wall != 0:
-                    if check_collision(tid_wall): is_blocking = True
-                    if tid_wall in TRANSPARENT_TILES: is_transparent = True
-                
-                # Object
-                if not is_blocking:
-                    o_val = obj_data[gy][gx]
-                    tid_obj = o_val[0] if isinstance(o_val, (tuple, list)) else o_val
-                    if tid_obj != 0:
-                        if check_collision(tid_obj): is_blocking = True
-                        if tid_obj in TRANSPARENT_TILES: is_transparent = True
-
-                # Zone Logic
-                target_zone = zone_data[gy][gx]
-                is_target_indoors = (target_zone in INDOOR_ZONES)
-                
-                if not is_player_indoors and is_target_indoors:
-                    if is_transparent:
-                        pass # Glass -> Continue ray
-                    elif is_blocking:
-                        is_blocking = True # Wall -> Block
-                    else:
-                        is_blocking = True # Floor inside -> Block visibility from outside
-                
-                if is_blocking and not is_transparent:
-                    hit_x, hit_y = nx, ny
-                    break
-                
                 hit_x, hit_y = nx, ny
-            
+
+                gx, gy = int(nx // TILE_SIZE), int(ny // TILE_SIZE)
+                if not (0 <= gx < width and 0 <= gy < height): break
+                if opaque[gy * width + gx]: break
+
             points.append((hit_x, hit_y))
-            
-        return points
\ No newline at end of file
+
+        return points
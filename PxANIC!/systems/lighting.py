@@ -2,6 +2,9 @@ import pygame
 import math
 from settings import PHASE_SETTINGS, DEFAULT_PHASE_DURATIONS, TILE_SIZE, VISION_RADIUS
 
+LAMP_TIDS = (7310010, 8310016)
+LAMP_CHUNK = 8 * TILE_SIZE # 가로등 격자 한 칸의 크기 (px)
+
 class LightingManager:
     def __init__(self, game):
         self.game = game
@@ -17,8 +20,12 @@ class LightingManager:
         self.current_clarity = 255
         self.gradient_halo = self._create_smooth_gradient(500)
         self.lamp_halo = self._create_smooth_gradient(64, alpha_start=180) 
-        self.light_sources = []
+        # [최적화] 가로등 중심 좌표를 청크 격자에 보관 -> 화면과 겹치는 칸만 순회
+        self.lamp_grid = {} # {(chunk_x, chunk_y): [(px, py), ...]}
         self.sources_loaded = False
+        self._lamp_map_key = None
+        self._listening_map = None
+        self._scaled_lamp = None
 
     def _create_smooth_gradient(self, radius, alpha_start=255):
         surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
@@ -28,19 +35,53 @@ class LightingManager:
             pygame.draw.circle(surf, (255, 255, 255, alpha), (radius, radius), r)
         return surf
 
+    def _map_key(self):
+        mm = self.game.world.map_manager if self.game.world else None
+        # load_map은 tile_cache를 새로 만들므로 id로 맵 교체를 감지
+        return (id(mm), id(mm.tile_cache)) if mm else None
+
     def init_light_sources(self):
-        target_ids = [7310010, 8310016]
-        self.light_sources = []
+        """가로등 위치로 격자를 만들고, 이후 set_tile로 생기거나 부서지는 가로등은 타일 리스너로 반영"""
+        self.lamp_grid = {}
         if self.game.world and self.game.world.map_manager:
-            tile_cache = self.game.world.map_manager.tile_cache
-            for tid in target_ids:
-                if tid in tile_cache:
-                    for px, py in tile_cache[tid]:
-                        self.light_sources.append((px + TILE_SIZE//2, py + TILE_SIZE//2))
+            mm = self.game.world.map_manager
+            if self._listening_map is not mm:
+                mm.tile_listeners.append(self._on_tile_changed)
+                self._listening_map = mm
+            for tid in LAMP_TIDS:
+                for px, py in mm.tile_cache.get(tid, ()):
+                    self._add_lamp(px + TILE_SIZE//2, py + TILE_SIZE//2)
+        self._lamp_map_key = self._map_key()
         self.sources_loaded = True
 
+    def _add_lamp(self, lx, ly):
+        self.lamp_grid.setdefault((lx // LAMP_CHUNK, ly // LAMP_CHUNK), []).append((lx, ly))
+
+    def _on_tile_changed(self, gx, gy, layer):
+        if not self.sources_loaded or layer == 'floor': return # 가로등은 바닥 레이어에 없음
+        mm = self._listening_map
+        lx, ly = gx * TILE_SIZE + TILE_SIZE//2, gy * TILE_SIZE + TILE_SIZE//2
+        key = (lx // LAMP_CHUNK, ly // LAMP_CHUNK)
+        lamps = self.lamp_grid.get(key)
+        if lamps:
+            lamps[:] = [pos for pos in lamps if pos != (lx, ly)]
+            if not lamps: del self.lamp_grid[key]
+        idx = gy * mm.width + gx
+        for name in ('wall', 'object'):
+            if mm.map_data[name].tids[idx] in LAMP_TIDS: self._add_lamp(lx, ly)
+
+    def visible_lamps(self, left, top, right, bottom):
+        """(left, top)-(right, bottom) 안에 중심이 있는 가로등 (겹치는 격자 칸만 검사)"""
+        grid = self.lamp_grid
+        for cy in range(int(top // LAMP_CHUNK), int(bottom // LAMP_CHUNK) + 1):
+            for cx in range(int(left // LAMP_CHUNK), int(right // LAMP_CHUNK) + 1):
+                lamps = grid.get((cx, cy))
+                if not lamps: continue
+                for lx, ly in lamps:
+                    if left <= lx <= right and top <= ly <= bottom: yield lx, ly
+
     def update(self, dt):
-        if not self.sources_loaded: self.init_light_sources()
+        if not self.sources_loaded or self._lamp_map_key != self._map_key(): self.init_light_sources()
         current_phase_key = self.game.current_phase
         phases = self.game.phases
         current_idx = self.game.current_phase_idx
@@ -139,11 +180,12 @@ class LightingManager:
             sf = self.scale_factor; cam_x, cam_y = camera.x, camera.y
             vw, vh = self.canvas.get_size()
             lamp_r = 64; lamp_r_scaled = int(lamp_r * sf)
-            scaled_lamp = pygame.transform.smoothscale(self.lamp_halo, (lamp_r_scaled * 2, lamp_r_scaled * 2))
-            for lx, ly in self.light_sources:
-                if cam_x - lamp_r <= lx <= cam_x + vw + lamp_r and cam_y - lamp_r <= ly <= cam_y + vh + lamp_r:
-                    draw_x = (lx - cam_x) * sf - lamp_r_scaled; draw_y = (ly - cam_y) * sf - lamp_r_scaled
-                    self.light_mask.blit(scaled_lamp, (draw_x, draw_y), special_flags=pygame.BLEND_RGBA_ADD)
+            scaled_lamp = self._scaled_lamp
+            if scaled_lamp is None or scaled_lamp.get_width() != lamp_r_scaled * 2:
+                scaled_lamp = self._scaled_lamp = pygame.transform.smoothscale(self.lamp_halo, (lamp_r_scaled * 2, lamp_r_scaled * 2))
+            for lx, ly in self.visible_lamps(cam_x - lamp_r, cam_y - lamp_r, cam_x + vw + lamp_r, cam_y + vh + lamp_r):
+                draw_x = (lx - cam_x) * sf - lamp_r_scaled; draw_y = (ly - cam_y) * sf - lamp_r_scaled
+                self.light_mask.blit(scaled_lamp, (draw_x, draw_y), special_flags=pygame.BLEND_RGBA_ADD)
             player = self.game.player
             if not (self.game.current_phase == 'DAWN' and player.role != "MAFIA"):
                 radius_tiles = player.get_vision_radius(self.current_vision_factor, getattr(self.game, 'is_blackout', False), getattr(self.game, 'weather', 'CLEAR'))
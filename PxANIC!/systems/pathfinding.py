@@ -0,0 +1,171 @@
+import heapq
+import queue
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from settings import TILE_SIZE
+from world.tiles import get_tile_category
+
+WALKABLE = bytes([1, 0]) + bytes(254) # 충돌 맵(1=막힘) -> 보행 배열(1=보행 가능) 변환표
+
+class PathfindingService:
+    """
+    NPC 공용 길찾기 서비스.
+    - 요청마다 스레드를 만드는 대신 고정된 워커 스레드가 요청 큐를 처리
+    - MapManager.collision_map을 테두리 1칸을 덧댄 1차원 보행 배열로 복사하여 탐색 (get_tile 호출 없음)
+    - 같은 (맵 버전, 시작, 목표) 요청은 진행 중인 Future를 공유하고, 완료된 결과는 LRU로 재사용
+    결과는 Future로 반환되며 NPC가 매 프레임 done()을 확인합니다.
+    num_workers=0이면 request()가 그 자리에서 탐색을 끝낸 Future를 돌려줍니다 (헤드리스 시뮬레이션의 재현성용).
+    결과 값: 경로 튜플 (시작 칸 제외, 목표 칸 포함), 경로가 없으면 None
+    """
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = PathfindingService()
+        return cls._instance
+
+    def __init__(self, num_workers=2, cache_size=256, max_nodes=5000):
+        self.cache_size = cache_size
+        self.max_nodes = max_nodes
+
+        self.request_queue = queue.Queue()
+        self.lock = threading.Lock()
+        self.in_flight = {} # {key: Future}
+        self.results = OrderedDict() # {key: path}
+
+        self._walk = None # (map_manager, version, bytes, stride)
+
+        self.requests = 0
+        self.deduped = 0
+        self.cache_hits = 0
+        self.searches = 0
+
+        self.running = True
+        self.workers = []
+        for i in range(num_workers):
+            t = threading.Thread(target=self._worker_loop, name=f"Pathfinder-{i}", daemon=True)
+            t.start()
+            self.workers.append(t)
+
+    def request(self, map_manager, start, goal):
+        """
+        start -> goal 경로 탐색을 요청하고 Future를 반환합니다. (메인 스레드에서 호출)
+        보행 배열 스냅샷은 여기서 만들어지므로 워커는 맵 객체를 직접 읽지 않습니다.
+        """
+        self.requests += 1
+        walk, stride, version = self._walk_snapshot(map_manager)
+        key = (id(map_manager), version, start, goal)
+
+        with self.lock:
+            if key in self.results:
+                self.results.move_to_end(key)
+                self.cache_hits += 1
+                future = Future(); future.set_result(self.results[key])
+                return future
+            future = self.in_flight.get(key)
+            if future is not None:
+                self.deduped += 1
+                return future
+            future = Future()
+            self.in_flight[key] = future
+
+        if not self.workers:
+            self._complete(key, walk, stride, start, goal, future)
+            return future
+        self.request_queue.put((key, walk, stride, start, goal, future))
+        return future
+
+    def _walk_snapshot(self, map_manager):
+        """collision_map을 1차원 보행 배열(1=보행 가능)로 복사. 충돌 캐시 버전이 같으면 재사용"""
+        version = map_manager.collision_version
+        cached = self._walk
+        if cached is not None and cached[0] is map_manager and cached[1] == version:
+            return cached[2], cached[3], version
+
+        w, h = map_manager.width, map_manager.height
+        stride = w + 2
+        walk = bytearray(stride * (h + 2))
+        collision = map_manager.collision_map
+        for y in range(h):
+            base = (y + 1) * stride + 1
+            walk[base:base + w] = collision[y * w:(y + 1) * w].translate(WALKABLE)
+        # 문(카테고리 5)은 NPC가 열고 지나가므로 보행 가능 (tile_cache로 문 위치만 확인)
+        objects = map_manager.map_data['object'].tids
+        for tid, positions in map_manager.tile_cache.items():
+            if get_tile_category(tid) != 5: continue
+            for px, py in positions:
+                x, y = px // TILE_SIZE, py // TILE_SIZE
+                if objects[y * w + x] == tid: walk[(y + 1) * stride + x + 1] = 1
+
+        walk = bytes(walk) # 워커 간 공유되는 읽기 전용 스냅샷
+        self._walk = (map_manager, version, walk, stride)
+        return walk, stride, version
+
+    def _worker_loop(self):
+        while self.running:
+            try:
+                key, walk, stride, start, goal, future = self.request_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            self._complete(key, walk, stride, start, goal, future)
+            self.request_queue.task_done()
+
+    def _complete(self, key, walk, stride, start, goal, future):
+        try:
+            path = self._search(walk, stride, start, goal)
+        except Exception:
+            path = None
+
+        with self.lock:
+            self.in_flight.pop(key, None)
+            self.results[key] = path
+            if len(self.results) > self.cache_size:
+                self.results.popitem(last=False)
+        future.set_result(path)
+
+    def _search(self, walk, stride, start, goal):
+        self.searches += 1
+        if start == goal: return ()
+
+        rows = len(walk) // stride
+        sx, sy = start[0] + 1, start[1] + 1
+        gx, gy = goal[0] + 1, goal[1] + 1
+        if not (0 < sx < stride - 1 and 0 < sy < rows - 1): return None
+        if not (0 < gx < stride - 1 and 0 < gy < rows - 1): return None
+
+        s_idx = sy * stride + sx
+        g_idx = gy * stride + gx
+        steps = (1, -1, stride, -stride)
+
+        # 4방향 A* (맨해튼 휴리스틱). 목표 칸은 막혀 있어도 도착 가능 (침대/상호작용 타일 등)
+        open_set = [(0, s_idx)]
+        came_from = {s_idx: None}
+        g_score = {s_idx: 0}
+        while open_set and len(came_from) < self.max_nodes:
+            current = heapq.heappop(open_set)[1]
+            if current == g_idx: break
+            new_g = g_score[current] + 1
+            for step in steps:
+                n = current + step
+                if not walk[n] and n != g_idx: continue
+                if n not in g_score or new_g < g_score[n]:
+                    g_score[n] = new_g
+                    heapq.heappush(open_set, (new_g + abs(gx - n % stride) + abs(gy - n // stride), n))
+                    came_from[n] = current
+
+        if g_idx not in came_from: return None
+
+        path = []
+        curr = g_idx
+        while curr != s_idx:
+            path.append((curr % stride - 1, curr // stride - 1))
+            curr = came_from[curr]
+        path.reverse()
+        return tuple(path)
+
+    def shutdown(self):
+        self.running = False
+        for t in self.workers:
+            if t.is_alive(): t.join(timeout=1.0)
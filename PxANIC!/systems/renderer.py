@@ -2,6 +2,7 @@ import pygame
 from settings import *
 from colors import *
 from world.tiles import get_texture, get_tile_category
+from systems.shadow_atlas import ShadowAtlas
 
 def get_render_height(target):
     """
@@ -72,9 +73,9 @@ def shear_surface(surf, slope_x):
     # The HEAD (Top, y=0) moves based on light direction.
     # So shift is proportional to (h - y).
     
+    # [최적화] 같은 dest_x를 갖는 연속된 행은 한 번에 blit (행 단위 blit 횟수 감소)
+    run_start, run_x = 0, None
     for y in range(h):
-        src_rect = pygame.Rect(0, y, w, 1)
-        
         # Calculate shift
         # When slope_x > 0 (Shadow Right): Top moves Right.
         # shift = (h - y) * slope_x
@@ -95,16 +96,30 @@ def shear_surface(surf, slope_x):
         else:
             dest_x = int(shift_amt + extra_w) # Shift is negative, so add max width
             
-        result.blit(surf, (dest_x, y), src_rect)
+        if dest_x != run_x:
+            if run_x is not None:
+                result.blit(surf, (run_x, run_start), pygame.Rect(0, run_start, w, y - run_start))
+            run_start, run_x = y, dest_x
+    result.blit(surf, (run_x, run_start), pygame.Rect(0, run_start, w, h - run_start))
         
     return result
 
+def project_shadow(silhouette, real_h, shift_x, shift_y):
+    """실루엣을 그림자 길이에 맞게 세로로 스케일한 뒤 기울여 투영 그림자를 만듭니다."""
+    # Dynamic Height Calculation
+    target_shadow_h = int(real_h * abs(shift_y))
+    target_shadow_h = max(4, target_shadow_h)
+    scaled = pygame.transform.scale(silhouette, (silhouette.get_width(), target_shadow_h))
+    # Slope Calculation
+    slope = (real_h * shift_x) / target_shadow_h
+    return shear_surface(scaled, slope)
+
 class CharacterRenderer:
     _sprite_cache = {}
     
-    pygame.font.init()
-    NAME_FONT = pygame.font.SysFont("arial", 11, bold=True)
-    POPUP_FONT = pygame.font.SysFont("arial", 12, bold=True)
+    # [최적화] 폰트는 클래스 정의(import) 시점이 아니라 처음 이름표를 그릴 때 생성 (SysFont 조회가 느림)
+    NAME_FONT = None
+    POPUP_FONT = None
 
     RECT_BODY = pygame.Rect(4, 4, 24, 24)
     RECT_CLOTH = pygame.Rect(4, 14, 24, 14)
@@ -114,11 +129,22 @@ class CharacterRenderer:
     RECT_HAT_RIM = pygame.Rect(6, 0, 20, 7)
 
     _name_surface_cache = {}
+    _shadow_atlas = ShadowAtlas() # [최적화] (스프라이트 키, 그림자 방향 구간)별 완성된 그림자
+    _contact_shadow = None
 
     @classmethod
     def clear_cache(cls):
         cls._sprite_cache.clear()
         cls._name_surface_cache.clear()
+        cls._shadow_atlas.clear()
+
+    @classmethod
+    def _get_fonts(cls):
+        if cls.NAME_FONT is None:
+            if not pygame.font.get_init(): pygame.font.init()
+            cls.NAME_FONT = pygame.font.SysFont("arial", 11, bold=True)
+            cls.POPUP_FONT = pygame.font.SysFont("arial", 12, bold=True)
+        return cls.NAME_FONT, cls.POPUP_FONT
 
     @classmethod
     def _get_cache_key(cls, entity, is_highlighted):
@@ -185,32 +211,24 @@ class CharacterRenderer:
         
         # 1. Contact Shadow
         contact_w, contact_h = 16, 6
-        contact_surf = pygame.Surface((contact_w, contact_h), pygame.SRCALPHA)
-        pygame.draw.ellipse(contact_surf, (0, 0, 0, 120), (0, 0, contact_w, contact_h))
-        screen.blit(contact_surf, (cx - contact_w // 2, cy - contact_h // 2))
+        if CharacterRenderer._contact_shadow is None:
+            contact_surf = pygame.Surface((contact_w, contact_h), pygame.SRCALPHA)
+            pygame.draw.ellipse(contact_surf, (0, 0, 0, 120), (0, 0, contact_w, contact_h))
+            CharacterRenderer._contact_shadow = contact_surf
+        screen.blit(CharacterRenderer._contact_shadow, (cx - contact_w // 2, cy - contact_h // 2))
 
-        # 2. Projected Silhouette Shadow
+        # 2. Projected Silhouette Shadow (캐시 미스일 때만 마스크/스케일/기울이기 수행)
         base_surf = CharacterRenderer.get_base_surface(entity)
-        mask = pygame.mask.from_surface(base_surf)
-        silhouette = mask.to_surface(setcolor=(0, 0, 0, 80), unsetcolor=(0, 0, 0, 0))
-        
         real_h = get_render_height(entity)
         
-        # Dynamic Height Calculation
-        target_shadow_h = int(real_h * abs(shift_y))
-        target_shadow_h = max(4, target_shadow_h) 
-        
-        sprite_w = silhouette.get_width()
-        scaled_surf = pygame.transform.scale(silhouette, (sprite_w, target_shadow_h))
+        def build(qx, qy):
+            mask = pygame.mask.from_surface(base_surf)
+            silhouette = mask.to_surface(setcolor=(0, 0, 0, 80), unsetcolor=(0, 0, 0, 0))
+            return project_shadow(silhouette, real_h, qx, qy)
         
-        # Slope Calculation
-        if target_shadow_h > 0:
-            slope = (real_h * shift_x) / target_shadow_h
-        else:
-            slope = 0
-        
-        sheared_surf = shear_surface(scaled_surf, slope)
+        sheared_surf = CharacterRenderer._shadow_atlas.get(CharacterRenderer._get_cache_key(entity, False), shift_x, shift_y, build)
         
+        sprite_w = base_surf.get_width()
         sw, sh = sheared_surf.get_size()
         
         # Alignment
@@ -253,11 +271,15 @@ class CharacterRenderer:
         elif entity.role == "MAFIA" and viewer_role in ["MAFIA", "SPECTATOR"]: name_color = (255, 100, 100)
         text_cache_key = (id(entity), entity.name, name_color)
         if text_cache_key in CharacterRenderer._name_surface_cache: name_surf = CharacterRenderer._name_surface_cache[text_cache_key]
-        else: name_surf = CharacterRenderer.NAME_FONT.render(entity.name, True, name_color); CharacterRenderer._name_surface_cache[text_cache_key] = name_surf
+        else: name_surf = CharacterRenderer._get_fonts()[0].render(entity.name, True, name_color); CharacterRenderer._name_surface_cache[text_cache_key] = name_surf
         screen.blit(name_surf, (draw_x + (TILE_SIZE // 2) - (name_surf.get_width() // 2), draw_y - 14))
 
 class MapRenderer:
     CHUNK_SIZE = 16 # Tiles per chunk (16x32 = 512px)
+    SHADOW_ALPHA = 80
+    SHADOW_KEY = (255, 0, 255) # 그림자 청크의 투명색
+    SHADOW_REBAKE_PER_FRAME = 2 # 그림자 구간이 바뀌었을 때 한 프레임에 다시 굽는 청크 수 (끊김 방지)
+    SHADOW_REACH = 64 * 3 # 그림자가 캐스터에서 뻗을 수 있는 최대 거리(px): 최대 높이 64 x 최대 shift 2.5, 여유 포함
 
     def __init__(self, map_manager):
         self.map_manager = map_manager
@@ -267,18 +289,29 @@ class MapRenderer:
         self.zone_mesher = None
         self._init_zone_mesher()
         
-        # [NEW Shadow Buffer]
-        self.shadow_buffer = None
+        # [최적화] 정적 그림자 레이어: 청크별로 구워 두고 화면에는 보이는 청크만 한 번씩 blit
+        self.shadow_atlas = ShadowAtlas() # 클러스터/오브젝트별 기울인 그림자 캐시
+        self._shadow_cache = {} # {(cx, cy): (bucket, Surface or None)}
+        self._shadow_bucket = None
         # [NEW Wall Clusters]
-        self.wall_clusters = [] # Stores {surf, silhouette, world_x, world_y, height}
+        self.wall_clusters = [] # Stores {key, tiles, silhouette, world_x, world_y, width, height, render_h}
+        self._cluster_chunks = {} # {(cx, cy): [cluster, ...]} - 그림자가 해당 청크에 닿을 수 있는 클러스터
+        self._next_cluster_key = 0
+        self._clusters_dirty = False
         self._build_wall_clusters()
+        self._index_wall_clusters()
+        map_manager.tile_listeners.append(self._on_tile_changed)
 
     def invalidate_cache(self):
         self._floor_cache.clear()
+        self._shadow_cache.clear()
+        self.shadow_atlas.clear()
         self.zone_mesher = None # Rebuild on map change
         # Rebuild wall clusters
         self.wall_clusters = []
         self._build_wall_clusters()
+        self._index_wall_clusters()
+        self._clusters_dirty = False
 
     def _init_zone_mesher(self):
         from systems.zone_mesher import ZoneMesher
@@ -290,7 +323,9 @@ class MapRenderer:
         This ensures buildings cast a single, unified shadow.
         """
         self.wall_clusters = []
+        # [최적화] 레이어 배열 직접 조회 (인덱스 = y * cols + x)
         walls = self.map_manager.map_data['wall']
+        wall_tids, wall_rots = walls.tids, walls.rots
         visited = set()
         rows = self.map_manager.height
         cols = self.map_manager.width
@@ -299,8 +334,7 @@ class MapRenderer:
             for c in range(cols):
                 if (c, r) in visited: continue
                 
-                t_data = walls[r][c]
-                tid = t_data[0] if isinstance(t_data, (list, tuple)) else t_data
+                tid = wall_tids[r * cols + c]
                 
                 if tid == 0: continue
                 
@@ -321,9 +355,8 @@ class MapRenderer:
                 while stack:
                     curr_c, curr_r = stack.pop()
                     
-                    ct_data = walls[curr_r][curr_c]
-                    ct_tid = ct_data[0] if isinstance(ct_data, (list, tuple)) else ct_data
-                    ct_rot = ct_data[1] if isinstance(ct_data, (list, tuple)) else 0
+                    ct_tid = wall_tids[curr_r * cols + curr_c]
+                    ct_rot = wall_rots[curr_r * cols + curr_c] * 90
                     
                     cluster_tiles.append((curr_c, curr_r, ct_tid, ct_rot))
                     
@@ -337,8 +370,7 @@ class MapRenderer:
                         nx, ny = curr_c + dx, curr_r + dy
                         if 0 <= nx < cols and 0 <= ny < rows:
                             if (nx, ny) not in visited:
-                                n_data = walls[ny][nx]
-                                n_tid = n_data[0] if isinstance(n_data, (list, tuple)) else n_data
+                                n_tid = wall_tids[ny * cols + nx]
                                 if n_tid != 0:
                                     nh = get_render_height(n_tid)
                                     # Group only walls of similar height
@@ -362,6 +394,8 @@ class MapRenderer:
                 silhouette = mask.to_surface(setcolor=(0, 0, 0, 255), unsetcolor=(0, 0, 0, 0))
                 
                 self.wall_clusters.append({
+                    'key': self._next_cluster_key, # 그림자 캐시 키 (id()는 재사용될 수 있으므로 사용하지 않음)
+                    'tiles': tuple(sorted(cluster_tiles)), # 변경 감지용
                     'silhouette': silhouette,
                     'world_x': min_x * TILE_SIZE,
                     'world_y': min_y * TILE_SIZE,
@@ -369,6 +403,53 @@ class MapRenderer:
                     'height': h_tiles * TILE_SIZE,
                     'render_h': cluster_h
                 })
+                self._next_cluster_key += 1
+
+    def _chunk_range(self, x1, y1, x2, y2):
+        """월드 픽셀 사각형 (x1, y1)-(x2, y2)에 걸치는 청크 좌표 목록"""
+        chunk_px = self.CHUNK_SIZE * TILE_SIZE
+        return [(cx, cy)
+                for cy in range(max(0, int(y1 // chunk_px)), int(y2 // chunk_px) + 1)
+                for cx in range(max(0, int(x1 // chunk_px)), int(x2 // chunk_px) + 1)]
+
+    def _cluster_reach(self, cluster):
+        """클러스터 그림자가 닿을 수 있는 청크 (그림자 방향과 무관한 보수적 범위)"""
+        reach = self.SHADOW_REACH
+        return self._chunk_range(cluster['world_x'] - reach, cluster['world_y'] - reach,
+                                 cluster['world_x'] + cluster['width'] + reach, cluster['world_y'] + cluster['height'] + reach)
+
+    def _index_wall_clusters(self):
+        self._cluster_chunks = {}
+        for cluster in self.wall_clusters:
+            for chunk_key in self._cluster_reach(cluster):
+                self._cluster_chunks.setdefault(chunk_key, []).append(cluster)
+
+    def _refresh_wall_clusters(self):
+        """벽이 바뀐 뒤 클러스터를 다시 묶고, 구성이 달라진 클러스터의 그림자 청크만 무효화"""
+        old_clusters = {c['tiles']: c for c in self.wall_clusters}
+        self._build_wall_clusters()
+        clusters = []
+        for cluster in self.wall_clusters:
+            old = old_clusters.pop(cluster['tiles'], None)
+            if old is not None:
+                clusters.append(old) # 그대로인 클러스터는 기존 키를 유지해 캐시된 그림자 재사용
+            else:
+                clusters.append(cluster)
+                for chunk_key in self._cluster_reach(cluster): self._shadow_cache.pop(chunk_key, None)
+        for old in old_clusters.values(): # 사라진 클러스터
+            for chunk_key in self._cluster_reach(old): self._shadow_cache.pop(chunk_key, None)
+        self.wall_clusters = clusters
+        self._index_wall_clusters()
+        self._clusters_dirty = False
+
+    def _on_tile_changed(self, gx, gy, layer):
+        if layer == 'floor': return
+        # 오브젝트/벽이 바뀐 칸 주변에서 그림자가 닿을 수 있는 청크만 다시 굽도록 표시
+        reach = self.SHADOW_REACH
+        x, y = gx * TILE_SIZE, gy * TILE_SIZE
+        for chunk_key in self._chunk_range(x - reach, y - reach, x + TILE_SIZE + reach, y + TILE_SIZE + reach):
+            self._shadow_cache.pop(chunk_key, None)
+        if layer == 'wall': self._clusters_dirty = True
 
     def _render_floor_chunk(self, cx, cy):
         surf = pygame.Surface((self.CHUNK_SIZE * TILE_SIZE, self.CHUNK_SIZE * TILE_SIZE), pygame.SRCALPHA)
@@ -377,16 +458,15 @@ class MapRenderer:
         end_col = min(start_col + self.CHUNK_SIZE, self.map_width_tiles)
         end_row = min(start_row + self.CHUNK_SIZE, self.map_height_tiles)
         floors = self.map_manager.map_data['floor']
+        tids, rots, w = floors.tids, floors.rots, floors.width
         
         for r in range(start_row, end_row):
             for c in range(start_col, end_col):
                 draw_x = (c - start_col) * TILE_SIZE
                 draw_y = (r - start_row) * TILE_SIZE
-                tile_data = floors[r][c]
-                tid = tile_data[0] if isinstance(tile_data, (tuple, list)) else tile_data
-                rot = tile_data[1] if isinstance(tile_data, (tuple, list)) else 0
+                tid = tids[r * w + c]
                 if tid != 0:
-                    img = get_texture(tid, rot)
+                    img = get_texture(tid, rots[r * w + c] * 90)
                     surf.blit(img, (draw_x, draw_y))
         return surf
 
@@ -402,133 +482,137 @@ class MapRenderer:
         
         walls = self.map_manager.map_data['wall']
         objects = self.map_manager.map_data['object']
+        w = walls.width
         
         for r in range(start_row, end_row):
             for c in range(start_col, end_col):
+                idx = r * w + c
                 # 1. Walls
-                w_data = walls[r][c]
-                w_tid = w_data[0] if isinstance(w_data, (tuple, list)) else w_data
-                w_rot = w_data[1] if isinstance(w_data, (tuple, list)) else 0
+                w_tid = walls.tids[idx]
                 if w_tid != 0:
                     # Construct renderable
                     rect = pygame.Rect(c * TILE_SIZE, r * TILE_SIZE, TILE_SIZE, TILE_SIZE)
-                    renderables.append({'type': 'WALL', 'rect': rect, 'tid': w_tid, 'rot': w_rot})
+                    renderables.append({'type': 'WALL', 'rect': rect, 'tid': w_tid, 'rot': walls.rots[idx] * 90})
                 
                 # 2. Doors (Objects category 5)
-                o_data = objects[r][c]
-                o_tid = o_data[0] if isinstance(o_data, (tuple, list)) else o_data
-                o_rot = o_data[1] if isinstance(o_data, (tuple, list)) else 0
+                o_tid = objects.tids[idx]
                 if o_tid != 0:
                     if get_tile_category(o_tid) == 5: # Door
                         rect = pygame.Rect(c * TILE_SIZE, r * TILE_SIZE, TILE_SIZE, TILE_SIZE)
-                        renderables.append({'type': 'DOOR', 'rect': rect, 'tid': o_tid, 'rot': o_rot})
+                        renderables.append({'type': 'DOOR', 'rect': rect, 'tid': o_tid, 'rot': objects.rots[idx] * 90})
         
         return renderables
 
-    def draw_all_shadows(self, screen, camera, shift_x, shift_y):
+    def _render_shadow_chunk(self, cx, cy, qx, qy):
         """
-        Draws merged shadows using pre-calculated clusters and a shadow buffer.
+        청크 하나에 떨어지는 벽 클러스터/오브젝트 그림자를 월드 좌표 기준으로 굽습니다.
+        청크 밖 캐스터의 그림자도 SHADOW_REACH 안이면 포함되며, 청크 경계에서 잘립니다.
+        그림자가 없으면 None.
         """
-        # Buffer Init
-        screen_w, screen_h = screen.get_size()
-        if self.shadow_buffer is None or self.shadow_buffer.get_size() != (screen_w, screen_h):
-            self.shadow_buffer = pygame.Surface((screen_w, screen_h), pygame.SRCALPHA)
-        
-        self.shadow_buffer.fill((0, 0, 0, 0))
-
-        # Culling bounds
-        cam_x, cam_y = camera.x, camera.y
-        vw, vh = camera.width / camera.zoom_level, camera.height / camera.zoom_level
+        chunk_px = self.CHUNK_SIZE * TILE_SIZE
+        origin_x, origin_y = cx * chunk_px, cy * chunk_px
+        surf = None
         
         # === 1. Wall Clusters (Buildings) ===
-        for cluster in self.wall_clusters:
-            # Simple Culling
-            if (cluster['world_x'] > cam_x + vw + 100 or 
-                cluster['world_x'] + cluster['width'] < cam_x - 100 or
-                cluster['world_y'] > cam_y + vh + 100 or
-                cluster['world_y'] + cluster['height'] < cam_y - 100):
-                continue
-            
-            # Use Pre-calculated Silhouette
+        for cluster in self._cluster_chunks.get((cx, cy), ()):
             silhouette = cluster['silhouette']
             real_h = cluster['render_h']
-            
-            # Dynamic Height & Scale
-            target_shadow_h = int(real_h * abs(shift_y))
-            target_shadow_h = max(4, target_shadow_h)
-            
-            sw, sh = silhouette.get_size()
-            scaled = pygame.transform.scale(silhouette, (sw, target_shadow_h))
-            
-            # Shear
-            if target_shadow_h > 0:
-                slope = (real_h * shift_x) / target_shadow_h
-            else:
-                slope = 0
-            sheared = shear_surface(scaled, slope)
-            
-            # Position
-            draw_x = cluster['world_x'] - cam_x
-            draw_y = cluster['world_y'] - cam_y
-            
+            sheared = self.shadow_atlas.get(('cluster', cluster['key']), qx, qy,
+                                            lambda bx, by: project_shadow(silhouette, real_h, bx, by))
             shadow_w, shadow_h = sheared.get_size()
-            
-            if shift_x >= 0: sx = draw_x
-            else: sx = draw_x - (shadow_w - sw)
-            
+            if qx >= 0: sx = cluster['world_x']
+            else: sx = cluster['world_x'] - (shadow_w - silhouette.get_width())
             # Anchor to bottom of the cluster
-            sy = (draw_y + cluster['height']) - shadow_h + 2
+            sy = (cluster['world_y'] + cluster['height']) - shadow_h + 2
             
-            self.shadow_buffer.blit(sheared, (sx, sy))
+            if surf is None: surf = self._new_shadow_chunk()
+            surf.blit(sheared, (sx - origin_x, sy - origin_y))
 
         # === 2. Individual Objects ===
-        # Objects are still processed individually as they are dynamic/scattered
         objects = self.map_manager.map_data['object']
-        start_col = int(max(0, cam_x // TILE_SIZE))
-        start_row = int(max(0, cam_y // TILE_SIZE))
-        end_col = int(min(self.map_manager.width, (cam_x + vw) // TILE_SIZE + 2))
-        end_row = int(min(self.map_manager.height, (cam_y + vh) // TILE_SIZE + 2))
+        w = objects.width
+        margin = -(-self.SHADOW_REACH // TILE_SIZE)
+        start_col = max(0, cx * self.CHUNK_SIZE - margin)
+        start_row = max(0, cy * self.CHUNK_SIZE - margin)
+        end_col = min(self.map_manager.width, (cx + 1) * self.CHUNK_SIZE + margin)
+        end_row = min(self.map_manager.height, (cy + 1) * self.CHUNK_SIZE + margin)
         
         for r in range(start_row, end_row):
             for c in range(start_col, end_col):
-                o_data = objects[r][c]
-                o_tid = o_data[0] if isinstance(o_data, (tuple, list)) else o_data
-                o_rot = o_data[1] if isinstance(o_data, (tuple, list)) else 0
-                
+                o_tid = objects.tids[r * w + c]
                 if o_tid == 0: continue
                 if get_tile_category(o_tid) == 1: continue 
+                o_rot = objects.rots[r * w + c] * 90
                 
                 img = get_texture(o_tid, o_rot)
-                mask = pygame.mask.from_surface(img)
-                silhouette = mask.to_surface(setcolor=(0, 0, 0, 255), unsetcolor=(0, 0, 0, 0))
+                sw = img.get_width()
                 
-                real_h = get_render_height(o_tid)
+                def build(bx, by, img=img, o_tid=o_tid):
+                    mask = pygame.mask.from_surface(img)
+                    silhouette = mask.to_surface(setcolor=(0, 0, 0, 255), unsetcolor=(0, 0, 0, 0))
+                    return project_shadow(silhouette, get_render_height(o_tid), bx, by)
                 
-                target_shadow_h = int(real_h * abs(shift_y))
-                target_shadow_h = max(4, target_shadow_h)
-
-                sw, sh = silhouette.get_size()
-                scaled = pygame.transform.scale(silhouette, (sw, target_shadow_h))
-                
-                if target_shadow_h > 0:
-                    slope = (real_h * shift_x) / target_shadow_h
-                else:
-                    slope = 0
-                sheared = shear_surface(scaled, slope)
-                
-                draw_x = c * TILE_SIZE - cam_x
-                draw_y = r * TILE_SIZE - cam_y
+                sheared = self.shadow_atlas.get(('obj', o_tid, o_rot), qx, qy, build)
                 
                 shadow_w, shadow_h = sheared.get_size()
-                if shift_x >= 0: sx = draw_x
-                else: sx = draw_x - (shadow_w - sw)
-                sy = (draw_y + TILE_SIZE) - shadow_h + 2
+                sx = c * TILE_SIZE if qx >= 0 else c * TILE_SIZE - (shadow_w - sw)
+                sy = (r + 1) * TILE_SIZE - shadow_h + 2
+                # 이 청크에 닿지 않는 그림자는 건너뜀
+                if sx >= origin_x + chunk_px or sx + shadow_w <= origin_x or sy >= origin_y + chunk_px or sy + shadow_h <= origin_y:
+                    continue
                 
-                self.shadow_buffer.blit(sheared, (sx, sy))
+                if surf is None: surf = self._new_shadow_chunk()
+                surf.blit(sheared, (sx - origin_x, sy - origin_y))
         
-        # Final Composite
-        self.shadow_buffer.set_alpha(80) 
-        screen.blit(self.shadow_buffer, (0, 0))
+        if surf is not None:
+            # 그림자는 완전 불투명/투명뿐이므로 컬러키 + 표면 알파로 합성하는 편이 픽셀 알파보다 빠름
+            # (RLEACCEL은 컬러키와 표면 알파를 함께 쓰면 두 번째 blit부터 색이 깨지므로 사용하지 않음)
+            surf.set_colorkey(self.SHADOW_KEY)
+            surf.set_alpha(self.SHADOW_ALPHA)
+        return surf
+
+    def _new_shadow_chunk(self):
+        chunk_px = self.CHUNK_SIZE * TILE_SIZE
+        surf = pygame.Surface((chunk_px, chunk_px))
+        surf.fill(self.SHADOW_KEY)
+        return surf
+
+    def draw_all_shadows(self, screen, camera, shift_x, shift_y):
+        """
+        Composites the baked static shadow layer (one blit per visible chunk).
+        청크는 그림자 구간(양자화된 shift)이 바뀌거나 주변 벽/오브젝트가 바뀔 때만 다시 굽습니다.
+        """
+        if self._clusters_dirty: self._refresh_wall_clusters()
+
+        chunk_px = self.CHUNK_SIZE * TILE_SIZE
+        vw, vh = camera.width / camera.zoom_level, camera.height / camera.zoom_level
+        start_chunk_x = int(max(0, camera.x // chunk_px))
+        start_chunk_y = int(max(0, camera.y // chunk_px))
+        end_chunk_x = int(min((self.map_width_tiles // self.CHUNK_SIZE) + 1, (camera.x + vw) // chunk_px + 1))
+        end_chunk_y = int(min((self.map_height_tiles // self.CHUNK_SIZE) + 1, (camera.y + vh) // chunk_px + 1))
+
+        bucket = (ShadowAtlas.quantize(shift_x), ShadowAtlas.quantize(shift_y))
+        if bucket != self._shadow_bucket:
+            # 화면 밖 청크는 버리고, 보이는 청크는 이전 구간 그림자를 잠시 유지하며 나눠서 다시 굽기
+            self._shadow_cache = {k: v for k, v in self._shadow_cache.items()
+                                  if start_chunk_x <= k[0] <= end_chunk_x and start_chunk_y <= k[1] <= end_chunk_y}
+            self._shadow_bucket = bucket
+        qx, qy = bucket
+
+        # 청크끼리 겹치지 않으므로 청크별 알파(SHADOW_ALPHA)로 바로 합성해도 겹친 그림자가 진해지지 않음
+        rebakes = 0
+        for cy in range(start_chunk_y, end_chunk_y + 1):
+            for cx in range(start_chunk_x, end_chunk_x + 1):
+                chunk_key = (cx, cy)
+                entry = self._shadow_cache.get(chunk_key)
+                if entry is None or (entry[0] != bucket and rebakes < self.SHADOW_REBAKE_PER_FRAME):
+                    if entry is not None: rebakes += 1
+                    entry = (bucket, self._render_shadow_chunk(cx, cy, qx, qy))
+                    self._shadow_cache[chunk_key] = entry
+
+                chunk_surf = entry[1]
+                if chunk_surf is None: continue
+                screen.blit(chunk_surf, (cx * chunk_px - camera.x, cy * chunk_px - camera.y))
 
     def draw_ground(self, screen, camera, visible_tiles=None, tile_alphas=None):
         if tile_alphas is None: tile_alphas = {}
@@ -561,17 +645,16 @@ class MapRenderer:
 
         # 3. Draw Objects (Non-Door objects only)
         objects = self.map_manager.map_data['object']
+        obj_tids, obj_rots, w = objects.tids, objects.rots, objects.width
         
         for r in range(start_row, end_row):
             for c in range(start_col, end_col):
-                tile_data = objects[r][c]
-                tid = tile_data[0] if isinstance(tile_data, (tuple, list)) else tile_data
-                rot = tile_data[1] if isinstance(tile_data, (tuple, list)) else 0
+                tid = obj_tids[r * w + c]
                 if tid != 0:
                     if get_tile_category(tid) != 5: # NOT Door
                         draw_x = c * TILE_SIZE - camera.x
                         draw_y = r * TILE_SIZE - camera.y
-                        img = get_texture(tid, rot)
+                        img = get_texture(tid, obj_rots[r * w + c] * 90)
                         screen.blit(img, (draw_x, draw_y))
 
         # 4. Apply Indoor Masking
@@ -0,0 +1,61 @@
+from collections import OrderedDict
+from settings import SHADOW_SHIFT_STEP, SHADOW_ATLAS_MB
+
+class ShadowAtlas:
+    """
+    기울인(sheared) 그림자 실루엣 캐시.
+    그림자 방향 (shift_x, shift_y)를 SHADOW_SHIFT_STEP 단위로 양자화하여 (스프라이트 키, 구간)별로 완성된 그림자를 보관하고,
+    메모리 한도를 넘으면 가장 오래 안 쓴 항목부터 제거(LRU)합니다.
+    """
+    def __init__(self, budget_bytes=SHADOW_ATLAS_MB * 1024 * 1024):
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        self._entries = OrderedDict() # {(key, qx, qy): (surface, nbytes)}
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def quantize(shift):
+        return round(round(shift / SHADOW_SHIFT_STEP) * SHADOW_SHIFT_STEP, 4)
+
+    def get(self, key, shift_x, shift_y, build):
+        """
+        캐시된 그림자를 반환합니다. 없으면 build(qx, qy)로 만들어 저장합니다.
+        build는 양자화된 shift를 받아야 같은 구간에서 항상 같은 결과가 나옵니다.
+        """
+        qx, qy = self.quantize(shift_x), self.quantize(shift_y)
+        ck = (key, qx, qy)
+        entry = self._entries.get(ck)
+        if entry is not None:
+            self._entries.move_to_end(ck)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        surf = build(qx, qy)
+        w, h = surf.get_size()
+        nbytes = w * h * surf.get_bytesize()
+        self._entries[ck] = (surf, nbytes)
+        self.used_bytes += nbytes
+        while self.used_bytes > self.budget_bytes and len(self._entries) > 1:
+            _, (_, old_bytes) = self._entries.popitem(last=False)
+            self.used_bytes -= old_bytes
+            self.evictions += 1
+        return surf
+
+    def clear(self):
+        self._entries.clear()
+        self.used_bytes = 0
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'bytes': self.used_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / total if total else 0.0
+        }
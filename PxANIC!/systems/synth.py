@@ -0,0 +1,171 @@
+"""
+절차적 사운드 합성 (NumPy 벡터 연산)
+파형(sine / square / saw / noise), 엔벨로프, 이어 붙이기/믹싱을 샘플 배열 단위로 계산하고
+int16 PCM으로 변환하여 WAV로 저장하거나 pygame.mixer.Sound(buffer=...)로 메모리에서 바로 만듭니다.
+- 샘플은 -1.0 ~ 1.0 float 배열, 출력 시 AMPLITUDE를 곱해 int16으로 변환 (기존 generate_sounds.py와 같은 음량)
+- SFX / BGM 레시피는 generate_sounds.py(파일 생성)와 SoundManager(빠진 효과음 즉석 합성)가 함께 사용
+NumPy는 선택 의존성입니다 (requirements.txt 참고). 없으면 AVAILABLE = False이며, SoundManager는 합성 없이 파일만 읽습니다.
+"""
+import wave
+from systems.synth_names import SFX_NAMES, BGM_NAMES
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+AVAILABLE = np is not None
+
+SAMPLE_RATE = 44100
+AMPLITUDE = 16000 # 16-bit audio (max 32767)
+
+def _index(duration):
+    return np.arange(int(SAMPLE_RATE * duration))
+
+# --- 파형 ---
+
+def sine(freq, duration, vol=1.0):
+    t = _index(duration) / SAMPLE_RATE
+    return vol * np.sin(2 * np.pi * freq * t)
+
+def square(freq, duration, vol=1.0):
+    half = int(SAMPLE_RATE / freq) // 2
+    i = _index(duration)
+    return vol * np.where((i // half) % 2 == 1, 1.0, -1.0)
+
+def saw(freq, duration, vol=1.0):
+    period = SAMPLE_RATE / freq
+    return vol * (2 * ((_index(duration) % period) / period) - 1)
+
+def noise(duration, vol=1.0, hold=1, rng=None):
+    """백색 잡음. hold > 1이면 hold 샘플마다 값을 갱신 (저음 느낌)"""
+    rng = rng or np.random.default_rng()
+    n = int(SAMPLE_RATE * duration)
+    values = rng.uniform(-1, 1, (n + hold - 1) // hold)
+    return vol * np.repeat(values, hold)[:n]
+
+def sweep(f_start, f_end, duration, vol=1.0):
+    """주파수가 f_start -> f_end로 선형 변화하는 sine"""
+    t = _index(duration) / SAMPLE_RATE
+    freq = f_start + (f_end - f_start) * (t / duration)
+    return vol * np.sin(2 * np.pi * freq * t)
+
+# --- 엔벨로프 / 조합 ---
+
+def decay(samples, power=1):
+    """1 -> 0 감쇠 (power=2면 끝에서 급격히)"""
+    n = len(samples)
+    return samples * (1.0 - (np.arange(n) / n) ** power)
+
+def concat(*parts):
+    return np.concatenate(parts)
+
+def mix(*parts):
+    """길이가 다른 샘플 배열을 합산 (짧은 쪽은 무음으로 채움)"""
+    out = np.zeros(max(len(p) for p in parts))
+    for p in parts: out[:len(p)] += p
+    return out
+
+def repeat(samples, count):
+    return np.tile(samples, count)
+
+# --- 출력 ---
+
+def to_pcm(samples):
+    """int16 little-endian PCM bytes"""
+    return np.clip(samples * AMPLITUDE, -32767, 32767).astype('<i2').tobytes()
+
+def save_wav(filename, samples):
+    with wave.open(filename, 'w') as f:
+        f.setnchannels(1) # Mono
+        f.setsampwidth(2) # 2 bytes (16-bit)
+        f.setframerate(SAMPLE_RATE)
+        f.writeframes(to_pcm(samples))
+
+def to_sound(samples):
+    """초기화된 mixer 형식(샘플레이트/채널 수)에 맞춘 pygame.mixer.Sound (파일 없이 메모리에서 생성)"""
+    import pygame
+    freq, size, channels = pygame.mixer.get_init()
+    if size != -16: raise ValueError(f"unsupported mixer sample size {size}")
+    if freq != SAMPLE_RATE:
+        n = int(len(samples) * freq / SAMPLE_RATE)
+        samples = np.interp(np.arange(n) * (SAMPLE_RATE / freq), np.arange(len(samples)), samples)
+    pcm = np.clip(samples * AMPLITUDE, -32767, 32767).astype('<i2')
+    if channels > 1: pcm = np.repeat(pcm, channels) # 모노 -> 채널 수만큼 인터리브
+    return pygame.mixer.Sound(buffer=pcm.tobytes())
+
+# --- 레시피 (이름 -> 샘플 배열을 만드는 함수) ---
+
+def sfx_jump(duration=0.3):
+    # 주파수가 올라가는 Sine 파형
+    return sweep(200, 600, duration, 0.5)
+
+def sfx_coin():
+    # 띠-링 (두 개의 높은음)
+    return concat(sine(1200, 0.1, 0.5), sine(1800, 0.2, 0.5))
+
+def sfx_shoot():
+    # 노이즈 + 급격한 감소
+    return decay(noise(0.2, 0.8))
+
+def sfx_explosion():
+    # 4배 느리게 갱신한 노이즈 (저음 효과) + 긴 감소
+    return decay(noise(1.0, 0.8, hold=4), power=2)
+
+def sfx_siren():
+    # 1초에 2번 울리는 사이렌 (주파수 변조된 톱니파)
+    i = _index(2.0)
+    freq = 600 + 300 * np.sin(2 * np.pi * 2 * (i / SAMPLE_RATE))
+    period = SAMPLE_RATE / freq
+    return 0.5 * ((i % period.astype(int)) / period * 2 - 1)
+
+def sfx_footstep():
+    # 아주 짧은 저음 노이즈
+    return decay(noise(0.05, 0.3))
+
+def bgm_title():
+    # 몽환적인 아르페지오 (C Major7: C4, E4, G4, B4) 4번 반복
+    notes = [261.63, 329.63, 392.00, 493.88]
+    return repeat(concat(*(sine(note, 0.2, 0.3) for note in notes)), 4)
+
+def bgm_game():
+    # 긴장감 있는 베이스 라인 (A Minor), 레트로 square 베이스 4번 반복
+    notes = [110.00, 110.00, 130.81, 110.00, 146.83, 110.00, 130.81, 123.47]
+    return repeat(concat(*(square(note, 0.2, 0.2) for note in notes)), 4)
+
+_SFX_RECIPES = {
+    "FOOTSTEP": sfx_footstep,
+    "RUN": lambda: decay(noise(0.15, 0.4)),
+    "RUSTLE": lambda: decay(noise(0.3, 0.2)),
+    "DOOR_OPEN": lambda: saw(100, 0.3, 0.4), # 끼익? (낮은 톱니파)
+    "DOOR_CLOSE": lambda: decay(noise(0.2, 0.6)), # 쿵
+    "DOOR_LOCK": lambda: concat(square(800, 0.1, 0.4), square(600, 0.1, 0.4)), # 철컥
+    "GUNSHOT": sfx_shoot,
+    "RELOAD": lambda: concat(noise(0.1, 0.3), noise(0.1, 0.3)),
+    "SLASH": lambda: decay(noise(0.2, 0.3)), # 쉭 (White noise decay)
+    "HIT": lambda: square(100, 0.1, 0.6), # 퍽
+    "DEATH": lambda: concat(saw(200, 0.5, 0.5), saw(100, 0.5, 0.3)), # 으악 (Tone drop)
+    "SIREN": sfx_siren,
+    "EXPLOSION": sfx_explosion,
+    "EAT": lambda: concat(noise(0.1, 0.3), noise(0.1, 0.3)),
+    "DRINK": lambda: concat(sine(300, 0.1), sine(400, 0.1)),
+    "HEAL": lambda: sine(400, 0.5, 0.4),
+    "ITEM_GET": sfx_coin, # 띠링
+    "COIN_GET": sfx_coin,
+    "WORK": lambda: square(150, 0.1, 0.4), # 뚝
+    "ERROR": lambda: square(100, 0.3, 0.5), # 삐빅
+    "CLICK": lambda: sine(800, 0.05, 0.2),
+    "HOVER": lambda: sine(600, 0.02, 0.1),
+    "ALERT": lambda: concat(square(1200, 0.1, 0.4), square(1000, 0.2, 0.4)),
+    "VOTE": lambda: sine(1000, 0.3, 0.4),
+    "PHASE_CHANGE": lambda: sine(440, 1.0, 0.3), # 긴 톤
+}
+
+_BGM_RECIPES = {
+    "TITLE_THEME": bgm_title,
+    "GAME_THEME": bgm_game,
+}
+
+# 이름 목록(synth_names)을 기준으로 구성 - 레시피가 빠진 이름이 있으면 가져올 때 KeyError
+SFX = {name: _SFX_RECIPES[name] for name in SFX_NAMES}
+BGM = {name: _BGM_RECIPES[name] for name in BGM_NAMES}
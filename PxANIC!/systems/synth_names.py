@@ -0,0 +1,13 @@
+"""
+synth.py 레시피 이름 목록 (NumPy 없이 가져올 수 있는 작은 모듈)
+SoundManager는 이 목록으로 빠진 효과음이 있는지만 확인하고, 있을 때만 synth(NumPy)를 불러옵니다.
+synth.SFX는 이 목록으로 만들어지므로 이름을 추가하면 synth.py에 같은 이름의 레시피가 있어야 합니다.
+"""
+
+SFX_NAMES = (
+    "FOOTSTEP", "RUN", "RUSTLE", "DOOR_OPEN", "DOOR_CLOSE", "DOOR_LOCK", "GUNSHOT", "RELOAD", "SLASH",
+    "HIT", "DEATH", "SIREN", "EXPLOSION", "EAT", "DRINK", "HEAL", "ITEM_GET", "COIN_GET", "WORK",
+    "ERROR", "CLICK", "HOVER", "ALERT", "VOTE", "PHASE_CHANGE",
+)
+
+BGM_NAMES = ("TITLE_THEME", "GAME_THEME")
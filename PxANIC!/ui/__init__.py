@@ -1 +1,6 @@
-from ui.manager import UIManager as UI
+# [최적화] ui.widgets.* 만 쓰는 메뉴/로비가 HUD 전체(맵, 타일, 미니맵 ...)를 import하지 않도록 UI는 처음 접근할 때 로드
+def __getattr__(name):
+    if name == 'UI':
+        from ui.manager import UIManager
+        return UIManager
+    raise AttributeError(f"module 'ui' has no attribute {name!r}")
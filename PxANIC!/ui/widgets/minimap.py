@@ -21,32 +21,31 @@ class MinimapWidget(UIWidget):
         surf.fill((20, 20, 25))
         pixels = pygame.PixelArray(surf)
         
-        floors = self.game.map_manager.map_data['floor']
-        walls = self.game.map_manager.map_data['wall']
-        objects = self.game.map_manager.map_data['object']
+        # [최적화] 레이어 배열 직접 조회
+        floors = self.game.map_manager.map_data['floor'].tids
+        walls = self.game.map_manager.map_data['wall'].tids
+        objects = self.game.map_manager.map_data['object'].tids
 
         for y in range(h):
             for x in range(w):
                 # 우선순위: Object > Wall > Floor
                 color = None
+                idx = y * w + x
                 
                 # 1. Object
-                o_val = objects[y][x]
-                o_tid = o_val[0] if isinstance(o_val, (tuple, list)) else o_val
+                o_tid = objects[idx]
                 if o_tid != 0 and o_tid in TILE_DATA:
                     color = TILE_DATA[o_tid].get('color')
                 
                 # 2. Wall (If no object or object has no color)
                 if color is None:
-                    w_val = walls[y][x]
-                    w_tid = w_val[0] if isinstance(w_val, (tuple, list)) else w_val
+                    w_tid = walls[idx]
                     if w_tid != 0 and w_tid in TILE_DATA:
                         color = TILE_DATA[w_tid].get('color')
                 
                 # 3. Floor (If no wall/object)
                 if color is None:
-                    f_val = floors[y][x]
-                    f_tid = f_val[0] if isinstance(f_val, (tuple, list)) else f_val
+                    f_tid = floors[idx]
                     if f_tid != 0 and f_tid in TILE_DATA:
                         color = TILE_DATA[f_tid].get('color')
                 
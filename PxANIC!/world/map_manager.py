@@ -1,38 +1,52 @@
 import json
 import os
+import zlib
+from array import array
 import pygame
 from settings import TILE_SIZE
 from world.tiles import check_collision, NEW_ID_MAP, TILE_DATA, BED_TILES, HIDEABLE_TILES
+from world.tile_layer import TileLayer, TilePositions
+from world.map_format import MapFile, find_binary
+from core import clock
 
 class MapManager:
     def __init__(self):
+        # [최적화] 레이어별 연속 배열 (int32 tid + uint8 회전). map_data[layer][y][x]는 (tid, rot) 뷰로 계속 동작
         self.map_data = {
-            'floor': [],
-            'wall': [],
-            'object': []
+            'floor': TileLayer(0, 0),
+            'wall': TileLayer(0, 0),
+            'object': TileLayer(0, 0)
         }
         self.zone_map = []
-        self.collision_cache = []  # [최적화] 충돌 맵 캐시 추가
+        self.collision_map = bytearray()  # [최적화] 충돌 맵 (y * width + x, 1=막힘)
+        self.collision_version = 0  # 충돌 캐시가 바뀔 때마다 증가 (길찾기 보행 배열 무효화용)
+        self.tile_listeners = []  # set_tile 시 (gx, gy, layer)로 호출되는 콜백 (FOV 불투명도 그리드, 그림자 청크 갱신 등)
         self.width = 0
         self.height = 0
         self.spawn_x = 100
         self.spawn_y = 100
-        self.tile_cache = {}
+        self.tile_cache = {}  # {tid: TilePositions} - 순회하면 (px, py)
         self.tile_cooldowns = {}
         self.open_doors = {}
         
         self.name_to_tid = {data['name']: tid for tid, data in TILE_DATA.items()}
 
+    def _allocate(self, width, height):
+        """레이어/충돌 맵/타일 캐시를 주어진 크기의 빈 맵으로 초기화"""
+        self.width, self.height = width, height
+        for k in self.map_data: self.map_data[k] = TileLayer(width, height)
+        self.collision_map = bytearray(width * height)
+        self.tile_cache = {}
+
     def get_tile(self, gx, gy, layer='floor'):
-        # [최적화] 범위 검사 후 직접 접근 (isinstance 제거)
+        # [최적화] 범위 검사 후 배열 직접 접근
         if 0 <= gx < self.width and 0 <= gy < self.height:
-            # 모든 타일 데이터는 (tid, rot) 튜플 형태임을 보장
-            return self.map_data[layer][gy][gx][0]
+            return self.map_data[layer].tids[gy * self.width + gx]
         return 0
 
     def get_tile_full(self, gx, gy, layer='floor'):
         if 0 <= gx < self.width and 0 <= gy < self.height:
-            return self.map_data[layer][gy][gx]
+            return self.map_data[layer].get(gx, gy)
         return (0, 0)
 
     def set_tile(self, gx, gy, tid, rotation=0, layer=None):
@@ -45,52 +59,50 @@ class MapManager:
             else: layer = 'object'
             
         # [Cache Update] Get old tid to remove from cache
-        old_val = self.map_data[layer][gy][gx]
-        old_tid = old_val[0] if isinstance(old_val, (tuple, list)) else old_val
+        grid = self.map_data[layer]
+        old_tid = grid.tids[gy * self.width + gx]
         
-        # [최적화] 항상 튜플로 저장
-        self.map_data[layer][gy][gx] = (tid, rotation)
+        grid.set(gx, gy, tid, rotation)
         
-        # [Cache Update] Update tile_cache
-        pos = (gx * TILE_SIZE, gy * TILE_SIZE)
+        # [Cache Update] Update tile_cache ([최적화] 정렬된 인덱스 배열: 이분 탐색으로 추가/삭제)
+        idx = gy * self.width + gx
         
         # Remove old
         if old_tid != 0 and old_tid in self.tile_cache:
-            if pos in self.tile_cache[old_tid]:
-                self.tile_cache[old_tid].remove(pos)
+            self.tile_cache[old_tid].discard_index(idx)
                 
         # Add new
         if tid != 0:
-            if tid not in self.tile_cache: self.tile_cache[tid] = []
-            if pos not in self.tile_cache[tid]:
-                self.tile_cache[tid].append(pos)
+            if tid not in self.tile_cache: self.tile_cache[tid] = TilePositions(self.width)
+            self.tile_cache[tid].add_index(idx)
         
         # [최적화] 타일 변경 시 해당 위치의 충돌 캐시만 즉시 갱신
         self._update_collision_at(gx, gy)
+        for listener in self.tile_listeners: listener(gx, gy, layer)
 
     # [최적화] 단일 타일 충돌 갱신 헬퍼
     def _update_collision_at(self, x, y):
         if not (0 <= x < self.width and 0 <= y < self.height): return
         
-        is_blocked = False
+        idx = y * self.width + x
+        self.collision_map[idx] = self._is_blocked_at(idx)
+        self.collision_version += 1
         
+    def _is_blocked_at(self, idx):
         # 각 레이어별 충돌 체크
-        for layer in ['floor', 'wall', 'object']:
-            tid = self.map_data[layer][y][x][0]
+        for layer in ('floor', 'wall', 'object'):
+            tid = self.map_data[layer].tids[idx]
             if tid != 0 and check_collision(tid):
                 # 예외 타일(이동 가능) 체크
                 if tid not in BED_TILES and tid not in HIDEABLE_TILES and tid != 5310005:
-                    is_blocked = True
-                    break
-            
-        self.collision_cache[y][x] = is_blocked
+                    return 1
+        return 0
 
     # [최적화] 전체 맵 로드 시 충돌 맵 전체 빌드
     def build_collision_cache(self):
-        self.collision_cache = [[False for _ in range(self.width)] for _ in range(self.height)]
-        for y in range(self.height):
-            for x in range(self.width):
-                self._update_collision_at(x, y)
+        size = self.width * self.height
+        self.collision_map = bytearray(self._is_blocked_at(idx) for idx in range(size))
+        self.collision_version += 1
 
     def get_spawn_points(self, zone_id=1):
         points = []
@@ -102,15 +114,15 @@ class MapManager:
         return points
 
     def check_any_collision(self, gx, gy):
-        # [최적화] 캐시된 2차원 배열 조회로 대체 (O(1))
+        # [최적화] 충돌 맵 배열 조회 (O(1))
         # [수정] 맵 밖은 이동 불가(True)로 처리해야 함
         if not (0 <= gx < self.width and 0 <= gy < self.height):
             return True 
         
-        return self.collision_cache[gy][gx]
+        return self.collision_map[gy * self.width + gx] == 1
 
     def update_doors(self, dt, entities):
-        now = pygame.time.get_ticks()
+        now = clock.get_ticks()
         to_close = []
         
         # [최적화] 살아있는 엔티티의 Rect만 미리 계산 (배치 처리)
@@ -160,7 +172,7 @@ class MapManager:
             
         if target_tid:
             self.set_tile(gx, gy, target_tid, rotation=rot, layer=layer)
-            self.open_doors[(gx, gy)] = pygame.time.get_ticks()
+            self.open_doors[(gx, gy)] = clock.get_ticks()
 
     def close_door(self, gx, gy, layer='object'):
         tid, rot = self.get_tile_full(gx, gy, layer)
@@ -189,25 +201,33 @@ class MapManager:
         return False
 
     def load_map(self, filename="map.json"):
+        # [최적화] 변환된 바이너리 맵(.pxmap)이 있으면 JSON 파싱 대신 청크 배열을 그대로 복사
+        bin_path = find_binary(filename)
+        if bin_path:
+            try:
+                self._load_binary(bin_path)
+                self._finish_load()
+                return True
+            except (OSError, ValueError, KeyError, zlib.error) as e:
+                print(f"[MapManager] Binary map load failed, falling back to JSON: {e}")
+
         if not os.path.exists(filename): self.create_default_map(); return True
         try:
             with open(filename, 'r', encoding='utf-8') as f: data = json.load(f)
-            self.width, self.height = data.get('width', 50), data.get('height', 50)
-            
             # 맵 데이터 초기화
-            for k in self.map_data:
-                self.map_data[k] = [[(0, 0) for _ in range(self.width)] for _ in range(self.height)]
+            self._allocate(data.get('width', 50), data.get('height', 50))
             
             if 'layers' in data:
                 loaded_layers = data['layers']
                 for ln in ['floor', 'wall', 'object']:
                     if ln in loaded_layers:
                         grid = loaded_layers[ln]
+                        layer = self.map_data[ln]
                         for y in range(min(len(grid), self.height)):
                             for x in range(min(len(grid[y]), self.width)):
                                 val = grid[y][x]
-                                # [최적화] 로드 시점에 항상 튜플로 변환하여 저장
-                                self.map_data[ln][y][x] = (val, 0) if isinstance(val, int) else tuple(val)
+                                if isinstance(val, int): layer.set(x, y, val)
+                                else: layer.set(x, y, val[0], val[1])
             elif 'tiles' in data:
                 old_tiles = data['tiles']
                 for y in range(min(len(old_tiles), self.height)):
@@ -216,34 +236,51 @@ class MapManager:
                         self.set_tile(x, y, new_id)
                         
             self.zone_map = data.get('zones', [[0 for _ in range(self.width)] for _ in range(self.height)])
-            # [최적화] 맵 로드 후 캐시 생성
-            self.build_collision_cache()
-            self.build_tile_cache()
-            
-            for y in range(self.height):
-                for x in range(self.width):
-                    if self.zone_map[y][x] == 1: 
-                        self.spawn_x, self.spawn_y = x * TILE_SIZE, y * TILE_SIZE
-                        break
+            self._finish_load()
             return True
         except Exception as e:
             import traceback; traceback.print_exc(); self.create_default_map(); return True
 
+    def _load_binary(self, path):
+        with MapFile(path) as mf:
+            self._allocate(mf.width, mf.height)
+            for ln in ['floor', 'wall', 'object']:
+                if ln in mf.layers:
+                    layer = self.map_data[ln]
+                    mf.read_layer(ln, layer.tids, layer.rots)
+            w, h = mf.width, mf.height
+            if 'zones' in mf.layers:
+                zones = array('i', [0]) * (w * h)
+                mf.read_layer('zones', zones)
+                self.zone_map = [zones[y * w:(y + 1) * w].tolist() for y in range(h)]
+            else:
+                self.zone_map = [[0 for _ in range(w)] for _ in range(h)]
+
+    def _finish_load(self):
+        # [최적화] 맵 로드 후 캐시 생성
+        self.build_collision_cache()
+        self.build_tile_cache()
+
+        for y in range(self.height):
+            for x in range(self.width):
+                if self.zone_map[y][x] == 1:
+                    self.spawn_x, self.spawn_y = x * TILE_SIZE, y * TILE_SIZE
+                    break
+
     def build_tile_cache(self):
         self.tile_cache = {}
         for ln in ['floor', 'wall', 'object']:
-            grid = self.map_data[ln]
-            for y in range(len(grid)):
-                for x in range(len(grid[y])):
-                    tid = grid[y][x][0]
-                    if tid == 0: continue
-                    if tid not in self.tile_cache: self.tile_cache[tid] = []
-                    self.tile_cache[tid].append((x * TILE_SIZE, y * TILE_SIZE))
+            for idx, tid in enumerate(self.map_data[ln].tids):
+                if tid == 0: continue
+                if tid not in self.tile_cache: self.tile_cache[tid] = TilePositions(self.width)
+                self.tile_cache[tid].indices.append(idx)
+        # 같은 ID가 여러 레이어에 있으면 순서가 섞이므로 정렬 + 중복 제거
+        for positions in self.tile_cache.values():
+            positions.indices = array('i', sorted(set(positions.indices)))
         return self.tile_cache
 
     def create_default_map(self):
-        self.width, self.height = 40, 30
-        for k in self.map_data: self.map_data[k] = [[(0,0) for _ in range(self.width)] for _ in range(self.height)]
+        self._allocate(40, 30)
         for y in range(self.height):
             for x in range(self.width): self.set_tile(x, y, 1110000)
         for x in range(self.width):
@@ -259,14 +296,14 @@ class MapManager:
         self.build_collision_cache() # [최적화]
 
     def is_tile_on_cooldown(self, gx, gy):
-        now = pygame.time.get_ticks()
+        now = clock.get_ticks()
         if (gx, gy) in self.tile_cooldowns:
             if now < self.tile_cooldowns[(gx, gy)]: return True
             else: del self.tile_cooldowns[(gx, gy)]
         return False
 
     def set_tile_cooldown(self, gx, gy, duration_ms=3000):
-        self.tile_cooldowns[(gx, gy)] = pygame.time.get_ticks() + duration_ms
+        self.tile_cooldowns[(gx, gy)] = clock.get_ticks() + duration_ms
 
     def find_nearest_tile(self, tids, start_x, start_y):
         """Find the nearest tile among tids from start_x, start_y using cache."""
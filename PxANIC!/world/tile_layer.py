@@ -0,0 +1,112 @@
+from array import array
+from bisect import bisect_left
+from settings import TILE_SIZE
+
+class TileLayer:
+    """
+    맵 레이어 하나를 연속된 배열로 보관합니다.
+    - tids: int32 타일 ID (인덱스 = y * width + x)
+    - rots: uint8 회전 (90도 단위 횟수, 0~3)
+    layer[y][x]는 (tid, rot) 튜플을 돌려주므로 기존 중첩 리스트 사용처도 그대로 동작합니다.
+    렌더러/FOV/길찾기처럼 많이 읽는 곳은 tids/rots를 직접 인덱싱하세요.
+    """
+    __slots__ = ('width', 'height', 'tids', 'rots')
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        size = width * height
+        self.tids = array('i', [0]) * size
+        self.rots = bytearray(size)
+
+    def get(self, x, y):
+        idx = y * self.width + x
+        return (self.tids[idx], self.rots[idx] * 90)
+
+    def set(self, x, y, tid, rotation=0):
+        idx = y * self.width + x
+        self.tids[idx] = tid
+        self.rots[idx] = (int(rotation) // 90) & 3
+
+    def row_tids(self, y):
+        """y행 타일 ID의 복사 없는 뷰 (memoryview)"""
+        start = y * self.width
+        return memoryview(self.tids)[start:start + self.width]
+
+    def __getitem__(self, y):
+        if not 0 <= y < self.height: raise IndexError(y)
+        return TileRow(self, y)
+
+    def __len__(self):
+        return self.height
+
+    def __iter__(self):
+        for y in range(self.height):
+            yield TileRow(self, y)
+
+class TileRow:
+    """TileLayer의 한 행 뷰. row[x] -> (tid, rot), row[x] = (tid, rot)"""
+    __slots__ = ('layer', 'offset')
+
+    def __init__(self, layer, y):
+        self.layer = layer
+        self.offset = y * layer.width
+
+    def __getitem__(self, x):
+        if not 0 <= x < self.layer.width: raise IndexError(x)
+        idx = self.offset + x
+        return (self.layer.tids[idx], self.layer.rots[idx] * 90)
+
+    def __setitem__(self, x, val):
+        if not 0 <= x < self.layer.width: raise IndexError(x)
+        tid, rotation = (val, 0) if isinstance(val, int) else val
+        idx = self.offset + x
+        self.layer.tids[idx] = tid
+        self.layer.rots[idx] = (int(rotation) // 90) & 3
+
+    def __len__(self):
+        return self.layer.width
+
+    def __iter__(self):
+        tids, rots, start = self.layer.tids, self.layer.rots, self.offset
+        for idx in range(start, start + self.layer.width):
+            yield (tids[idx], rots[idx] * 90)
+
+class TilePositions:
+    """
+    타일 ID별 위치 목록 (tile_cache 값).
+    정렬된 int32 타일 인덱스 배열로 보관하고, 읽을 때 (px, py) 좌표로 보여줍니다.
+    순회/len/인덱싱(random.choice)/in 이 리스트처럼 동작하며, 순서는 맵 스캔 순서(행 우선)와 같습니다.
+    """
+    __slots__ = ('width', 'indices')
+
+    def __init__(self, width):
+        self.width = width
+        self.indices = array('i')
+
+    def add_index(self, idx):
+        i = bisect_left(self.indices, idx)
+        if i < len(self.indices) and self.indices[i] == idx: return
+        self.indices.insert(i, idx)
+
+    def discard_index(self, idx):
+        i = bisect_left(self.indices, idx)
+        if i < len(self.indices) and self.indices[i] == idx:
+            del self.indices[i]
+
+    def __len__(self):
+        return len(self.indices)
+
+    def __getitem__(self, i):
+        idx = self.indices[i]
+        return ((idx % self.width) * TILE_SIZE, (idx // self.width) * TILE_SIZE)
+
+    def __iter__(self):
+        w = self.width
+        for idx in self.indices:
+            yield ((idx % w) * TILE_SIZE, (idx // w) * TILE_SIZE)
+
+    def __contains__(self, pos):
+        idx = (pos[1] // TILE_SIZE) * self.width + pos[0] // TILE_SIZE
+        i = bisect_left(self.indices, idx)
+        return i < len(self.indices) and self.indices[i] == idx
@@ -0,0 +1,154 @@
+"""
+타일 텍스처 캐시 팩 (cache_tiles/tiles.pack)
+
+    [헤더] magic 'PXTP', 포맷 버전, 버전 키(16바이트), 항목 수
+    [인덱스] (tid, rotation, w, h, offset, length, last_used) x 항목 수
+    [데이터] RGBA 원본 픽셀
+
+파일 하나를 mmap으로 열어 인덱스만 읽고, 픽셀은 요청될 때 해당 구간만 복사합니다.
+버전 키(타일 생성 코드의 해시)가 다르면 기존 항목은 모두 무시됩니다.
+새 항목은 메모리에 모았다가 flush()에서 임시 파일에 통째로 다시 쓴 뒤 교체하며,
+이때 전체 크기가 한도를 넘으면 오래 사용하지 않은 항목부터 버립니다.
+새 항목 없이 사용 시각(last_used)만 바뀌었으면 flush()는 인덱스 구간만 제자리에서 덮어씁니다.
+"""
+import mmap
+import os
+import struct
+import time
+
+MAGIC = b'PXTP'
+FORMAT_VERSION = 1
+
+HEADER = struct.Struct('<4sH16sI')    # magic, format version, version key, count
+ENTRY = struct.Struct('<ihHHIII')     # tid, rotation, w, h, offset, length, last_used
+TOUCH_RESOLUTION = 3600 # 사용 시각은 이 간격(초) 이상 지났을 때만 갱신 (매 실행마다 인덱스를 다시 쓰지 않도록)
+
+class TilePack:
+    def __init__(self, path, version_key, max_bytes):
+        self.path = path
+        self.version_key = version_key # 16바이트
+        self.max_bytes = max_bytes
+        self.entries = {} # {(tid, rotation): [w, h, offset, length, last_used, slot]} - 파일에 있는 항목
+        self.pending = {} # {(tid, rotation): [w, h, data, last_used]} - 아직 쓰지 않은 항목
+        self.dirty = False
+        self.touched = False # 파일에 있는 항목의 last_used가 바뀜 (인덱스만 다시 쓰면 됨)
+        self._file = None
+        self._mm = None
+        self._open()
+
+    def _open(self):
+        if not os.path.exists(self.path): return
+        try:
+            self._file = open(self.path, 'rb')
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, fmt, key, count = HEADER.unpack_from(self._mm, 0)
+            if magic != MAGIC or fmt != FORMAT_VERSION or key != self.version_key:
+                # 타일 코드가 바뀌었거나 다른 포맷 -> 기존 항목 전부 무효 (다음 flush에서 덮어씀)
+                self.dirty = True
+                self._close_file()
+                return
+            for i in range(count):
+                tid, rot, w, h, offset, length, last_used = ENTRY.unpack_from(self._mm, HEADER.size + i * ENTRY.size)
+                self.entries[(tid, rot)] = [w, h, offset, length, last_used, i]
+        except (OSError, ValueError, struct.error) as e:
+            print(f"[TilePack] Cache pack unreadable, starting empty: {e}")
+            self.entries.clear()
+            self.dirty = True
+            self._close_file()
+
+    def _close_file(self):
+        if self._mm is not None:
+            self._mm.close(); self._mm = None
+        if self._file is not None:
+            self._file.close(); self._file = None
+
+    def get(self, tid, rotation):
+        """(w, h, RGBA bytes) 또는 None"""
+        key = (tid, rotation)
+        item = self.pending.get(key)
+        if item is not None:
+            return item[0], item[1], item[2]
+
+        entry = self.entries.get(key)
+        if entry is None or self._mm is None: return None
+        w, h, offset, length = entry[:4]
+        now = int(time.time())
+        if now - entry[4] >= TOUCH_RESOLUTION:
+            # [수정] 사용 시각을 파일에도 남겨야 제거(eviction)가 실제로 오래 안 쓴 항목을 고름
+            entry[4] = now
+            self.touched = True
+        return w, h, self._mm[offset:offset + length]
+
+    def put(self, tid, rotation, w, h, data):
+        self.pending[(tid, rotation)] = [w, h, bytes(data), int(time.time())]
+        self.dirty = True
+
+    def _evict(self, items):
+        """items: [(key, w, h, data 또는 (offset, length), last_used, length)] -> 한도 안에 드는 최근 사용 항목만"""
+        total = sum(item[5] for item in items)
+        if total <= self.max_bytes: return items
+        # 오래 사용하지 않은 항목부터 버리고 한도의 90%까지 확보
+        items.sort(key=lambda item: item[4], reverse=True)
+        kept, size = [], 0
+        for item in items:
+            if size + item[5] > self.max_bytes * 0.9: continue
+            kept.append(item); size += item[5]
+        print(f"[TilePack] Cache eviction: {len(items) - len(kept)} textures, freed {(total - size) / (1024 * 1024):.2f} MB")
+        return kept
+
+    def _write_access_times(self):
+        """인덱스 구간만 제자리에서 다시 씀 (데이터 구간과 항목 위치는 그대로)"""
+        index = sorted(self.entries.items(), key=lambda item: item[1][5])
+        try:
+            with open(self.path, 'r+b') as f:
+                f.seek(HEADER.size)
+                f.write(b''.join(ENTRY.pack(tid, rot, w, h, offset, length, last_used)
+                                 for (tid, rot), (w, h, offset, length, last_used, _) in index))
+        except OSError as e:
+            print(f"[TilePack] Cache index update failed: {e}")
+            return
+        self.touched = False
+
+    def flush(self):
+        """새 항목이 있으면 팩 파일을 다시 씁니다 (임시 파일 -> 교체). 사용 시각만 바뀌었으면 인덱스만 갱신."""
+        if not self.dirty:
+            if self.touched and self._mm is not None: self._write_access_times()
+            return
+        items = []
+        for key, (w, h, offset, length, last_used, _) in self.entries.items():
+            if key in self.pending: continue
+            items.append((key, w, h, (offset, length), last_used, length))
+        for key, (w, h, data, last_used) in self.pending.items():
+            items.append((key, w, h, data, last_used, len(data)))
+        items = self._evict(items)
+
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp_path = self.path + '.tmp'
+            offset = HEADER.size + len(items) * ENTRY.size
+            with open(tmp_path, 'wb') as f:
+                f.write(HEADER.pack(MAGIC, FORMAT_VERSION, self.version_key, len(items)))
+                for (tid, rot), w, h, _, last_used, length in items:
+                    f.write(ENTRY.pack(tid, rot, w, h, offset, length, last_used))
+                    offset += length
+                for _, _, _, data, _, _ in items:
+                    if isinstance(data, tuple):
+                        start, length = data
+                        f.write(self._mm[start:start + length])
+                    else:
+                        f.write(data)
+            # Windows에서는 매핑된 파일을 교체할 수 없으므로 먼저 닫음
+            self._close_file()
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"[TilePack] Cache save failed: {e}")
+            return
+
+        self.entries.clear()
+        self.pending.clear()
+        self.dirty = False
+        self.touched = False
+        self._open()
+
+    def close(self):
+        self._close_file()
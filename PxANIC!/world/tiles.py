@@ -2,8 +2,10 @@ import pygame
 import random
 import math
 import os
-import glob
 import time
+import atexit
+import hashlib
+from world.tile_pack import TilePack
 
 P = {
     'VOID': (5, 5, 8),
@@ -25,63 +27,60 @@ P = {
 # --- 캐시 설정 ---
 TEXTURE_CACHE = {}
 CACHE_DIR = "cache_tiles"
+CACHE_PACK = os.path.join(CACHE_DIR, "tiles.pack")
 MAX_CACHE_SIZE_MB = 50  # 최대 디스크 캐시 용량 (MB)
-
-if not os.path.exists(CACHE_DIR):
-    os.makedirs(CACHE_DIR)
-
-def cleanup_disk_cache():
-    """디스크 캐시 용량이 한계를 초과하면 오래된 파일부터 삭제"""
-    try:
-        files = glob.glob(os.path.join(CACHE_DIR, "*.png"))
-        total_size = sum(os.path.getsize(f) for f in files)
-        limit_size = MAX_CACHE_SIZE_MB * 1024 * 1024
-
-        if total_size > limit_size:
-            # 수정 시간(mtime) 기준 오름차순 정렬 (오래된 순)
-            files.sort(key=os.path.getmtime)
-            
-            deleted_size = 0
-            for f in files:
-                sz = os.path.getsize(f)
-                try:
-                    os.remove(f)
-                    deleted_size += sz
-                    # 용량이 충분히 확보되면 중단 (여유분 10% 확보)
-                    if total_size - deleted_size < limit_size * 0.9:
-                        break
-                except OSError:
-                    pass
-            print(f"[System] Cache Cleanup: Freed {deleted_size / (1024*1024):.2f} MB")
-    except Exception as e:
-        print(f"[System] Cache Cleanup Error: {e}")
+PACK_FLUSH_EVERY = 32   # 새 텍스처가 이만큼 쌓이면 팩 파일에 기록
+
+# [수정] 텍스처 생성은 전용 난수를 사용 (캐시 적중 여부가 게임 로직의 전역 random 순서를 바꾸지 않도록)
+_rng = random.Random()
+
+# [최적화] 텍스처마다 PNG 한 장 대신 인덱스 + RGBA 원본을 담은 팩 파일 하나 사용
+# 가져오기(import) 시점에는 디렉터리 스캔 없이, 첫 get_texture 호출 때 팩을 엶
+_pack = None
+_pack_new = 0
+
+def _get_pack():
+    global _pack
+    if _pack is None:
+        # 버전 키: 이 파일(그리기 함수)이나 TILE_DATA(DataManager 갱신 포함)가 바뀌면 기존 캐시 전부 무효
+        h = hashlib.md5()
+        with open(__file__, 'rb') as f: h.update(f.read())
+        h.update(repr(sorted((str(tid), d) for tid, d in TILE_DATA.items())).encode('utf-8'))
+        _pack = TilePack(CACHE_PACK, h.digest(), MAX_CACHE_SIZE_MB * 1024 * 1024)
+        atexit.register(flush_disk_cache)
+    return _pack
+
+def flush_disk_cache():
+    """새로 만든 텍스처를 팩 파일에 기록 (용량 한도를 넘으면 오래 안 쓴 텍스처부터 제거)"""
+    global _pack_new
+    if _pack is not None: _pack.flush()
+    _pack_new = 0
 
 def clear_memory_cache():
     """메모리(RAM) 캐시 비우기 - 맵 변경 시 호출 권장"""
     TEXTURE_CACHE.clear()
-
-# 모듈 로드 시 한 번 실행하여 디스크 용량 관리
-cleanup_disk_cache()
+    flush_disk_cache()
 
 def get_texture(tid, rotation=0):
     """캐시된 텍스처를 반환하거나 생성하여 저장 (Disk Cache 적용)"""
+    global _pack_new
     key = (tid, rotation)
 
     # 1. 메모리 캐시 확인
     if key in TEXTURE_CACHE:
         return TEXTURE_CACHE[key]
 
-    # 2. 디스크 캐시 확인
-    filename = os.path.join(CACHE_DIR, f"tile_{tid}_{rotation}.png")
-    if os.path.exists(filename):
+    # 2. 디스크 캐시(팩) 확인
+    pack = _get_pack()
+    entry = pack.get(tid, rotation)
+    if entry:
+        w, h, data = entry
         try:
-            surf = pygame.image.load(filename).convert_alpha()
+            surf = pygame.image.frombuffer(data, (w, h), 'RGBA').convert_alpha()
             TEXTURE_CACHE[key] = surf
             return surf
-        except Exception as e:
-            # 파일 손상 시 삭제 후 재생성
-            try: os.remove(filename)
-            except: pass
+        except (pygame.error, ValueError):
+            pass # 손상되었거나 디스플레이가 없으면 새로 생성 (아래에서 덮어씀)
 
     # 3. 텍스처 신규 생성
     surf = create_texture(tid)
@@ -89,11 +88,10 @@ def get_texture(tid, rotation=0):
     if rotation != 0:
         surf = pygame.transform.rotate(surf, rotation)
 
-    # 생성된 텍스처를 디스크에 저장
-    try:
-        pygame.image.save(surf, filename)
-    except Exception as e:
-        print(f"Error saving cache for {tid}: {e}")
+    # 생성된 텍스처를 팩에 추가 (일정 개수마다 파일에 기록)
+    pack.put(tid, rotation, surf.get_width(), surf.get_height(), pygame.image.tobytes(surf, 'RGBA'))
+    _pack_new += 1
+    if _pack_new >= PACK_FLUSH_EVERY: flush_disk_cache()
 
     TEXTURE_CACHE[key] = surf
     return surf
@@ -117,13 +115,13 @@ def blend(c1, c2, r):
     return (int(c1[0]*(1-r)+c2[0]*r), int(c1[1]*(1-r)+c2[1]*r), int(c1[2]*(1-r)+c2[2]*r))
 
 def noise_color(color, intensity=15):
-    var = random.randint(-intensity, intensity)
+    var = _rng.randint(-intensity, intensity)
     return (max(0, min(255, color[0]+var)), max(0, min(255, color[1]+var)), max(0, min(255, color[2]+var)))
 
 def draw_pro_noise(surf, color, intensity=20):
     surf.fill(color)
     for _ in range(150):
-        x, y = random.randint(0, 31), random.randint(0, 31)
+        x, y = _rng.randint(0, 31), _rng.randint(0, 31)
         pixel(surf, noise_color(color, intensity), (x, y))
 
 def draw_pixel_bevel(surf, rect_obj, base_col, light_col, dark_col, thickness=1):
@@ -155,7 +153,7 @@ def draw_grass_detailed(surf, base_col):
     fill(surf, base_col)
     light, shadow = P['GRASS_LIGHT'], P['GRASS_SHADOW']
     for _ in range(15):
-        cx, cy = random.randint(2, 28), random.randint(2, 28)
+        cx, cy = _rng.randint(2, 28), _rng.randint(2, 28)
         line(surf, shadow, (cx, cy), (cx, cy+3), 1)
         pixel(surf, light, (cx-1, cy-1))
         pixel(surf, light, (cx+1, cy-1))
@@ -167,14 +165,14 @@ def draw_10001(s):
 def draw_10002(s):
     fill(s, P['GRASS_BASE'])
     for _ in range(15):
-        cx, cy = random.randint(2, 28), random.randint(2, 28)
+        cx, cy = _rng.randint(2, 28), _rng.randint(2, 28)
         line(s, P['GRASS_SHADOW'], (cx, cy), (cx, cy+3))
         pixel(s, P['GRASS_LIGHT'], (cx-1, cy-1))
 
 def draw_10003(s):
     draw_pro_noise(s, P['GREY_M'], 10)
     for _ in range(15):
-        circle(s, P['GREY_D'], (random.randint(4,27), random.randint(4,27)), 2)
+        circle(s, P['GREY_D'], (_rng.randint(4,27), _rng.randint(4,27)), 2)
 
 def draw_10004(s):
     draw_pro_noise(s, P['SAND_BASE'], 10)
@@ -190,12 +188,12 @@ def draw_10005(s):
 def draw_10006(s):
     draw_pro_noise(s, P['STONE_SHADOW'], 40)
     for _ in range(3):
-        circle(s, P['BLACK'], (random.randint(5,25), random.randint(5,25)), 4)
+        circle(s, P['BLACK'], (_rng.randint(5,25), _rng.randint(5,25)), 4)
 
 def draw_10007(s):
     draw_pro_noise(s, P['STONE_BASE'], 20)
     for _ in range(6):
-        circle(s, P['GREEN'], (random.randint(4,27), random.randint(4,27)), random.randint(3,6))
+        circle(s, P['GREEN'], (_rng.randint(4,27), _rng.randint(4,27)), _rng.randint(3,6))
 
 def draw_10008(s):
     draw_pro_noise(s, P['WOOD_LIGHT'], 15)
@@ -210,7 +208,7 @@ def draw_10009(s):
 def draw_10010(s):
     draw_pro_noise(s, P['WHITE'], 5)
     for _ in range(3):
-        line(s, P['GREY_L'], (random.randint(0,31), 0), (random.randint(0,31), 31))
+        line(s, P['GREY_L'], (_rng.randint(0,31), 0), (_rng.randint(0,31), 31))
 
 def draw_10011(s):
     for y in range(0, 32, 16):
@@ -237,7 +235,7 @@ def draw_10014(s):
 def draw_10015(s):
     draw_pro_noise(s, P['ASPHALT'], 30)
     for _ in range(20):
-        pixel(s, P['GREY_L'], (random.randint(0,31), random.randint(0,31)))
+        pixel(s, P['GREY_L'], (_rng.randint(0,31), _rng.randint(0,31)))
 
 def draw_10016(s):
     draw_pro_noise(s, P['ASPHALT'], 20)
@@ -272,9 +270,9 @@ def draw_11001(s):
 def draw_11002(s):
     fill(s, P['RED'])
     for _ in range(5):
-        circle(s, P['ORANGE'], (random.randint(4, 27), random.randint(4, 27)), 5)
+        circle(s, P['ORANGE'], (_rng.randint(4, 27), _rng.randint(4, 27)), 5)
     for _ in range(3):
-        pixel(s, P['BLACK'], (random.randint(0, 31), random.randint(0, 31)))
+        pixel(s, P['BLACK'], (_rng.randint(0, 31), _rng.randint(0, 31)))
 
 def draw_11003(s):
     fill(s, P['BROWN_D'])
@@ -301,7 +299,7 @@ def draw_21003(s):
             r_obj = pygame.Rect(x + 1, y + 1, 14, 6)
             draw_pixel_bevel(s, r_obj, P['STONE_BASE'], P['STONE_LIGHT'], P['STONE_SHADOW'])
     for _ in range(4):
-        circle(s, blend(P['GREEN'], P['BLACK'], 0.2), (random.randint(5, 25), random.randint(5, 25)), random.randint(4, 7))
+        circle(s, blend(P['GREEN'], P['BLACK'], 0.2), (_rng.randint(5, 25), _rng.randint(5, 25)), _rng.randint(4, 7))
 
 def draw_21004(s):
     dark = blend(P['WOOD_BASE'], P['BLACK'], 0.3)
@@ -339,7 +337,7 @@ def draw_21009(s):
 def draw_21010(s):
     draw_pro_noise(s, P['METAL_BASE'], 10)
     for _ in range(12):
-        circle(s, P['METAL_RUST'], (random.randint(0, 31), random.randint(0, 31)), random.randint(2, 4))
+        circle(s, P['METAL_RUST'], (_rng.randint(0, 31), _rng.randint(0, 31)), _rng.randint(2, 4))
 
 def draw_21011(s):
     fill(s, (150, 200, 255, 100))
@@ -358,8 +356,8 @@ def draw_21013(s):
     for y in [6, 16, 26]:
         rect(s, P['BLACK'], (2, y, 28, 2))
         for x in range(4, 28, 4):
-            if random.random() > 0.3:
-                rect(s, random.choice([P['RED'], P['BLUE'], P['WHITE']]), (x, y-4, 3, 4))
+            if _rng.random() > 0.3:
+                rect(s, _rng.choice([P['RED'], P['BLUE'], P['WHITE']]), (x, y-4, 3, 4))
 
 def draw_21014(s):
     draw_pro_noise(s, P['STONE_SHADOW'], 40)
@@ -425,7 +423,7 @@ def draw_40102(s):
 def draw_40103(s):
     fill(s, (200, 200, 200, 80))
     for _ in range(3):
-        circle(s, (255, 255, 255, 40), (random.randint(8, 24), random.randint(8, 24)), 8)
+        circle(s, (255, 255, 255, 40), (_rng.randint(8, 24), _rng.randint(8, 24)), 8)
 
 def draw_40104(s):
     fill(s, (0, 0, 0, 0))
@@ -448,7 +446,7 @@ def draw_40002(s): draw_flower(s, P['YELLOW'])
 def draw_40003(s):
     fill(s, (0, 0, 0, 0))
     for _ in range(3):
-        line(s, P['GREEN'], (16, 31), (random.randint(10, 22), 10), 2)
+        line(s, P['GREEN'], (16, 31), (_rng.randint(10, 22), 10), 2)
 
 def draw_40004(s):
     fill(s, (0, 0, 0, 0))
@@ -571,12 +569,12 @@ def draw_51008(s):
 def draw_51301(s):
     draw_pro_noise(s, P['STONE_SHADOW'], 20)
     for _ in range(4):
-        circle(s, P['METAL_LIGHT'], (random.randint(8, 24), random.randint(8, 24)), 4)
+        circle(s, P['METAL_LIGHT'], (_rng.randint(8, 24), _rng.randint(8, 24)), 4)
 
 def draw_51302(s):
     fill(s, (0, 0, 0, 0))
     for _ in range(6):
-        pts_list = [(random.randint(0, 31), random.randint(0, 31)) for _ in range(3)]
+        pts_list = [(_rng.randint(0, 31), _rng.randint(0, 31)) for _ in range(3)]
         poly(s, P['GREY_M'], pts_list)
 
 def draw_51303(s):
@@ -641,7 +639,7 @@ def draw_61005(s):
 def draw_60001(s):
     fill(s, (0, 0, 0, 0))
     for _ in range(5):
-        circle(s, (100, 50, 200, 100), (16, 16), random.randint(5, 15))
+        circle(s, (100, 50, 200, 100), (16, 16), _rng.randint(5, 15))
 
 def draw_60002(s):
     fill(s, (0, 0, 0, 0))